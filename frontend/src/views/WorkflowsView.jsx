@@ -131,6 +131,7 @@ export default function WorkflowsView({ api, paths, configPath }) {
         </p>
 
         <div className="actions wrap">
+          <button className="btn" disabled={busy} onClick={() => call('/api/v1/workflows/quick-check', { ...basePayload, tier: 1 })}>Quick Check</button>
           <button className="btn" disabled={busy} onClick={() => call('/api/v1/workflows/validate', basePayload)}>Validate</button>
           <button
             className="btn"
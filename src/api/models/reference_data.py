@@ -21,6 +21,7 @@ class UpsertRowRequest(BaseModel):
     path: str
     key_column: str
     row: Dict
+    strict: bool = False
     config_path: Optional[str] = None
 
 
@@ -37,6 +38,8 @@ class RowMutationResponse(BaseModel):
     key: Optional[str] = None
     deleted: Optional[int] = None
     count: Optional[int] = None
+    errors: List[str] = Field(default_factory=list)
+    warnings: List[str] = Field(default_factory=list)
 
 
 class ValuesResponse(BaseModel):
@@ -20,6 +20,29 @@ class ValidateResponse(BaseModel):
     average_size: float
 
 
+class QuickCheckRequest(BaseModel):
+    tier: int = Field(0, ge=0, le=2)
+    ideas_path: Optional[str] = None
+    ra_weights_path: Optional[str] = None
+    rs_weights_path: Optional[str] = None
+    bg_rs_weights_path: Optional[str] = None
+    config_path: Optional[str] = None
+
+
+class FileCheckResult(BaseModel):
+    is_valid: bool
+    errors: List[str] = Field(default_factory=list)
+    warnings: List[str] = Field(default_factory=list)
+
+
+class QuickCheckResponse(BaseModel):
+    tier: int
+    is_valid: bool
+    elapsed_ms: float
+    files: Dict[str, FileCheckResult] = Field(default_factory=dict)
+    summary: Optional[ValidateResponse] = None
+
+
 class PrioritizeRequest(BaseModel):
     ideas_path: str
     ra_weights_path: str
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, BackgroundTasks, Depends
 
-from ...services import DemandService
+from ...services import get_service
 from ..auth import require_role
 from ..errors import AppError
 from ..jobs import job_manager
@@ -42,7 +42,7 @@ def submit_prioritize_job(
         )
 
     def worker():
-        service = DemandService(payload.config_path)
+        service = get_service(payload.config_path)
         return service.prioritize(
             ideas=payload.ideas_path,
             ra_weights=payload.ra_weights_path,
@@ -66,7 +66,7 @@ def submit_compare_job(
     _: None = Depends(require_role("executor")),
 ):
     def worker():
-        service = DemandService(payload.config_path)
+        service = get_service(payload.config_path)
         return service.compare(
             ideas=payload.ideas_path,
             ra_weights=payload.ra_weights_path,
@@ -86,7 +86,7 @@ def submit_validate_job(
     _: None = Depends(require_role("viewer")),
 ):
     def worker():
-        service = DemandService(payload.config_path)
+        service = get_service(payload.config_path)
         return service.validate(
             ideas=payload.ideas_path,
             ra_weights=payload.ra_weights_path,
@@ -123,8 +123,10 @@ def upsert_row(
     payload: UpsertRowRequest, _: None = Depends(require_role("editor"))
 ) -> RowMutationResponse:
     try:
-        result = _service(payload.config_path).upsert_row(payload.path, payload.key_column, payload.row)
-        return RowMutationResponse(path=result["path"], action=result["action"], key=result["key"])
+        result = _service(payload.config_path).upsert_row(
+            payload.path, payload.key_column, payload.row, strict=payload.strict
+        )
+        return RowMutationResponse(**result)
     except (FileNotFoundError, ValueError) as exc:
         raise AppError(str(exc), status_code=400) from exc
 
@@ -137,9 +139,7 @@ def delete_row(
         result = _service(payload.config_path).delete_row(
             payload.path, payload.key_column, payload.key_value
         )
-        return RowMutationResponse(
-            path=result["path"], deleted=result["deleted"], key=result["key"]
-        )
+        return RowMutationResponse(**result)
     except (FileNotFoundError, ValueError) as exc:
         raise AppError(str(exc), status_code=400) from exc
 
@@ -5,7 +5,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends
 
 from ...loader import DataLoadError
-from ...services import DemandService
+from ...services import DemandService, get_service
 from ..auth import require_role
 from ..errors import AppError
 from ..models.workflows import (
@@ -15,6 +15,8 @@ from ..models.workflows import (
     PrioritizeRequest,
     PrioritizeResponse,
     PrioritizeRsRequest,
+    QuickCheckRequest,
+    QuickCheckResponse,
     ValidateRequest,
     ValidateResponse,
 )
@@ -23,7 +25,8 @@ router = APIRouter(prefix="/api/v1/workflows", tags=["workflows"])
 
 
 def _service(config_path: Optional[str]) -> DemandService:
-    return DemandService(config_path)
+    # Warm instance shared by every request using this config
+    return get_service(config_path)
 
 
 @router.post("/validate", response_model=ValidateResponse)
@@ -42,6 +45,23 @@ def validate_workflow(
         raise AppError(str(exc), status_code=400) from exc
 
 
+@router.post("/quick-check", response_model=QuickCheckResponse)
+def quick_check_workflow(
+    payload: QuickCheckRequest, _: None = Depends(require_role("viewer"))
+) -> QuickCheckResponse:
+    try:
+        result = _service(payload.config_path).quick_check(
+            tier=payload.tier,
+            ideas=payload.ideas_path,
+            ra_weights=payload.ra_weights_path,
+            rs_weights=payload.rs_weights_path,
+            bg_rs_weights=payload.bg_rs_weights_path,
+        )
+        return QuickCheckResponse(**result)
+    except (FileNotFoundError, ValueError) as exc:
+        raise AppError(str(exc), status_code=400) from exc
+
+
 @router.post("/prioritize", response_model=PrioritizeResponse)
 def prioritize_workflow(
     payload: PrioritizeRequest, _: None = Depends(require_role("executor"))
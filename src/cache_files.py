@@ -0,0 +1,75 @@
+"""
+On-disk cache files for TOM Demand Management System.
+
+The validation cache and the result cache keep their entries as pickles,
+and unpickling runs code. Both therefore create their directory private to
+the current user and only load entries from a directory and files that
+user owns and nobody else can write to.
+"""
+
+from typing import Any, Optional
+import os
+import pickle
+import tempfile
+
+
+def is_private(stat: os.stat_result) -> bool:
+    """Whether a file or directory is owned by the current user and not writable by others."""
+    if not hasattr(os, 'getuid'):
+        # No POSIX owners or mode bits to check (Windows)
+        return True
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def read_pickle(path: str, cache_dir: str) -> Optional[Any]:
+    """
+    Load a cache entry.
+
+    Args:
+        path: Entry path inside cache_dir
+        cache_dir: Cache directory
+
+    Returns:
+        The unpickled payload, or None if the entry is missing, corrupt, or
+        the directory or file is not private to the current user
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        if not is_private(os.stat(cache_dir)):
+            return None
+        with open(path, 'rb') as f:
+            # Checked on the open file, so a swapped-in path cannot slip through
+            if not is_private(os.fstat(f.fileno())):
+                return None
+            return pickle.load(f)
+    except Exception:
+        # A corrupt or incompatible entry is treated as a miss
+        return None
+
+
+def write_pickle(payload: Any, path: str, cache_dir: str) -> bool:
+    """
+    Store a cache entry atomically, creating cache_dir with mode 0700.
+
+    Args:
+        payload: Object to pickle
+        path: Entry path inside cache_dir
+        cache_dir: Cache directory
+
+    Returns:
+        True if written, False if cache_dir is not private to the current
+        user (entries there could be replaced by someone else)
+    """
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    if not is_private(os.stat(cache_dir)):
+        return False
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp_", suffix=os.path.splitext(path)[1], dir=cache_dir)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return True
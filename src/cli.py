@@ -12,6 +12,14 @@ from loader import DataLoadError
 from services import DemandService
 
 
+def _one_shot_service(config):
+    """Build the DemandService of a single CLI command."""
+    service = DemandService(config)
+    # The process ends after one run, so only runs cached on disk can be reused
+    service.result_cache_enabled = bool(service.result_cache_dir)
+    return service
+
+
 @click.group()
 @click.version_option(version='3.0.0', prog_name='TOM Demand Manager')
 def cli():
@@ -36,8 +44,12 @@ def cli():
 @click.option('--later-method', type=click.Choice(['sainte-lague', 'dhondt', 'wsjf'], case_sensitive=False), help='Prioritization method for LATER queue')
 @click.option('--include-discarded', is_flag=True, default=False, help='Export discarded IDEAs to discarded_ideas.csv')
 @click.option('--output-dir', default='./data/output', help='Output directory')
+@click.option('--output-format', 'output_formats', multiple=True, type=click.Choice(['csv', 'columnar'], case_sensitive=False), help='Output format, repeatable (default: output.formats from config)')
+@click.option('--demand-layout', type=click.Choice(['long', 'wide'], case_sensitive=False), help='Layout of demand.csv with --all-methods: one row per IDEA and method (long) or per IDEA (wide) (default: output.demand_layout from config)')
+@click.option('--delta', is_flag=True, default=False, help='Export IDEAs new, removed or moved since the previous run to demand_delta.csv')
+@click.option('--previous-dir', type=click.Path(exists=True, file_okay=False), help='Directory of the previous run for --delta (default: --output-dir)')
 @click.option('--config', type=click.Path(exists=True), help='Configuration file path')
-def prioritize(ideas, ra_weights, rs_weights, bg_rs_weights, method, all_methods, now_method, next_method, later_method, include_discarded, output_dir, config):
+def prioritize(ideas, ra_weights, rs_weights, bg_rs_weights, method, all_methods, now_method, next_method, later_method, include_discarded, output_dir, output_formats, demand_layout, delta, previous_dir, config):
     """
     Execute complete prioritization (Levels 2 and 3).
 
@@ -69,7 +81,7 @@ def prioritize(ideas, ra_weights, rs_weights, bg_rs_weights, method, all_methods
                 "cannot be used with --all-methods. Please use one or the other."
             )
 
-        service = DemandService(config)
+        service = _one_shot_service(config)
 
         click.echo("Starting queue-based prioritization process...")
 
@@ -107,6 +119,10 @@ def prioritize(ideas, ra_weights, rs_weights, bg_rs_weights, method, all_methods
             next_method=next_method,
             later_method=later_method,
             include_discarded=include_discarded,
+            output_formats=list(output_formats) or None,
+            delta=delta,
+            previous_dir=previous_dir,
+            demand_layout=demand_layout,
         )
 
         click.echo("✓ Prioritization complete")
@@ -119,6 +135,10 @@ def prioritize(ideas, ra_weights, rs_weights, bg_rs_weights, method, all_methods
         click.echo(f"  - Final generated rows: {run_result.get('generated_rows', 'N/A')}")
         click.echo(f"  - Discarded rows: {run_result.get('discarded_rows', 'N/A')}")
 
+        if run_result.get('delta'):
+            changes = run_result['delta']
+            click.echo(f"  - Since previous run: {changes['new']} new, {changes['removed']} removed, {changes['moved']} moved")
+
         discarded_reasons = run_result.get('discarded_reasons') or {}
         if discarded_reasons:
             click.echo("Discarded reasons:")
@@ -142,6 +162,9 @@ def prioritize(ideas, ra_weights, rs_weights, bg_rs_weights, method, all_methods
             click.echo()
 
         click.echo(f"Execution time: {run_result['elapsed_time']:.2f} seconds")
+        pipeline = run_result.get('pipeline')
+        if pipeline:
+            click.echo(f"Critical path: {' → '.join(pipeline['critical_path'])} ({pipeline['critical_path_seconds']:.2f} seconds)")
         click.echo()
         click.echo("=" * 60)
 
@@ -163,8 +186,9 @@ def prioritize(ideas, ra_weights, rs_weights, bg_rs_weights, method, all_methods
 @click.option('--ra-weights', required=True, type=click.Path(exists=True), help='Path to weights_ra.csv')
 @click.option('--method', default='sainte-lague', type=click.Choice(['sainte-lague', 'dhondt', 'wsjf'], case_sensitive=False), help='Prioritization method')
 @click.option('--output', required=True, help='Output file path')
+@click.option('--output-format', 'output_formats', multiple=True, type=click.Choice(['csv', 'columnar'], case_sensitive=False), help='Output format, repeatable; columnar writes a typed .parquet/.npz artifact for prioritize-global (default: output.formats from config)')
 @click.option('--config', type=click.Path(exists=True), help='Configuration file path')
-def prioritize_rs(ideas, ra_weights, method, output, config):
+def prioritize_rs(ideas, ra_weights, method, output, output_formats, config):
     """
     Execute Level 2 prioritization only (by Revenue Stream).
     """
@@ -172,7 +196,13 @@ def prioritize_rs(ideas, ra_weights, method, output, config):
         click.echo("Executing Level 2 prioritization...")
 
         service = DemandService(config)
-        service.prioritize_rs(ideas=ideas, ra_weights=ra_weights, method=method, output=output)
+        service.prioritize_rs(
+            ideas=ideas,
+            ra_weights=ra_weights,
+            method=method,
+            output=output,
+            output_formats=list(output_formats) or None,
+        )
 
         click.echo("✓ Level 2 prioritization complete")
 
@@ -182,7 +212,7 @@ def prioritize_rs(ideas, ra_weights, method, output, config):
 
 
 @cli.command()
-@click.option('--rs-prioritized', required=True, type=click.Path(exists=True), help='Path to prioritization_rs.csv')
+@click.option('--rs-prioritized', required=True, type=click.Path(exists=True), help='Path to prioritization_rs.csv (its .parquet/.npz artifact is used when up to date)')
 @click.option('--rs-weights', required=True, type=click.Path(exists=True), help='Path to weights_rs.csv')
 @click.option('--method', default='sainte-lague', type=click.Choice(['sainte-lague', 'dhondt', 'wsjf'], case_sensitive=False), help='Prioritization method')
 @click.option('--output', required=True, help='Output file path')
@@ -227,7 +257,7 @@ def compare(ideas, ra_weights, rs_weights, bg_rs_weights, output, top_n, config)
     try:
         click.echo("Comparing all 3 prioritization methods...")
 
-        service = DemandService(config)
+        service = _one_shot_service(config)
         result = service.compare(
             ideas=ideas,
             ra_weights=ra_weights,
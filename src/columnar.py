@@ -0,0 +1,189 @@
+"""
+Binary columnar output for TOM Demand Management System.
+
+Level 2 and Level 3 results can be written next to their CSV files in a
+binary columnar format, so downstream readers skip CSV parsing. Parquet is
+used when pyarrow is installed; otherwise results are stored as a NumPy
+``.npz`` archive with text columns dictionary-encoded (int32 codes plus the
+distinct values).
+"""
+
+from typing import Callable, Dict, List, Optional
+import json
+import os
+import zipfile
+import numpy as np
+import pandas as pd
+try:
+    from .compression import SUFFIXES as COMPRESSED_SUFFIXES
+except ImportError:
+    from compression import SUFFIXES as COMPRESSED_SUFFIXES
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+PARQUET_SUFFIX = '.parquet'
+NPZ_SUFFIX = '.npz'
+
+# Bump when the .npz layout changes
+NPZ_FORMAT_VERSION = 1
+
+
+def columnar_suffix() -> str:
+    """Return the suffix of the columnar format written in this environment."""
+    return PARQUET_SUFFIX if PARQUET_AVAILABLE else NPZ_SUFFIX
+
+
+def _csv_variants(path: str) -> List[str]:
+    """
+    Return the CSV paths an output can have, plain first.
+
+    demand.csv, demand.csv.gz and demand.csv.zst all give
+    [demand.csv, demand.csv.gz, demand.csv.zst]; a path without a .csv
+    suffix is its only variant.
+    """
+    lowered = path.lower()
+    for suffix in ('', *COMPRESSED_SUFFIXES.values()):
+        if lowered.endswith('.csv' + suffix):
+            plain = path[:len(path) - len(suffix)] if suffix else path
+            return [plain] + [plain + s for s in COMPRESSED_SUFFIXES.values()]
+    return [path]
+
+
+def _artifact_base(path: str) -> str:
+    """Strip the whole .csv[.gz|.zst] suffix from a CSV path."""
+    plain = _csv_variants(path)[0]
+    return plain[:-len('.csv')] if plain.lower().endswith('.csv') else plain
+
+
+def columnar_path(csv_path: str) -> str:
+    """
+    Return the columnar artifact path that sits next to a CSV output.
+
+    Args:
+        csv_path: CSV output path, compressed or not (e.g. demand.csv.gz)
+
+    Returns:
+        Same path with the .csv[.gz|.zst] suffix replaced (e.g. demand.npz)
+    """
+    return _artifact_base(csv_path) + columnar_suffix()
+
+
+def find_columnar(path: str) -> Optional[str]:
+    """
+    Find an up-to-date columnar artifact for a CSV path.
+
+    An artifact counts as up to date unless a CSV variant of the output
+    (plain, .gz or .zst - whichever exist) was modified after it, so a CSV
+    edited or re-exported by hand is never shadowed by a stale binary file.
+
+    Args:
+        path: CSV path (compressed or not), or a columnar artifact path
+
+    Returns:
+        Path of the artifact to read, or None to read the CSV
+    """
+    if path.endswith((PARQUET_SUFFIX, NPZ_SUFFIX)):
+        return path if os.path.exists(path) else None
+
+    base = _artifact_base(path)
+    csv_mtimes = [os.path.getmtime(p) for p in _csv_variants(path) if os.path.exists(p)]
+    suffixes = [PARQUET_SUFFIX, NPZ_SUFFIX] if PARQUET_AVAILABLE else [NPZ_SUFFIX]
+    for suffix in suffixes:
+        candidate = base + suffix
+        if not os.path.exists(candidate):
+            continue
+        if csv_mtimes and max(csv_mtimes) > os.path.getmtime(candidate):
+            continue
+        return candidate
+    return None
+
+
+def write_columnar(df: pd.DataFrame, write_file: Callable[[str, Callable], None], path: str) -> None:
+    """
+    Write a DataFrame in the columnar format matching the path's suffix.
+
+    Args:
+        df: DataFrame to write (the index is not written)
+        write_file: Atomic writer taking (path, callable receiving a binary file)
+        path: Destination path ending in .parquet or .npz
+    """
+    if path.endswith(PARQUET_SUFFIX):
+        write_file(path, lambda f: df.to_parquet(f, index=False))
+        return
+
+    arrays: Dict[str, np.ndarray] = {}
+    columns: List[Dict] = []
+    for i, name in enumerate(df.columns):
+        series = df.iloc[:, i]
+        key = f'c{i}'
+        if pd.api.types.is_numeric_dtype(series.dtype) and isinstance(series.dtype, np.dtype):
+            arrays[key] = series.to_numpy()
+            columns.append({'name': str(name), 'encoding': 'plain'})
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            # Nullable extension types (Int64, Float64, boolean): values plus a missing mask
+            mask = series.isna().to_numpy()
+            numpy_dtype = series.dtype.numpy_dtype
+            arrays[key] = series.to_numpy(dtype=numpy_dtype, na_value=numpy_dtype.type(0))
+            arrays[f'{key}_mask'] = mask
+            columns.append({'name': str(name), 'encoding': 'masked', 'dtype': str(series.dtype)})
+        else:
+            codes, uniques = pd.factorize(series)
+            arrays[key] = codes.astype(np.int32)
+            arrays[f'{key}_values'] = np.asarray([str(v) for v in uniques], dtype=str)
+            columns.append({'name': str(name), 'encoding': 'dictionary'})
+
+    meta = {'version': NPZ_FORMAT_VERSION, 'rows': len(df), 'columns': columns}
+    arrays['__meta__'] = np.asarray(json.dumps(meta))
+    write_file(path, lambda f: _write_npz(f, arrays))
+
+
+def _write_npz(f, arrays: Dict[str, np.ndarray]) -> None:
+    """Write arrays like np.savez, with fixed entry timestamps so equal data gives equal bytes."""
+    with zipfile.ZipFile(f, mode='w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for key, array in arrays.items():
+            info = zipfile.ZipInfo(f'{key}.npy', date_time=(1980, 1, 1, 0, 0, 0))
+            with archive.open(info, mode='w', force_zip64=True) as entry:
+                np.lib.format.write_array(entry, np.asanyarray(array), allow_pickle=False)
+
+
+def read_columnar(path: str) -> pd.DataFrame:
+    """
+    Read a DataFrame written by write_columnar.
+
+    Args:
+        path: Path ending in .parquet or .npz
+
+    Returns:
+        DataFrame with the written columns; dictionary-encoded columns are
+        returned as text with missing values as NaN
+
+    Raises:
+        ValueError: If the .npz archive has an unknown layout
+    """
+    if path.endswith(PARQUET_SUFFIX):
+        return pd.read_parquet(path)
+
+    with np.load(path, allow_pickle=False) as archive:
+        meta = json.loads(str(archive['__meta__']))
+        if meta.get('version') != NPZ_FORMAT_VERSION:
+            raise ValueError(f"Unsupported columnar file version in {path}: {meta.get('version')}")
+        data = {}
+        for i, column in enumerate(meta['columns']):
+            key = f'c{i}'
+            if column['encoding'] == 'dictionary':
+                codes = archive[key]
+                values = np.append(archive[f'{key}_values'].astype(object), np.nan)
+                data[column['name']] = pd.Series(values[codes], dtype='str')
+            elif column['encoding'] == 'masked':
+                data[column['name']] = pd.Series(archive[key], dtype=column['dtype']).mask(archive[f'{key}_mask'])
+            else:
+                data[column['name']] = archive[key]
+    # The arrays were just read from the archive and are not shared, so the
+    # frame can wrap them without copying
+    return pd.DataFrame(data, copy=False)
+
@@ -0,0 +1,105 @@
+"""
+Compressed file support for TOM Demand Management System.
+
+Output CSVs can be written gzip- or zstd-compressed (zstd needs the optional
+``zstandard`` package), and compressed input files are recognised by their
+magic bytes so the loader reads them whatever their file name.
+"""
+
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional
+import gzip
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+CODECS = ('gzip', 'zstd')
+SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+DEFAULT_LEVELS = {'gzip': 6, 'zstd': 3}
+LEVEL_RANGES = {'gzip': (0, 9), 'zstd': (1, 22)}
+
+_MAGIC = {
+    b'\x1f\x8b': 'gzip',
+    b'\x28\xb5\x2f\xfd': 'zstd',
+}
+
+
+def resolve_codec(codec: Optional[str], level: Optional[int] = None) -> Optional[tuple]:
+    """
+    Validate a compression setting.
+
+    Args:
+        codec: 'gzip', 'zstd', or None/'none' for uncompressed output
+        level: Compression level; None uses the codec default
+
+    Returns:
+        (codec, level) tuple, or None for uncompressed output
+
+    Raises:
+        ValueError: If the codec or level is invalid, or zstd is unavailable
+    """
+    if codec is None or str(codec).lower() in ('', 'none'):
+        return None
+    codec = str(codec).lower()
+    if codec not in CODECS:
+        raise ValueError(f"Unknown compression '{codec}'. Valid values: none, {', '.join(CODECS)}")
+    if codec == 'zstd' and zstandard is None:
+        raise ValueError("zstd compression requires the 'zstandard' package")
+
+    level = DEFAULT_LEVELS[codec] if level is None else int(level)
+    low, high = LEVEL_RANGES[codec]
+    if not low <= level <= high:
+        raise ValueError(f"{codec} compression level must be between {low} and {high}, got {level}")
+    return codec, level
+
+
+def compressed_path(path: str, codec: Optional[str]) -> str:
+    """Return the output path for a codec (e.g. demand.csv -> demand.csv.gz)."""
+    return path + SUFFIXES[codec] if codec else path
+
+
+def detect_compression(path: str) -> Optional[str]:
+    """
+    Detect a compressed file from its first bytes.
+
+    Args:
+        path: File path
+
+    Returns:
+        'gzip', 'zstd', or None for an uncompressed (or unreadable) file
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(4)
+    except OSError:
+        return None
+    for magic, codec in _MAGIC.items():
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+@contextmanager
+def compressing_writer(f: BinaryIO, codec: str, level: int) -> Iterator[BinaryIO]:
+    """
+    Wrap an open binary file so that everything written to it is compressed.
+
+    Data is compressed as it is written, so callers can stream output in
+    blocks. gzip headers carry no timestamp or file name, so identical
+    content always produces identical bytes.
+
+    Args:
+        f: Open binary file (left open)
+        codec: 'gzip' or 'zstd'
+        level: Compression level
+    """
+    if codec == 'gzip':
+        with gzip.GzipFile(filename='', mode='wb', fileobj=f, compresslevel=level, mtime=0) as stream:
+            yield stream
+    else:
+        compressor = zstandard.ZstdCompressor(level=level)
+        with compressor.stream_writer(f, closefd=False) as stream:
+            yield stream
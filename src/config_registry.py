@@ -0,0 +1,137 @@
+"""
+Configuration registry for TOM Demand Management System.
+
+This module parses each config.yaml once per process and hands out an
+immutable compiled configuration shared by Loader, Validator, Prioritizer,
+Exporter and the service layer. Entries are re-parsed when the file's
+modification time or size changes.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
+import os
+import threading
+import yaml
+
+
+DEFAULT_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'config.yaml'
+)
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledConfig:
+    """
+    Parsed, read-only configuration with precomputed lookup structures.
+
+    Instances compare and hash by identity, so per-config artifacts (e.g.
+    validation plans) can be memoized on them.
+    """
+    path: str
+    mtime_ns: int
+    size: int
+    raw: Mapping[str, Any]
+    revenue_streams: Tuple[str, ...]
+    budget_groups: Tuple[str, ...]
+    valid_micro_phases: Tuple[str, ...]
+    revenue_stream_set: FrozenSet[str]
+    budget_group_set: FrozenSet[str]
+    valid_micro_phase_set: FrozenSet[str]
+    queue_by_phase: Mapping[str, str]
+
+    def queue_for_phase(self, micro_phase: str) -> str:
+        """Return the queue owning a MicroPhase, or 'UNKNOWN'."""
+        return self.queue_by_phase.get(micro_phase, 'UNKNOWN')
+
+
+def compile_config(path: str) -> CompiledConfig:
+    """
+    Parse a config.yaml file into a CompiledConfig.
+
+    Args:
+        path: Path to config.yaml
+
+    Returns:
+        CompiledConfig for the file's current contents
+    """
+    stat = os.stat(path)
+    with open(path, 'r') as f:
+        raw = yaml.safe_load(f) or {}
+
+    revenue_streams = tuple(raw.get('revenue_streams') or [])
+    budget_groups = tuple(raw.get('budget_groups') or [])
+    valid_micro_phases = tuple((raw.get('validation') or {}).get('valid_micro_phases') or [])
+
+    # First queue (in config order) listing a phase owns it
+    queue_by_phase: Dict[str, str] = {}
+    for queue_name, queue_config in (raw.get('queues') or {}).items():
+        for phase in (queue_config or {}).get('micro_phases') or []:
+            queue_by_phase.setdefault(phase, queue_name)
+
+    return CompiledConfig(
+        path=path,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        raw=_freeze(raw),
+        revenue_streams=revenue_streams,
+        budget_groups=budget_groups,
+        valid_micro_phases=valid_micro_phases,
+        revenue_stream_set=frozenset(revenue_streams),
+        budget_group_set=frozenset(budget_groups),
+        valid_micro_phase_set=frozenset(valid_micro_phases),
+        queue_by_phase=MappingProxyType(queue_by_phase),
+    )
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class ConfigRegistry:
+    """Thread-safe, process-wide cache of compiled configurations keyed by path."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, CompiledConfig] = {}
+        self._lock = threading.Lock()
+
+    def get(self, config_path: Optional[str] = None) -> CompiledConfig:
+        """
+        Return the compiled configuration for a path, parsing it if needed.
+
+        Args:
+            config_path: Path to config.yaml. If None, uses default config.
+
+        Returns:
+            CompiledConfig, re-parsed if the file changed since it was cached
+        """
+        path = os.path.abspath(config_path or DEFAULT_CONFIG_PATH)
+        stat = os.stat(path)
+
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+            return entry
+
+        entry = compile_config(path)
+        with self._lock:
+            self._entries[path] = entry
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cached configuration."""
+        with self._lock:
+            self._entries.clear()
+
+
+config_registry = ConfigRegistry()
+
+
+def get_config(config_path: Optional[str] = None) -> CompiledConfig:
+    """Return the shared compiled configuration for a config.yaml path."""
+    return config_registry.get(config_path)
@@ -4,33 +4,64 @@ Export module for TOM Demand Management System.
 This module provides functions to export results to CSV files and metadata to JSON.
 """
 
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+import numpy as np
 import pandas as pd
+import io
 import json
 import os
+import re
+import tempfile
 from datetime import datetime
-import yaml
+try:
+    from .columnar import columnar_path, write_columnar
+    from .compression import compressed_path, compressing_writer, resolve_codec
+    from .config_registry import CompiledConfig, get_config
+    from .fingerprint import digest_file
+    from .output_manifest import NEW_FILE_MODE, OutputManifest
+    from .schema import apply_export_schema
+except ImportError:
+    from columnar import columnar_path, write_columnar
+    from compression import compressed_path, compressing_writer, resolve_codec
+    from config_registry import CompiledConfig, get_config
+    from fingerprint import digest_file
+    from output_manifest import NEW_FILE_MODE, OutputManifest
+    from schema import apply_export_schema
 
 
 class Exporter:
     """Export prioritization results to CSV and metadata to JSON."""
 
-    def __init__(self, config_path: Optional[str] = None):
+    # Rows joined into a single write() by write_european_csv
+    CSV_BLOCK_ROWS = 50_000
+
+    # Values accepted in output.formats
+    OUTPUT_FORMATS = ('csv', 'columnar')
+
+    # Values accepted in output.demand_layout
+    DEMAND_LAYOUTS = ('long', 'wide')
+
+    def __init__(self, config_path: Optional[str] = None, config: Optional[CompiledConfig] = None):
         """
         Initialize exporter with configuration.
 
         Args:
             config_path: Path to config.yaml file. If None, uses default config.
+            config: Compiled configuration to use instead of looking up config_path
         """
-        if config_path is None:
-            # Use default config path
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            config_path = os.path.join(base_dir, 'config', 'config.yaml')
-
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.compiled_config = config or get_config(config_path)
+        self.config = self.compiled_config.raw
 
         self.output_config = self.config['output']
+        self.output_formats = self._resolve_formats(self.output_config.get('formats'))
+        # Layout of the combined demand.csv in multi-method runs
+        self.demand_layout = self._resolve_layout(self.output_config.get('demand_layout'))
+        # Optional (codec, level) for CSV output, e.g. demand.csv.gz
+        self.compression = resolve_codec(
+            self.output_config.get('compression'), self.output_config.get('compression_level')
+        )
 
         # Get locale settings for European CSV format
         self.locale = self.config.get('locale', {})
@@ -38,11 +69,22 @@ class Exporter:
         self.decimal_separator = self.locale.get('decimal_separator', ',')
         self.csv_encoding = self.locale.get('csv_encoding', 'utf-8-sig')
 
+        # Bounded pool used by export_all to write independent files concurrently
+        performance = self.config.get('performance', {})
+        self.export_workers = max(1, int(performance.get('export_workers', 4)))
+
+        # Stream per-method Level 2 and Level 3 files in CSV_BLOCK_ROWS chunks
+        self.streaming = bool(self.output_config.get('streaming', False))
+
+        # Keep files whose content is unchanged (see output_manifest.py)
+        self.skip_unchanged = bool(self.output_config.get('skip_unchanged', True))
+
     def export_rs_prioritization(
         self,
         data: pd.DataFrame,
         filepath: str,
-        metadata: Optional[Dict] = None
+        metadata: Optional[Dict] = None,
+        formats: Optional[List[str]] = None
     ) -> None:
         """
         Export Level 2 prioritization to CSV.
@@ -51,7 +93,15 @@ class Exporter:
             data: DataFrame with RS-level prioritization
             filepath: Output file path
             metadata: Optional metadata to include
+            formats: Output formats ('csv', 'columnar'); defaults to output.formats
         """
+        formats = self._resolve_formats(formats) if formats else self.output_formats
+        manifest = self._open_manifest(filepath)
+        paths = self._write_result(self._rs_prioritization_frame(data), filepath, formats, manifest)
+        self._report(paths, self._commit_manifest(manifest))
+
+    def _rs_prioritization_columns(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Select and round the Level 2 output columns."""
         # Select and order columns for output
         output_columns = [
             'Queue', 'RevenueStream', 'Method', 'Rank_RS', 'ID', 'Name',
@@ -62,28 +112,24 @@ class Exporter:
         # Only include columns that exist
         available_columns = [col for col in output_columns if col in data.columns]
 
-        output_df = data[available_columns].copy()
+        output_df = apply_export_schema(data[available_columns].copy())
 
         # Round decimal values
         precision = self.output_config['decimal_precision']
         if 'WSJF_Score' in output_df.columns:
             output_df['WSJF_Score'] = output_df['WSJF_Score'].round(precision)
+        return output_df
 
-        # Sort by RevenueStream and Rank
-        output_df.sort_values(['RevenueStream', 'Method', 'Rank_RS'], inplace=True)
+    # Level 2 output order
+    RS_SORT_COLUMNS = ['RevenueStream', 'Method', 'Rank_RS']
 
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-        # Export to CSV with European format
-        output_df.to_csv(
-            filepath,
-            index=False,
-            sep=self.csv_delimiter,
-            decimal=self.decimal_separator,
-            encoding=self.csv_encoding,
-        )
-        print(f"    ✓ Exported to {filepath}")
+    def _rs_prioritization_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Select, round and sort the Level 2 output columns."""
+        output_df = self._rs_prioritization_columns(data)
+
+        # Sort by RevenueStream and Rank
+        output_df.sort_values(self.RS_SORT_COLUMNS, inplace=True)
+        return output_df
 
     def export_demand(
         self,
@@ -99,6 +145,51 @@ class Exporter:
             filepath: Output file path
             metadata: Optional metadata to include
         """
+        manifest = self._open_manifest(filepath)
+        paths = self._write_result(self._demand_frame(data), filepath, self.output_formats, manifest)
+        self._report(paths, self._commit_manifest(manifest))
+
+    def export_demand_stream(self, blocks: Iterable[pd.DataFrame], filepath: str) -> str:
+        """
+        Export Level 3 results that are already in output order, block by block.
+
+        Nothing is sorted or copied as a whole: each block's columns are
+        selected, rounded and written in CSV_BLOCK_ROWS chunks, so memory use
+        does not grow with the result. Only CSV output is written.
+
+        Args:
+            blocks: DataFrames in the order their rows should appear (e.g.
+                per-queue results, or slices of a ranked result)
+            filepath: Output file path
+
+        Returns:
+            Path written
+        """
+        manifest = self._open_manifest(filepath)
+        path = self._write_csv_stream_atomic(map(self._demand_columns, blocks), filepath, manifest)
+        self._report([path], self._commit_manifest(manifest))
+        return path
+
+    @classmethod
+    def row_blocks(cls, data: pd.DataFrame) -> Iterator[pd.DataFrame]:
+        """Yield consecutive CSV_BLOCK_ROWS-row slices of a frame without copying it."""
+        for start in range(0, len(data), cls.CSV_BLOCK_ROWS):
+            yield data.iloc[start:start + cls.CSV_BLOCK_ROWS]
+
+    @classmethod
+    def sorted_row_blocks(cls, data: pd.DataFrame, by: List[str]) -> Iterator[pd.DataFrame]:
+        """
+        Yield CSV_BLOCK_ROWS-row blocks of a frame in sort_values(by) order.
+
+        Only the key columns are sorted; each block's rows are then gathered
+        from the frame, so no sorted copy of the whole frame is made.
+        """
+        order = data[by].reset_index(drop=True).sort_values(by).index.to_numpy()
+        for start in range(0, len(order), cls.CSV_BLOCK_ROWS):
+            yield data.take(order[start:start + cls.CSV_BLOCK_ROWS])
+
+    def _demand_columns(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Select and round the Level 3 output columns."""
         # Select and order columns for output
         output_columns = [
             'Queue', 'Method', 'GlobalRank', 'ID', 'Name',
@@ -110,12 +201,17 @@ class Exporter:
         # Only include columns that exist
         available_columns = [col for col in output_columns if col in data.columns]
 
-        output_df = data[available_columns].copy()
+        output_df = apply_export_schema(data[available_columns].copy())
 
         # Round decimal values
         precision = self.output_config['decimal_precision']
         if 'WSJF_Score' in output_df.columns:
             output_df['WSJF_Score'] = output_df['WSJF_Score'].round(precision)
+        return output_df
+
+    def _demand_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Select, round and sort the Level 3 output columns."""
+        output_df = self._demand_columns(data)
 
         # Sort by Queue order (NOW, NEXT, PRODUCTION) then Method and GlobalRank
         if 'Queue' in output_df.columns:
@@ -130,19 +226,7 @@ class Exporter:
         else:
             # Fallback to original sorting
             output_df.sort_values(['Method', 'GlobalRank'], inplace=True)
-
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-        # Export to CSV with European format
-        output_df.to_csv(
-            filepath,
-            index=False,
-            sep=self.csv_delimiter,
-            decimal=self.decimal_separator,
-            encoding=self.csv_encoding,
-        )
-        print(f"    ✓ Exported to {filepath}")
+        return output_df
 
     def export_comparison_report(
         self,
@@ -156,23 +240,15 @@ class Exporter:
             data: DataFrame with comparison results
             filepath: Output file path
         """
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
         # Round decimal values
         precision = self.output_config['decimal_precision']
         numeric_columns = data.select_dtypes(include=['float64']).columns
         for col in numeric_columns:
             data[col] = data[col].round(precision)
 
-        # Export to CSV with European format
-        data.to_csv(
-            filepath,
-            index=False,
-            sep=self.csv_delimiter,
-            decimal=self.decimal_separator,
-            encoding=self.csv_encoding,
-        )
+        manifest = self._open_manifest(filepath)
+        filepath = self._write_csv_atomic(data, filepath, manifest)
+        self._commit_manifest(manifest)
         print(f"    ✓ Comparison report exported to {filepath}")
 
     def export_metadata(
@@ -193,66 +269,219 @@ class Exporter:
             **execution_params
         }
 
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-        # Export to JSON
-        with open(filepath, 'w') as f:
+        def write(f):
             json.dump(metadata, f, indent=2)
 
+        # The timestamp makes every metadata.json new, so it is not tracked
+        self._write_atomic(filepath, write, mode='w')
+
         print(f"    ✓ Metadata exported to {filepath}")
 
     def export_all(
         self,
         results: Dict[str, Dict[str, pd.DataFrame]],
         output_dir: str,
-        execution_params: Optional[Dict] = None
+        execution_params: Optional[Dict] = None,
+        formats: Optional[List[str]] = None,
+        layout: Optional[str] = None,
+        combined: Optional[pd.DataFrame] = None,
+        discarded: Optional[pd.DataFrame] = None,
+        delta: Optional[pd.DataFrame] = None,
     ) -> None:
         """
         Export all results (Level 2, Level 3, comparison, metadata).
 
+        Every file of the run goes through one output manifest, so the
+        'artifacts' recorded in metadata.json list all of them.
+
         Args:
             results: Dictionary with results from all methods
             output_dir: Output directory path
             execution_params: Optional execution parameters for metadata
+            formats: Output formats ('csv', 'columnar'); defaults to output.formats
+            layout: Layout of demand.csv when several methods ran ('long' or
+                'wide'); defaults to output.demand_layout
+            combined: Every method's Level 3 rows combined, as a run already
+                holds them (PrioritizationRun.final); concatenated from
+                results when omitted
+            discarded: Discarded IDEAs to also write to discarded_ideas.csv
+            delta: Changes against the previous run (see delta_frame) to
+                also write to demand_delta.csv
         """
+        formats = self._resolve_formats(formats) if formats else self.output_formats
+        layout = self._resolve_layout(layout) if layout else self.demand_layout
         print("\nExporting results...")
 
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
 
-        # Export each method's results
-        for method, method_results in results.items():
-            method_name = method.replace('-', '_')
+        # Every file is independent: each job writes one result and returns its paths
+        jobs: List[Callable[[], List[str]]] = []
+        manifest = self._open_manifest(os.path.join(output_dir, 'demand.csv'))
 
-            # Export Level 2
-            level2_path = os.path.join(output_dir, f'prioritization_rs_{method_name}.csv')
-            self.export_rs_prioritization(method_results['level2'], level2_path)
+        def frame_job(path: str, build: Callable[[], pd.DataFrame]) -> Callable[[], List[str]]:
+            return lambda: self._write_result(build(), path, formats, manifest)
 
-            # Export Level 3
-            level3_path = os.path.join(output_dir, f'demand_{method_name}.csv')
-            self.export_demand(method_results['level3'], level3_path)
-
-        # Export combined demand file with all methods
-        all_demand = []
         for method, method_results in results.items():
-            all_demand.append(method_results['level3'])
-
-        combined_demand = pd.concat(all_demand, ignore_index=True)
-        
-        combined_demand = combined_demand.sort_values(['GlobalRank', 'Queue'], ascending=True, na_position='last', ignore_index=True)
-        #print(combined_demand.head(10))
-
-        combined_path = os.path.join(output_dir, 'demand.csv')
-        self.export_demand(combined_demand, combined_path)
+            method_name = method.replace('-', '_')
+            level2, level3 = method_results['level2'], method_results['level3']
+
+            # Level 2 and Level 3
+            rs_path = os.path.join(output_dir, f'prioritization_rs_{method_name}.csv')
+            demand_path = os.path.join(output_dir, f'demand_{method_name}.csv')
+            if self.streaming and formats == ['csv']:
+                # Level 2 blocks are gathered in output order from its sort keys
+                jobs.append(lambda path=rs_path, level2=level2: [self._write_csv_stream_atomic(
+                    map(self._rs_prioritization_columns, self.sorted_row_blocks(level2, self.RS_SORT_COLUMNS)),
+                    path,
+                    manifest,
+                )])
+                # Ranked results are already in GlobalRank order: write them in blocks as they are
+                jobs.append(lambda path=demand_path, level3=level3: [
+                    self._write_csv_stream_atomic(map(self._demand_columns, self.row_blocks(level3)), path, manifest)
+                ])
+            else:
+                jobs.append(frame_job(rs_path, lambda level2=level2: self._rs_prioritization_frame(level2)))
+                jobs.append(frame_job(demand_path, lambda level3=level3: self._demand_frame(level3)))
+
+        # Combined demand file with all methods
+        if layout == 'wide' and len(results) > 1:
+            build_demand = lambda: self._wide_demand_frame(results)
+        else:
+            if combined is None:
+                combined = pd.concat([method_results['level3'] for method_results in results.values()], ignore_index=True)
+            build_demand = lambda: self._demand_frame(combined)
+        jobs.append(frame_job(os.path.join(output_dir, 'demand.csv'), build_demand))
+
+        # Run outputs that are CSV only
+        if discarded is not None:
+            jobs.append(lambda: [self._write_csv_atomic(
+                self._discarded_frame(discarded), os.path.join(output_dir, 'discarded_ideas.csv'), manifest
+            )])
+        if delta is not None:
+            jobs.append(lambda: [self._write_csv_atomic(delta, os.path.join(output_dir, 'demand_delta.csv'), manifest)])
+
+        # Paths are reported in a fixed order whatever order the writes finish in
+        if self.export_workers > 1 and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.export_workers, len(jobs))) as pool:
+                written = list(pool.map(lambda job: job(), jobs))
+        else:
+            written = [job() for job in jobs]
+        artifacts = self._commit_manifest(manifest)
+        self._report([path for paths in written for path in paths], artifacts)
 
         # Export metadata if parameters provided
         if execution_params and self.output_config['include_metadata']:
             metadata_path = os.path.join(output_dir, 'metadata.json')
+            if artifacts is not None:
+                execution_params = {**execution_params, 'artifacts': artifacts}
             self.export_metadata(execution_params, metadata_path)
 
         print("✓ All results exported successfully\n")
 
+    def _wide_demand_frame(self, results: Dict[str, Dict[str, pd.DataFrame]]) -> pd.DataFrame:
+        """
+        Build demand.csv with one row per IDEA and one GlobalRank column per method.
+
+        IDEA details are taken from the first method that ranked the IDEA and
+        joined to the pivoted ranks with a single merge. Rows are ordered by
+        the first method's GlobalRank, unranked (PRODUCTION) IDEAs last.
+
+        Args:
+            results: Dictionary with results from all methods
+
+        Returns:
+            DataFrame with the IDEA columns followed by GlobalRank_<method>
+        """
+        detail_columns = [
+            'Queue', 'ID', 'Name', 'RequestingArea', 'RevenueStream', 'BudgetGroup',
+            'MicroPhase', 'PriorityRA', 'WSJF_Score', 'Value', 'Urgency', 'Risk', 'Size'
+        ]
+        rank_columns = [f"GlobalRank_{method.replace('-', '_')}" for method in results]
+
+        frames = []
+        for rank_column, method_results in zip(rank_columns, results.values()):
+            level3 = method_results['level3']
+            frames.append(level3[[col for col in detail_columns if col in level3.columns] + ['GlobalRank']]
+                          .assign(_rank_column=rank_column))
+        stacked = pd.concat(frames, ignore_index=True)
+
+        ranks = stacked.pivot_table(
+            index='ID', columns='_rank_column', values='GlobalRank', aggfunc='first', dropna=False, sort=False
+        ).reindex(columns=rank_columns)
+        ranks.columns.name = None
+        details = stacked.drop(columns=['GlobalRank', '_rank_column']).drop_duplicates('ID')
+        output_df = apply_export_schema(details.merge(ranks, left_on='ID', right_index=True, how='left'))
+
+        precision = self.output_config['decimal_precision']
+        if 'WSJF_Score' in output_df.columns:
+            output_df['WSJF_Score'] = output_df['WSJF_Score'].round(precision)
+
+        return output_df.sort_values(rank_columns[0], na_position='last', kind='stable', ignore_index=True)
+
+    # Row kinds in demand_delta.csv
+    DELTA_CHANGES = ('new', 'removed', 'moved')
+
+    @staticmethod
+    def delta_frame(previous: pd.DataFrame, current: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compare two runs' Level 3 results by ID and Method.
+
+        Both sides are hash-joined on (ID, Method), so the cost grows linearly
+        with the number of rows. IDEAs whose GlobalRank and Queue are unchanged
+        are left out.
+
+        Args:
+            previous: Level 3 result of the previous run (demand.csv)
+            current: Level 3 result of this run
+
+        Returns:
+            DataFrame with Change ('new', 'removed' or 'moved'), Method, ID,
+            Name, old/new Queue and GlobalRank, and RankShift (positive when
+            an IDEA moved up). New and moved IDEAs come first, in current
+            order, followed by removed IDEAs in previous order.
+        """
+        keys = ['ID', 'Method']
+
+        def side(df: pd.DataFrame) -> pd.DataFrame:
+            columns = keys + [col for col in ('Name', 'Queue', 'GlobalRank') if col in df.columns]
+            frame = df[columns].astype({'ID': 'str', 'Method': 'str'})
+            for col in ('Name', 'Queue', 'GlobalRank'):
+                if col not in frame.columns:
+                    frame[col] = np.nan
+            frame['GlobalRank'] = pd.to_numeric(frame['GlobalRank'], errors='coerce').astype('float64')
+            return frame.drop_duplicates(keys)
+
+        old, new = side(previous), side(current)
+
+        joined = new.merge(old, on=keys, how='left', suffixes=('_New', '_Old'), indicator=True)
+        removed = old.merge(new[keys], on=keys, how='left', indicator=True)
+        removed = removed[removed['_merge'] == 'left_only'].rename(
+            columns={'Name': 'Name_Old', 'Queue': 'Queue_Old', 'GlobalRank': 'GlobalRank_Old'}
+        )
+
+        both = joined['_merge'] == 'both'
+        rank_old, rank_new = joined['GlobalRank_Old'], joined['GlobalRank_New']
+        rank_moved = (rank_old != rank_new) & ~(rank_old.isna() & rank_new.isna())
+        queue_moved = joined['Queue_Old'].fillna('') != joined['Queue_New'].fillna('')
+        joined['Change'] = np.where(both, 'moved', 'new')
+        joined = joined[~both | rank_moved | queue_moved]
+
+        delta = pd.concat([
+            joined.assign(Name=joined['Name_New'].fillna(joined['Name_Old'])),
+            removed.assign(Change='removed', Name=removed['Name_Old']),
+        ], ignore_index=True)
+        delta['RankShift'] = delta['GlobalRank_Old'] - delta['GlobalRank_New']
+        for col in ('GlobalRank_Old', 'GlobalRank_New', 'RankShift'):
+            # Ranks are whole numbers; keep them integral in the CSV
+            if (delta[col].dropna() % 1 == 0).all():
+                delta[col] = delta[col].astype('Int64')
+
+        return delta[[
+            'Change', 'Method', 'ID', 'Name', 'Queue_Old', 'Queue_New',
+            'GlobalRank_Old', 'GlobalRank_New', 'RankShift',
+        ]]
+
     def export_discarded(
         self,
         data: pd.DataFrame,
@@ -265,6 +494,15 @@ class Exporter:
             data: DataFrame with discarded ideas and discard_reason
             output_dir: directory where file will be written
         """
+        discarded_path = os.path.join(output_dir, 'discarded_ideas.csv')
+        manifest = self._open_manifest(discarded_path)
+        discarded_path = self._write_csv_atomic(self._discarded_frame(data), discarded_path, manifest)
+        self._commit_manifest(manifest)
+        print(f"    ✓ Discarded IDEAs exported to {discarded_path}")
+
+    @staticmethod
+    def _discarded_frame(data: pd.DataFrame) -> pd.DataFrame:
+        """Select the discarded_ideas.csv columns, adding discard_reason if missing."""
         output_df = data.copy()
 
         # Ensure discard reason exists
@@ -277,15 +515,329 @@ class Exporter:
             'MicroPhase', 'Queue', 'PriorityRA', 'Value', 'Urgency', 'Risk', 'Size', 'discard_reason'
         ]
         available_columns = [c for c in output_columns if c in output_df.columns]
-        output_df = output_df[available_columns]
+        return apply_export_schema(output_df[available_columns])
+
+    def _resolve_formats(self, formats: Optional[List[str]]) -> List[str]:
+        """Validate a list of output formats (None means CSV only)."""
+        if not formats:
+            return ['csv']
+        resolved = [str(fmt).lower() for fmt in formats]
+        unknown = [fmt for fmt in resolved if fmt not in self.OUTPUT_FORMATS]
+        if unknown:
+            raise ValueError(
+                f"Unknown output format(s): {', '.join(unknown)}. "
+                f"Valid formats: {', '.join(self.OUTPUT_FORMATS)}"
+            )
+        return list(dict.fromkeys(resolved))
+
+    def _resolve_layout(self, layout: Optional[str]) -> str:
+        """Validate a demand.csv layout (None means long)."""
+        resolved = str(layout).lower() if layout else 'long'
+        if resolved not in self.DEMAND_LAYOUTS:
+            raise ValueError(
+                f"Unknown demand layout: {layout}. Valid layouts: {', '.join(self.DEMAND_LAYOUTS)}"
+            )
+        return resolved
 
-        os.makedirs(output_dir, exist_ok=True)
-        discarded_path = os.path.join(output_dir, 'discarded_ideas.csv')
-        output_df.to_csv(
-            discarded_path,
-            index=False,
-            sep=self.csv_delimiter,
-            decimal=self.decimal_separator,
-            encoding=self.csv_encoding,
-        )
-        print(f"    ✓ Discarded IDEAs exported to {discarded_path}")
+    def _write_result(
+        self,
+        df: pd.DataFrame,
+        filepath: str,
+        formats: List[str],
+        manifest: Optional[OutputManifest] = None,
+    ) -> List[str]:
+        """
+        Write a result frame in each requested format.
+
+        Args:
+            df: Prepared output frame
+            filepath: CSV path; the columnar artifact is written next to it
+            formats: Output formats
+            manifest: Output manifest of the directory, if files are tracked
+
+        Returns:
+            Paths written, CSV first
+        """
+        written = []
+        if 'csv' in formats:
+            written.append(self._write_csv_atomic(df, filepath, manifest))
+        if 'columnar' in formats:
+            path = columnar_path(filepath)
+            write_columnar(df, partial(self._write_atomic, manifest=manifest), path)
+            written.append(path)
+        return written
+
+    def _write_csv_atomic(self, df: pd.DataFrame, filepath: str, manifest: Optional[OutputManifest] = None) -> str:
+        """
+        Write a DataFrame as European-format CSV without exposing partial files.
+
+        With output.compression set, the CSV is compressed while it is written
+        and the codec suffix is appended to the path (demand.csv.gz).
+
+        Returns:
+            Path actually written
+        """
+        return self._write_text_atomic(filepath, lambda f: self.write_european_csv(df, f), manifest)
+
+    def _write_csv_stream_atomic(
+        self, chunks: Iterable[pd.DataFrame], filepath: str, manifest: Optional[OutputManifest] = None
+    ) -> str:
+        """
+        Write consecutive DataFrame chunks as one European-format CSV file.
+
+        Returns:
+            Path actually written
+        """
+        return self._write_text_atomic(filepath, lambda f: self.write_european_csv_chunks(chunks, f), manifest)
+
+    def _write_text_atomic(
+        self, filepath: str, write_text: Callable, manifest: Optional[OutputManifest] = None
+    ) -> str:
+        """
+        Write a text output atomically, compressed when output.compression is set.
+
+        Args:
+            filepath: Destination path (without codec suffix)
+            write_text: Callable receiving an open text file
+            manifest: Output manifest of the directory, if files are tracked
+
+        Returns:
+            Path actually written
+        """
+        if self.compression is None:
+            self._write_atomic(filepath, write_text, mode='w', encoding=self.csv_encoding, manifest=manifest)
+            return filepath
+
+        codec, level = self.compression
+
+        def write(f):
+            with compressing_writer(f, codec, level) as stream:
+                text = io.TextIOWrapper(stream, encoding=self.csv_encoding, newline='')
+                write_text(text)
+                text.flush()
+                text.detach()
+
+        path = compressed_path(filepath, codec)
+        self._write_atomic(path, write, manifest=manifest)
+        return path
+
+    def write_european_csv(self, df: pd.DataFrame, f) -> None:
+        """
+        Write a DataFrame as CSV with the configured separator and decimal mark.
+
+        Produces the same bytes as ``df.to_csv(f, index=False, sep=...,
+        decimal=...)`` but formats each column once with vectorized string
+        operations and writes CSV_BLOCK_ROWS rows per call, avoiding pandas'
+        slow per-value path for a non-'.' decimal separator. Categorical
+        columns are formatted once per category and nullable integers from
+        their values and missing mask. Frames with column types it does not
+        format (dates, mixed-type columns) are handed to to_csv unchanged.
+
+        Args:
+            df: DataFrame to write (the index is not written)
+            f: Open text file
+        """
+        self._write_csv_rows(df, f, header=True)
+
+    def write_european_csv_chunks(self, chunks: Iterable[pd.DataFrame], f) -> int:
+        """
+        Write consecutive DataFrame chunks as a single CSV.
+
+        The header comes from the first chunk and every chunk is formatted
+        CSV_BLOCK_ROWS rows at a time, so only one block's text is held in
+        memory. The output equals write_european_csv on the concatenated
+        chunks when they share the same columns.
+
+        Args:
+            chunks: DataFrames with the same columns, in output order
+            f: Open text file
+
+        Returns:
+            Number of data rows written
+        """
+        rows = 0
+        header = True
+        for chunk in chunks:
+            for block in self.row_blocks(chunk):
+                self._write_csv_rows(block, f, header=header)
+                header = False
+                rows += len(block)
+            if header:
+                # Empty chunk: still write its header
+                self._write_csv_rows(chunk, f, header=True)
+                header = False
+        return rows
+
+    def _write_csv_rows(self, df: pd.DataFrame, f, header: bool) -> None:
+        """Write a DataFrame's rows, optionally preceded by its header line."""
+        columns = None
+        if len(df.columns) > 1:
+            # A lone empty field is quoted by the csv module, so single-column
+            # frames always take the to_csv path
+            columns = [self._format_csv_column(df.iloc[:, i]) for i in range(len(df.columns))]
+        if columns is None or any(column is None for column in columns):
+            df.to_csv(f, index=False, header=header, sep=self.csv_delimiter, decimal=self.decimal_separator)
+            return
+
+        line_end = os.linesep
+        if header:
+            f.write(self.csv_delimiter.join(self._quote_csv_text(str(c)) for c in df.columns) + line_end)
+        for start in range(0, len(df), self.CSV_BLOCK_ROWS):
+            block = [column[start:start + self.CSV_BLOCK_ROWS] for column in columns]
+            f.write(line_end.join(map(self.csv_delimiter.join, zip(*block))) + line_end)
+
+    def _format_csv_column(self, series: pd.Series) -> Optional[List[str]]:
+        """Format one column as CSV fields, or return None if to_csv must be used."""
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Format each category once and index the fields by code (-1 = missing).
+            # to_csv ignores the decimal mark for float categories, so only
+            # text and integer categories are formatted here
+            if not (pd.api.types.is_string_dtype(dtype.categories) or pd.api.types.is_integer_dtype(dtype.categories)):
+                return None
+            categories = self._format_csv_column(pd.Series(dtype.categories))
+            if categories is None:
+                return None
+            fields = np.asarray(categories + [''], dtype=object)
+            return fields[series.cat.codes.to_numpy()].tolist()
+        if dtype == bool:
+            return np.where(series.to_numpy(), 'True', 'False').tolist()
+        if isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+            return list(map(str, series.to_numpy().tolist()))
+        if isinstance(dtype, pd.api.extensions.ExtensionDtype) and pd.api.types.is_integer_dtype(dtype):
+            # Nullable integers (Int32 ranks): values plus missing mask
+            missing = series.isna().to_numpy()
+            values = series.to_numpy(dtype=dtype.numpy_dtype, na_value=0)
+            fields = list(map(str, values.tolist()))
+            for i in np.flatnonzero(missing).tolist():
+                fields[i] = ''
+            return fields
+        if dtype == np.float64:
+            values = series.to_numpy()
+            missing = np.isnan(values)
+            finite = values[~missing]
+            if (
+                np.all(np.abs(finite) < 1e15) and np.all(finite == np.trunc(finite))
+                and not np.any(np.signbit(finite) & (finite == 0))
+            ):
+                # Whole numbers (scores, ranks): "5.0" is the int text plus ".0"
+                suffix = self.decimal_separator + '0'
+                fields = [text + suffix for text in map(str, np.where(missing, 0, values).astype(np.int64).tolist())]
+            else:
+                # Shortest round-trip repr, as to_csv writes floats
+                fields = [text.replace('.', self.decimal_separator) for text in map(float.__repr__, values.tolist())]
+            for i in np.flatnonzero(missing).tolist():
+                fields[i] = ''
+            return fields
+        if pd.api.types.is_string_dtype(dtype) and not isinstance(dtype, pd.CategoricalDtype):
+            if dtype == object and pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+                return None
+            # Output text columns repeat few values: format each distinct value once
+            codes, uniques = pd.factorize(series)
+            fields = np.append(np.asarray(uniques, dtype=object), '')
+            special = pd.Series(fields, dtype=object).str.contains(self._csv_special_chars, regex=True)
+            for i in np.flatnonzero(special.to_numpy(dtype=bool)).tolist():
+                fields[i] = self._quote_csv_text(fields[i])
+            return fields[codes].tolist()
+        return None
+
+    @property
+    def _csv_special_chars(self) -> str:
+        """Regex matching characters that force a field to be quoted (QUOTE_MINIMAL)."""
+        return '[' + re.escape(self.csv_delimiter) + '"\r\n]'
+
+    def _quote_csv_text(self, text: str) -> str:
+        """Quote a field the way csv.QUOTE_MINIMAL does."""
+        if re.search(self._csv_special_chars, text):
+            return '"' + text.replace('"', '""') + '"'
+        return text
+
+    def _write_atomic(
+        self,
+        filepath: str,
+        write: Callable,
+        mode: str = 'wb',
+        encoding: Optional[str] = None,
+        manifest: Optional[OutputManifest] = None,
+    ) -> bool:
+        """
+        Write a file through a temporary sibling and os.replace.
+
+        Readers see either the previous file or the complete new one, never a
+        partially written file, even when several files are written at once.
+        With a manifest, the new content's digest is compared with the one
+        recorded for the file and an identical file is left untouched.
+
+        Args:
+            filepath: Destination path
+            write: Callable receiving the open temporary file
+            mode: File mode for the temporary file ('w' or 'wb')
+            encoding: Text encoding when mode is 'w'
+            manifest: Output manifest of the file's directory, if tracked
+
+        Returns:
+            True if the file was replaced, False if it was kept unchanged
+        """
+        directory = os.path.dirname(filepath) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix='.tmp_', suffix=os.path.splitext(filepath)[1], dir=directory)
+        try:
+            with os.fdopen(fd, mode, encoding=encoding, newline='' if 'b' not in mode else None) as f:
+                write(f)
+            os.chmod(temp_path, NEW_FILE_MODE)
+
+            if manifest is None:
+                os.replace(temp_path, filepath)
+                return True
+
+            digest = digest_file(temp_path)
+            if manifest.is_current(filepath, digest):
+                manifest.record(filepath, digest, updated=False)
+                return False
+            os.replace(temp_path, filepath)
+            manifest.record(filepath, digest, updated=True)
+            return True
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _open_manifest(self, filepath: str) -> Optional[OutputManifest]:
+        """
+        Load the manifest of the directory an export writes to.
+
+        Each export call uses its own manifest, so one Exporter can serve
+        concurrent exports.
+
+        Args:
+            filepath: Any output path in the directory
+
+        Returns:
+            OutputManifest, or None if output.skip_unchanged is off
+        """
+        if not self.skip_unchanged:
+            return None
+        return OutputManifest(os.path.dirname(filepath) or '.')
+
+    @staticmethod
+    def _commit_manifest(manifest: Optional[OutputManifest]) -> Optional[Dict[str, List[str]]]:
+        """
+        Save a manifest at the end of an export.
+
+        Returns:
+            Names of the files updated and kept unchanged, or None if
+            skip_unchanged is off or nothing was written
+        """
+        if manifest is None or not (manifest.updated or manifest.unchanged):
+            return None
+        manifest.save()
+        return manifest.summary()
+
+    @staticmethod
+    def _report(paths: List[str], artifacts: Optional[Dict[str, List[str]]]) -> None:
+        """Print one line per written path, flagging files kept unchanged."""
+        unchanged = set(artifacts['unchanged']) if artifacts else set()
+        for path in paths:
+            if os.path.basename(path) in unchanged:
+                print(f"    ✓ Unchanged, kept {path}")
+            else:
+                print(f"    ✓ Exported to {path}")
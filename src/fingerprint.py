@@ -0,0 +1,133 @@
+"""
+Input fingerprinting for TOM Demand Management System.
+
+This module computes content digests of input files (IDEAS, weights,
+configuration). Digests are memoized by (path, size, mtime_ns) so unchanged
+files are hashed once per process, and they are the key source for every
+input-dependent cache and for the fingerprints recorded in metadata.json.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+import hashlib
+import os
+import threading
+
+
+# Large reads keep hashing throughput close to disk speed
+READ_BUFFER_SIZE = 1024 * 1024
+DIGEST_SIZE = 20
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Content digest of a file together with the stat data it was taken at."""
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str
+
+    def to_dict(self) -> Dict:
+        """Return the JSON-serializable form recorded in metadata.json."""
+        return {'path': self.path, 'size': self.size, 'blake2b': self.digest}
+
+
+_cache: Dict[Tuple[str, int, int], FileFingerprint] = {}
+_cache_lock = threading.Lock()
+
+
+def fingerprint_file(filepath: str) -> FileFingerprint:
+    """
+    Return the BLAKE2b fingerprint of a file, reusing it while the file is unchanged.
+
+    Args:
+        filepath: Path to file
+
+    Returns:
+        FileFingerprint for the file's current contents
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = os.path.abspath(filepath)
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    fingerprint = FileFingerprint(
+        path=path, size=stat.st_size, mtime_ns=stat.st_mtime_ns, digest=digest_file(path)
+    )
+    with _cache_lock:
+        # Drop digests of earlier versions of the same file
+        for stale in [k for k in _cache if k[0] == path]:
+            del _cache[stale]
+        _cache[key] = fingerprint
+    return fingerprint
+
+
+def digest_file(filepath: str) -> str:
+    """
+    Return the BLAKE2b digest of a file's contents, without memoization.
+
+    Args:
+        filepath: Path to file
+
+    Returns:
+        Hexadecimal digest
+    """
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    buffer = bytearray(READ_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(filepath, 'rb', buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            hasher.update(view[:read])
+    return hasher.hexdigest()
+
+
+def fingerprint_inputs(inputs: Dict[str, Optional[str]]) -> Dict[str, Dict]:
+    """
+    Fingerprint a set of named input files for metadata.json.
+
+    Args:
+        inputs: Mapping of input name (e.g. 'ideas') to file path; None entries are skipped
+
+    Returns:
+        Mapping of input name to its fingerprint dictionary
+    """
+    return {
+        name: fingerprint_file(path).to_dict()
+        for name, path in inputs.items()
+        if path is not None
+    }
+
+
+def combined_key(filepaths: Iterable[str], *extras: object) -> str:
+    """
+    Combine input file digests and plain values into a single cache key.
+
+    Args:
+        filepaths: Input files, in a fixed order; each contributes its content digest
+        *extras: Other key parts (methods, options, format versions), hashed as text
+
+    Returns:
+        Hexadecimal BLAKE2b digest of the combined parts
+    """
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for filepath in filepaths:
+        hasher.update(b'file:' + fingerprint_file(filepath).digest.encode('ascii') + b'\0')
+    for extra in extras:
+        hasher.update(b'str:' + repr(extra).encode('utf-8') + b'\0')
+    return hasher.hexdigest()
+
+
+def clear_fingerprint_cache() -> None:
+    """Drop every memoized fingerprint."""
+    with _cache_lock:
+        _cache.clear()
@@ -4,14 +4,25 @@ Data loading module for TOM Demand Management System.
 This module provides functions to load and validate input CSV files.
 """
 
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Union
 import pandas as pd
-import yaml
 import os
+import threading
 try:
+    from .compression import detect_compression
+    from .config_registry import CompiledConfig, get_config
     from .validator import Validator, ValidationResult
+    from .schema import apply_compact_schema
+    from .fingerprint import combined_key
+    from .validation_cache import CACHE_FORMAT_VERSION, CachedValidation, validation_cache
 except ImportError:
+    from compression import detect_compression
+    from config_registry import CompiledConfig, get_config
     from validator import Validator, ValidationResult
+    from schema import apply_compact_schema
+    from fingerprint import combined_key
+    from validation_cache import CACHE_FORMAT_VERSION, CachedValidation, validation_cache
 
 
 class DataLoadError(Exception):
@@ -34,22 +45,51 @@ class Loader:
         'RA_Value': 'Value',
     }
 
-    def __init__(self, config_path: Optional[str] = None):
+    # Delta files mark each row as an upsert (default) or a delete of that ID
+    DELTA_ACTION_COLUMN = 'Action'
+    DELTA_ACTIONS = ('upsert', 'delete')
+
+    # Text columns of each weights file, keyed by file kind
+    WEIGHTS_TEXT_COLUMNS = {
+        'ra_weights': ['RevenueStream', 'BudgetGroup', 'RequestingArea'],
+        'bg_rs_weights': ['RevenueStream', 'BudgetGroup'],
+        'rs_weights': ['RevenueStream'],
+    }
+
+    # Per weights kind: (label, Validator method, normalization groups, normalization message)
+    WEIGHTS_SPECS = {
+        'ra_weights': (
+            'RA weights', 'validate_ra_weights', ['RevenueStream', 'BudgetGroup'],
+            "Auto-normalizing weights to sum to 100 per Revenue Stream and Budget Group",
+        ),
+        'bg_rs_weights': (
+            'BG/RS weights', 'validate_bg_rs_weights', ['RevenueStream'],
+            "Auto-normalizing BG/RS weights to sum to 100 per Revenue Stream",
+        ),
+        'rs_weights': (
+            'RS weights', 'validate_rs_weights', None,
+            "Auto-normalizing weights to sum to 100",
+        ),
+    }
+
+    # Columns consumed by validation, prioritization and export
+    PIPELINE_COLUMNS = [
+        'ID', 'Name', 'RequestingArea', 'RevenueStream', 'BudgetGroup',
+        'MicroPhase', 'PriorityRA', 'Value', 'Urgency', 'Risk', 'Size',
+    ]
+
+    def __init__(self, config_path: Optional[str] = None, config: Optional[CompiledConfig] = None):
         """
         Initialize loader with configuration.
 
         Args:
             config_path: Path to config.yaml file. If None, uses default config.
+            config: Compiled configuration to use instead of looking up config_path
         """
-        if config_path is None:
-            # Use default config path
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            config_path = os.path.join(base_dir, 'config', 'config.yaml')
-
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.compiled_config = config or get_config(config_path)
+        self.config = self.compiled_config.raw
 
-        self.validator = Validator(config_path)
+        self.validator = Validator(config=self.compiled_config)
         self.defaults = self.config['defaults']
         self.queues = self.config.get('queues', {})
         config_aliases = self.config.get('input', {}).get('column_aliases', {})
@@ -64,6 +104,18 @@ class Loader:
         self.decimal_separator = self.locale.get('decimal_separator', ',')
         self.csv_encoding = self.locale.get('csv_encoding', 'utf-8-sig')
 
+        # Streaming (chunked) ingestion settings
+        performance = self.config.get('performance', {})
+        self.chunk_size = int(performance.get('chunk_size', 1000))
+        self.chunked_loading = bool(performance.get('chunked_loading', False))
+
+        # Reference file validation cache (see validation_cache.py)
+        self.validation_cache_enabled = bool(performance.get('validation_cache', True))
+        self.validation_cache_dir = performance.get('validation_cache_dir')
+
+        # Warning lines printed on each thread, while collect_warnings is active
+        self._collected = threading.local()
+
     def _determine_queue(self, micro_phase: str) -> str:
         """
         Determine queue (NEXT/NOW/PRODUCTION) based on micro phase.
@@ -74,17 +126,17 @@ class Loader:
         Returns:
             Queue name (NEXT, NOW, or PRODUCTION)
         """
-        for queue_name, queue_config in self.queues.items():
-            if micro_phase in queue_config.get('micro_phases', []):
-                return queue_name
-        return 'UNKNOWN'  # Will be caught by validation
+        return self.compiled_config.queue_for_phase(micro_phase)  # UNKNOWN is caught by validation
 
-    def load_ideas(self, filepath: str) -> pd.DataFrame:
+    def load_ideas(self, filepath: str, chunked: Optional[bool] = None) -> pd.DataFrame:
         """
         Load and validate ideas from CSV file.
 
         Args:
             filepath: Path to ideas.csv
+            chunked: Stream the file in ``performance.chunk_size`` row chunks,
+                keeping only the pipeline columns. If None, uses
+                ``performance.chunked_loading`` from the configuration.
 
         Returns:
             DataFrame with validated IDEAs
@@ -96,16 +148,323 @@ class Loader:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"File not found: {filepath}")
 
+        if chunked is None:
+            chunked = self.chunked_loading
+        if chunked:
+            return self._load_ideas_chunked(filepath)
+
         try:
             df = pd.read_csv(
                 filepath,
+                compression=detect_compression(filepath),
+                sep=self.csv_delimiter,
+                decimal=self.decimal_separator,
+                encoding=self.csv_encoding,
+            )
+        except Exception as e:
+            raise DataLoadError(f"Failed to read CSV file: {str(e)}")
+
+        return self._validated_ideas(df)
+
+    def ideas_from_frame(self, ideas: pd.DataFrame) -> pd.DataFrame:
+        """
+        Normalize and validate IDEAS rows that are already in memory.
+
+        Applies the same column aliases, defaults, Queue mapping and
+        validation as load_ideas, without reading a file. The input frame
+        is not modified.
+
+        Args:
+            ideas: Raw IDEAS rows (CSV column names or their aliases)
+
+        Returns:
+            DataFrame with validated IDEAs
+
+        Raises:
+            DataLoadError: If data validation fails
+        """
+        return self._validated_ideas(ideas.copy())
+
+    def _validated_ideas(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Prepare raw IDEAS rows in place, validate them and print warnings."""
+        df = apply_compact_schema(self._prepare_ideas(df))
+
+        # Validate the dataframe
+        validation_result = self.validator.validate_ideas(df)
+
+        if not validation_result.is_valid:
+            error_msg = "IDEAS validation failed:\n"
+            error_msg += "\n".join([f"  - {err}" for err in validation_result.errors])
+            raise DataLoadError(error_msg)
+
+        # Print warnings if any
+        if validation_result.warnings:
+            self._print_warnings("⚠ Warnings during IDEAS loading:", validation_result.warnings)
+
+        return df
+
+    def load_ideas_delta(self, base: Union[pd.DataFrame, str], delta_path: str) -> pd.DataFrame:
+        """
+        Apply a delta file of changed IDEAs onto a base IDEAS dataset.
+
+        The delta file has the IDEAS layout plus an optional ``Action`` column
+        (``upsert`` or ``delete``, default ``upsert``), keyed by ``ID``. Delete
+        rows only need the ``ID``. Only the delta rows are validated, and
+        PriorityRA sequencing is re-checked only for the Requesting Areas the
+        delta touches, so the cost follows the size of the change rather than
+        the size of the portfolio.
+
+        Args:
+            base: Previously loaded (validated) IDEAS DataFrame, or a path to an
+                ideas.csv to load as the base
+            delta_path: Path to the delta CSV file
+
+        Returns:
+            DataFrame with the merged, validated IDEAs. Updated IDEAs keep
+            their position in the base, new IDEAs are appended.
+
+        Raises:
+            FileNotFoundError: If a file doesn't exist
+            DataLoadError: If the delta is malformed or fails validation
+        """
+        if isinstance(base, str):
+            base = self.load_ideas(base)
+
+        if not os.path.exists(delta_path):
+            raise FileNotFoundError(f"File not found: {delta_path}")
+
+        try:
+            delta = pd.read_csv(
+                delta_path,
+                compression=detect_compression(delta_path),
+                sep=self.csv_delimiter,
+                decimal=self.decimal_separator,
+                encoding=self.csv_encoding,
+            )
+        except Exception as e:
+            raise DataLoadError(f"Failed to read CSV file: {str(e)}")
+
+        if 'ID' not in delta.columns:
+            raise DataLoadError("IDEAS delta validation failed:\n  - Missing required column: ID")
+
+        delta['ID'] = delta['ID'].astype(str).str.strip()
+
+        if self.DELTA_ACTION_COLUMN in delta.columns:
+            actions = (
+                delta.pop(self.DELTA_ACTION_COLUMN)
+                .fillna('upsert')
+                .astype(str)
+                .str.strip()
+                .str.lower()
+                .replace('', 'upsert')
+            )
+        else:
+            actions = pd.Series('upsert', index=delta.index)
+
+        invalid_actions = ~actions.isin(self.DELTA_ACTIONS)
+        if invalid_actions.any():
+            raise DataLoadError(
+                "IDEAS delta validation failed:\n"
+                f"  - Invalid {self.DELTA_ACTION_COLUMN} values in row(s) "
+                f"{delta.index[invalid_actions].tolist()[:5]}: "
+                f"{', '.join(sorted(set(actions[invalid_actions])))}. "
+                f"Valid actions: {', '.join(self.DELTA_ACTIONS)}"
+            )
+
+        deleted_ids = set(delta.loc[actions == 'delete', 'ID'])
+        upserts = self._prepare_ideas(delta[actions == 'upsert'].copy())
+
+        errors = []
+        if not upserts.empty:
+            # The whole plan bar the RA reference check; its PriorityRA
+            # sequencing warnings are replaced by the merged file's below
+            errors.extend(self.validator.validate_ideas(upserts).errors)
+
+        conflicting = deleted_ids.intersection(upserts['ID'])
+        if conflicting:
+            errors.append(
+                f"IDs both upserted and deleted: {', '.join(sorted(conflicting)[:5])}"
+            )
+
+        if errors:
+            error_msg = "IDEAS delta validation failed:\n"
+            error_msg += "\n".join([f"  - {err}" for err in errors])
+            raise DataLoadError(error_msg)
+
+        warnings = []
+        base_ids = base['ID'].astype(str)
+        missing_deletes = deleted_ids.difference(base_ids)
+        if missing_deletes:
+            warnings.append(
+                f"Delete requested for IDs not in base: {', '.join(sorted(missing_deletes)[:5])}"
+            )
+
+        # Requesting Areas whose PriorityRA sequence may have changed
+        changed_in_base = base_ids.isin(deleted_ids) | base_ids.isin(upserts['ID'])
+        touched_ras = set(base.loc[changed_in_base, 'RequestingArea'])
+        if not upserts.empty:
+            touched_ras.update(upserts['RequestingArea'])
+
+        # Blank cells of delete rows widen numeric columns; restore base dtypes when lossless
+        for col in upserts.columns.intersection(base.columns):
+            base_dtype = base[col].dtype
+            if (
+                upserts[col].dtype != base_dtype
+                and pd.api.types.is_numeric_dtype(base_dtype)
+                and pd.api.types.is_numeric_dtype(upserts[col].dtype)
+            ):
+                try:
+                    converted = upserts[col].astype(base_dtype)
+                except (TypeError, ValueError):
+                    continue
+                if (converted == upserts[col]).all():
+                    upserts[col] = converted
+
+        # Updated IDEAs take the position of the base row they replace
+        position = pd.Series(range(len(base)), index=base_ids.values)
+        kept = base[~changed_in_base].copy()
+        kept['_delta_order'] = pd.RangeIndex(len(base))[~changed_in_base.to_numpy()]
+        new_position = len(base) + pd.Series(range(len(upserts)), index=upserts.index)
+        upserts['_delta_order'] = upserts['ID'].map(position).fillna(new_position)
+
+        merged = (
+            pd.concat([kept, upserts], ignore_index=True)
+            .sort_values('_delta_order', kind='mergesort')
+            .drop(columns='_delta_order')
+            .reset_index(drop=True)
+        )
+        apply_compact_schema(merged)
+
+        warnings.extend(
+            self.validator.check_priority_sequencing(merged, requesting_areas=touched_ras)
+        )
+        if warnings:
+            self._print_warnings("⚠ Warnings during IDEAS delta loading:", warnings)
+
+        return merged
+
+    def _load_ideas_chunked(self, filepath: str) -> pd.DataFrame:
+        """
+        Stream ideas from CSV in chunks, validating each chunk as it arrives.
+
+        Only the columns used by the pipeline are parsed, and the load stops at
+        the first chunk with errors. Row numbers in error messages refer to the
+        whole file (0-based data rows), not to the chunk.
+
+        Args:
+            filepath: Path to ideas.csv
+
+        Returns:
+            DataFrame with validated IDEAs (pipeline columns only)
+
+        Raises:
+            DataLoadError: If reading or validation of any chunk fails
+        """
+        try:
+            reader = pd.read_csv(
+                filepath,
+                compression=detect_compression(filepath),
                 sep=self.csv_delimiter,
                 decimal=self.decimal_separator,
                 encoding=self.csv_encoding,
+                usecols=self._is_pipeline_column,
+                chunksize=self.chunk_size,
             )
         except Exception as e:
             raise DataLoadError(f"Failed to read CSV file: {str(e)}")
 
+        chunks = []
+        warnings = []
+        seen_warnings = set()
+        seen_ids = set()
+
+        try:
+            for chunk in self._read_chunks(reader):
+                if chunk.empty:
+                    continue
+                first_row, last_row = chunk.index[0], chunk.index[-1]
+                chunk = self._prepare_ideas(chunk, check_required=False)
+
+                # Index labels are file-wide data row numbers, so every
+                # error names the rows it is about
+                validation_result = self.validator.validate_idea_rows(chunk)
+                errors = [
+                    f"{error} (row(s): {rows[:5]})" if rows else error
+                    for error, rows in zip(validation_result.errors, validation_result.error_rows)
+                ]
+
+                # ID uniqueness has to be tracked across chunks
+                ids = chunk['ID']
+                dup_mask = ids.duplicated() | ids.isin(seen_ids)
+                if dup_mask.any():
+                    dup_rows = chunk.index[dup_mask].tolist()
+                    dup_ids = ids[dup_mask].tolist()
+                    errors.append(
+                        f"Duplicate IDs found: {', '.join(str(d) for d in dup_ids[:5])} "
+                        f"(row(s): {dup_rows[:5]})"
+                    )
+
+                if errors:
+                    error_msg = f"IDEAS validation failed (rows {first_row}-{last_row}):\n"
+                    error_msg += "\n".join([f"  - {err}" for err in errors])
+                    raise DataLoadError(error_msg)
+
+                seen_ids.update(ids)
+                for warning in validation_result.warnings:
+                    if warning not in seen_warnings:
+                        seen_warnings.add(warning)
+                        warnings.append(warning)
+                chunks.append(chunk)
+        finally:
+            reader.close()
+
+        if chunks:
+            df = pd.concat(chunks)
+        else:
+            df = self._prepare_ideas(pd.DataFrame(columns=self.PIPELINE_COLUMNS))
+        apply_compact_schema(df)
+
+        # PriorityRA sequencing needs every row of a Requesting Area
+        warnings.extend(self.validator.check_priority_sequencing(df))
+
+        if warnings:
+            self._print_warnings("⚠ Warnings during IDEAS loading:", warnings)
+
+        return df
+
+    @staticmethod
+    def _read_chunks(reader) -> Iterator[pd.DataFrame]:
+        """
+        Yield the chunks of a CSV reader, reporting read errors like load_ideas.
+
+        Parse and decode errors only surface when the chunk holding the bad
+        line is read; validation errors raised by the caller pass through.
+        """
+        try:
+            yield from reader
+        except Exception as e:
+            raise DataLoadError(f"Failed to read CSV file: {str(e)}")
+
+    def _is_pipeline_column(self, column: str) -> bool:
+        """Return True if a raw CSV header maps to a column used by the pipeline."""
+        return self.column_aliases.get(column, column) in self.PIPELINE_COLUMNS
+
+    def _prepare_ideas(self, df: pd.DataFrame, check_required: bool = True) -> pd.DataFrame:
+        """
+        Normalize raw IDEAS rows: column aliases, text cleanup, defaults and Queue.
+
+        Args:
+            df: Raw IDEAS rows as read from CSV
+            check_required: Raise on empty required values; callers that run
+                validate_idea_rows afterwards pass False and get those
+                errors, with their rows, from the validator instead
+
+        Returns:
+            Normalized DataFrame (same index as the input)
+
+        Raises:
+            DataLoadError: If required columns have empty values
+        """
         # Normalize column names using configurable aliases
         for old_name, new_name in self.column_aliases.items():
             if old_name in df.columns and new_name not in df.columns:
@@ -126,7 +485,7 @@ class Loader:
         # Check for required columns with null/empty values and provide clear error
         required_cols = ['ID', 'Name', 'RequestingArea', 'RevenueStream', 'BudgetGroup', 'PriorityRA']
         missing_data_errors = []
-        for col in required_cols:
+        for col in required_cols if check_required else ():
             if col in df.columns:
                 null_mask = df[col].isna()
                 if null_mask.any():
@@ -177,21 +536,9 @@ class Loader:
             df['MicroPhase'] = df['MicroPhase'].fillna(self.defaults.get('micro_phase', 'Backlog'))
 
         # Determine Queue based on MicroPhase
-        df['Queue'] = df['MicroPhase'].apply(self._determine_queue)
-
-        # Validate the dataframe
-        validation_result = self.validator.validate_ideas(df)
-
-        if not validation_result.is_valid:
-            error_msg = "IDEAS validation failed:\n"
-            error_msg += "\n".join([f"  - {err}" for err in validation_result.errors])
-            raise DataLoadError(error_msg)
-
-        # Print warnings if any
-        if validation_result.warnings:
-            print("⚠ Warnings during IDEAS loading:")
-            for warning in validation_result.warnings:
-                print(f"  - {warning}")
+        df['Queue'] = (
+            df['MicroPhase'].map(self.compiled_config.queue_by_phase).fillna('UNKNOWN')
+        )
 
         return df
 
@@ -209,67 +556,157 @@ class Loader:
             FileNotFoundError: If file doesn't exist
             DataLoadError: If data validation fails
         """
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"File not found: {filepath}")
+        return self._load_weights(filepath, 'ra_weights')
 
-        try:
-            df = pd.read_csv(
-                filepath,
-                sep=self.csv_delimiter,
-                decimal=self.decimal_separator,
-                encoding=self.csv_encoding,
-            )
-        except Exception as e:
-            raise DataLoadError(f"Failed to read CSV file: {str(e)}")
+    def load_bg_rs_weights(self, filepath: str) -> pd.DataFrame:
+        """
+        Load Budget Group weights by Revenue Stream from CSV file.
 
-        # Convert text columns to string to avoid float issues
-        text_columns = ['RevenueStream', 'BudgetGroup', 'RequestingArea']
-        for col in text_columns:
-            if col in df.columns:
-                df[col] = df[col].astype(str)
-                df[col] = df[col].replace('nan', '')
+        Args:
+            filepath: Path to weights_bg_rs.csv
 
-        # Validate the dataframe
-        validation_result = self.validator.validate_ra_weights(df)
+        Returns:
+            DataFrame with validated BG/RS weights
 
-        if not validation_result.is_valid:
-            error_msg = "RA weights validation failed:\n"
-            error_msg += "\n".join([f"  - {err}" for err in validation_result.errors])
-            raise DataLoadError(error_msg)
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            DataLoadError: If data validation fails
+        """
+        return self._load_weights(filepath, 'bg_rs_weights')
 
-        # Handle warnings (e.g., normalize weights if configured)
-        if validation_result.warnings:
-            print("⚠ Warnings during RA weights loading:")
-            for warning in validation_result.warnings:
-                print(f"  - {warning}")
+    def load_rs_weights(self, filepath: str) -> pd.DataFrame:
+        """
+        Load Revenue Stream weights from CSV file.
 
-            # Auto-normalize if configured
-            if self.config['prioritization']['auto_normalize_weights']:
-                print("  → Auto-normalizing weights to sum to 100 per Revenue Stream and Budget Group")
-                df = self.validator.normalize_weights(df, group_by=['RevenueStream', 'BudgetGroup'])
+        Args:
+            filepath: Path to weights_rs.csv
 
-        return df
+        Returns:
+            DataFrame with validated RS weights
 
-    def load_bg_rs_weights(self, filepath: str) -> pd.DataFrame:
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            DataLoadError: If data validation fails
         """
-        Load Budget Group weights by Revenue Stream from CSV file.
+        return self._load_weights(filepath, 'rs_weights')
+
+    def weights_from_frame(self, weights: pd.DataFrame, kind: str) -> pd.DataFrame:
+        """
+        Validate (and, if configured, normalize) weights already in memory.
+
+        Applies the same checks as the load_*_weights methods, without
+        reading a file or using the validation cache. The input frame is
+        not modified.
 
         Args:
-            filepath: Path to weights_bg_rs.csv
+            weights: Weights rows
+            kind: 'ra_weights', 'bg_rs_weights' or 'rs_weights'
 
         Returns:
-            DataFrame with validated BG/RS weights
+            DataFrame with validated weights
 
         Raises:
-            FileNotFoundError: If file doesn't exist
             DataLoadError: If data validation fails
         """
+        df = self._clean_weights_text(weights.copy(), self.WEIGHTS_TEXT_COLUMNS[kind])
+        validation_result, df = self._check_weights(df, kind)
+        return self._report_weights(validation_result, df, kind)
+
+    def _load_weights(self, filepath: str, kind: str) -> pd.DataFrame:
+        """
+        Read, validate and (if configured) normalize a weights file.
+
+        The ValidationResult and resulting frame are cached by the file's
+        content fingerprint and the configuration's, so an unchanged file
+        is only validated once (per process, or once overall with
+        ``performance.validation_cache_dir``).
+        """
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"File not found: {filepath}")
 
+        cache_key = None
+        cached = None
+        if self.validation_cache_enabled:
+            cache_key = combined_key(
+                [filepath, self.compiled_config.path], kind, pd.__version__, CACHE_FORMAT_VERSION
+            )
+            cached = validation_cache.get(cache_key, self.validation_cache_dir)
+
+        if cached is not None:
+            validation_result, df = cached.result, cached.frame
+        else:
+            df = self._read_weights_csv(filepath, self.WEIGHTS_TEXT_COLUMNS[kind])
+            validation_result, df = self._check_weights(df, kind)
+
+            if cache_key is not None:
+                validation_cache.put(
+                    cache_key, CachedValidation(validation_result, df), self.validation_cache_dir
+                )
+
+        return self._report_weights(validation_result, df, kind)
+
+    def _check_weights(self, df: pd.DataFrame, kind: str) -> tuple:
+        """
+        Validate weights and normalize them if configured.
+
+        Returns:
+            (ValidationResult, frame), with frame None when validation failed
+        """
+        _, validate_name, group_by, _ = self.WEIGHTS_SPECS[kind]
+        validation_result = getattr(self.validator, validate_name)(df)
+
+        if not validation_result.is_valid:
+            df = None
+        elif validation_result.warnings and self.config['prioritization']['auto_normalize_weights']:
+            df = self.validator.normalize_weights(df, group_by=group_by)
+        return validation_result, df
+
+    def _report_weights(self, validation_result: ValidationResult, df: Optional[pd.DataFrame], kind: str) -> pd.DataFrame:
+        """Raise on validation errors, print warnings, and return the weights."""
+        label, _, _, normalize_message = self.WEIGHTS_SPECS[kind]
+        if not validation_result.is_valid:
+            error_msg = f"{label} validation failed:\n"
+            error_msg += "\n".join([f"  - {err}" for err in validation_result.errors])
+            raise DataLoadError(error_msg)
+
+        # Handle warnings (e.g., normalize weights if configured)
+        if validation_result.warnings:
+            # Auto-normalize if configured
+            notes = [f"  → {normalize_message}"] if self.config['prioritization']['auto_normalize_weights'] else []
+            self._print_warnings(f"⚠ Warnings during {label} loading:", validation_result.warnings, notes)
+
+        return df
+
+    @contextmanager
+    def collect_warnings(self) -> Iterator[List[str]]:
+        """
+        Record the warning lines that loads on the current thread print.
+
+        Yields:
+            List the printed lines are appended to, e.g. to replay them later
+        """
+        previous = getattr(self._collected, 'lines', None)
+        self._collected.lines = lines = []
+        try:
+            yield lines
+        finally:
+            self._collected.lines = previous
+
+    def _print_warnings(self, heading: str, warnings: List[str], notes: List[str] = ()) -> None:
+        """Print a block of warnings and record its lines for collect_warnings."""
+        lines = [heading, *(f"  - {warning}" for warning in warnings), *notes]
+        for line in lines:
+            print(line)
+        collected = getattr(self._collected, 'lines', None)
+        if collected is not None:
+            collected.extend(lines)
+
+    def _read_weights_csv(self, filepath: str, text_columns: List[str]) -> pd.DataFrame:
+        """Read a weights CSV, keeping its text columns as strings."""
         try:
             df = pd.read_csv(
                 filepath,
+                compression=detect_compression(filepath),
                 sep=self.csv_delimiter,
                 decimal=self.decimal_separator,
                 encoding=self.csv_encoding,
@@ -277,86 +714,111 @@ class Loader:
         except Exception as e:
             raise DataLoadError(f"Failed to read CSV file: {str(e)}")
 
+        return self._clean_weights_text(df, text_columns)
+
+    @staticmethod
+    def _clean_weights_text(df: pd.DataFrame, text_columns: List[str]) -> pd.DataFrame:
+        """Convert weights text columns to strings (missing values become '')."""
         # Convert text columns to string to avoid float issues
-        text_columns = ['RevenueStream', 'BudgetGroup']
         for col in text_columns:
             if col in df.columns:
                 df[col] = df[col].astype(str)
                 df[col] = df[col].replace('nan', '')
 
-        # Validate the dataframe
-        validation_result = self.validator.validate_bg_rs_weights(df)
-
-        if not validation_result.is_valid:
-            error_msg = "BG/RS weights validation failed:\n"
-            error_msg += "\n".join([f"  - {err}" for err in validation_result.errors])
-            raise DataLoadError(error_msg)
-
-        # Handle warnings
-        if validation_result.warnings:
-            print("⚠ Warnings during BG/RS weights loading:")
-            for warning in validation_result.warnings:
-                print(f"  - {warning}")
-
-            # Auto-normalize if configured
-            if self.config['prioritization']['auto_normalize_weights']:
-                print("  → Auto-normalizing BG/RS weights to sum to 100 per Revenue Stream")
-                df = self.validator.normalize_weights(df, group_by=['RevenueStream'])
-
         return df
 
-    def load_rs_weights(self, filepath: str) -> pd.DataFrame:
+    def check_header(self, filepath: str, kind: str = 'ideas') -> ValidationResult:
         """
-        Load Revenue Stream weights from CSV file.
+        Quick check, tier 0: validate a file's header without reading its rows.
 
         Args:
-            filepath: Path to weights_rs.csv
+            filepath: Path to the CSV file
+            kind: 'ideas', 'ra_weights', 'bg_rs_weights' or 'rs_weights'
 
         Returns:
-            DataFrame with validated RS weights
+            ValidationResult for the header (required columns present)
 
         Raises:
             FileNotFoundError: If file doesn't exist
-            DataLoadError: If data validation fails
         """
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"File not found: {filepath}")
 
         try:
-            df = pd.read_csv(
+            header = pd.read_csv(
                 filepath,
+                compression=detect_compression(filepath),
                 sep=self.csv_delimiter,
-                decimal=self.decimal_separator,
                 encoding=self.csv_encoding,
-            )
+                nrows=0,
+            ).columns.tolist()
         except Exception as e:
-            raise DataLoadError(f"Failed to read CSV file: {str(e)}")
-
-        # Convert text columns to string to avoid float issues
-        if 'RevenueStream' in df.columns:
-            df['RevenueStream'] = df['RevenueStream'].astype(str)
-            df['RevenueStream'] = df['RevenueStream'].replace('nan', '')
+            return ValidationResult(False, [f"Failed to read CSV header: {str(e)}"], [])
+
+        warnings = []
+        if kind == 'ideas':
+            columns = set(header)
+            for old_name, new_name in self.column_aliases.items():
+                if old_name in columns and new_name not in columns:
+                    columns = (columns - {old_name}) | {new_name}
+            required = self.validator.IDEA_REQUIRED_COLUMNS
+            if 'MicroPhase' not in columns:
+                warnings.append("MicroPhase column missing - will use default 'Backlog'")
+        else:
+            columns = set(header)
+            required = self._weights_required_columns(kind)
+
+        errors = [f"Missing required column: {col}" for col in required if col not in columns]
+        return ValidationResult(len(errors) == 0, errors, warnings)
+
+    def check_rows(self, filepath: str, kind: str = 'ideas') -> ValidationResult:
+        """
+        Quick check, tier 1: validate enum and range rules of a single file.
 
-        # Validate the dataframe
-        validation_result = self.validator.validate_rs_weights(df)
+        IDEAS are read projected to the pipeline columns and checked with the
+        row-local rules only; weights files are small and fully validated.
+        Cross-file rules (RA references) are left to a full validation.
 
-        if not validation_result.is_valid:
-            error_msg = "RS weights validation failed:\n"
-            error_msg += "\n".join([f"  - {err}" for err in validation_result.errors])
-            raise DataLoadError(error_msg)
+        Args:
+            filepath: Path to the CSV file
+            kind: 'ideas', 'ra_weights', 'bg_rs_weights' or 'rs_weights'
 
-        # Handle warnings
-        if validation_result.warnings:
-            print("⚠ Warnings during RS weights loading:")
-            for warning in validation_result.warnings:
-                print(f"  - {warning}")
+        Returns:
+            ValidationResult for the file's rows
 
-            # Auto-normalize if configured
-            if self.config['prioritization']['auto_normalize_weights']:
-                print("  → Auto-normalizing weights to sum to 100")
-                df = self.validator.normalize_weights(df)
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"File not found: {filepath}")
 
-        return df
+        try:
+            if kind == 'ideas':
+                try:
+                    df = pd.read_csv(
+                        filepath,
+                        compression=detect_compression(filepath),
+                        sep=self.csv_delimiter,
+                        decimal=self.decimal_separator,
+                        encoding=self.csv_encoding,
+                        usecols=self._is_pipeline_column,
+                    )
+                except Exception as e:
+                    raise DataLoadError(f"Failed to read CSV file: {str(e)}")
+                return self.validator.validate_idea_rows(self._prepare_ideas(df))
+
+            df = self._read_weights_csv(filepath, self.WEIGHTS_TEXT_COLUMNS[kind])
+            return getattr(self.validator, f"validate_{kind}")(df)
+        except DataLoadError as e:
+            return ValidationResult(False, [str(e)], [])
+
+    def _weights_required_columns(self, kind: str) -> List[str]:
+        """Return the required columns of a weights file kind."""
+        return {
+            'ra_weights': self.validator.RA_WEIGHTS_REQUIRED_COLUMNS,
+            'bg_rs_weights': self.validator.BG_RS_WEIGHTS_REQUIRED_COLUMNS,
+            'rs_weights': self.validator.RS_WEIGHTS_REQUIRED_COLUMNS,
+        }[kind]
 
     def load_all(
         self,
@@ -364,6 +826,7 @@ class Loader:
         ra_weights_path: str,
         rs_weights_path: str,
         bg_rs_weights_path: str,
+        chunked: Optional[bool] = None,
     ) -> tuple:
         """
         Load all required input files.
@@ -373,6 +836,7 @@ class Loader:
             ra_weights_path: Path to weights_ra.csv
             rs_weights_path: Path to weights_rs.csv
             bg_rs_weights_path: Path to weights_bg_rs.csv
+            chunked: Stream the IDEAS file in chunks (see ``load_ideas``)
 
         Returns:
             Tuple of (ideas_df, ra_weights_df, rs_weights_df, bg_rs_weights_df)
@@ -384,7 +848,7 @@ class Loader:
         print("Loading input files...")
 
         print(f"  → Loading IDEAS from {ideas_path}")
-        ideas = self.load_ideas(ideas_path)
+        ideas = self.load_ideas(ideas_path, chunked=chunked)
         print(f"    ✓ {len(ideas)} IDEAs loaded successfully")
 
         print(f"  → Loading RA weights from {ra_weights_path}")
@@ -399,13 +863,45 @@ class Loader:
         bg_rs_weights = self.load_bg_rs_weights(bg_rs_weights_path)
         print(f"    ✓ {len(bg_rs_weights)} Budget Group by Revenue Stream weights loaded")
 
-        # Cross-validate IDEAS with RA weights
+        self._cross_validate(ideas, ra_weights)
+
+        print("✓ All files loaded and validated successfully\n")
+
+        return ideas, ra_weights, rs_weights, bg_rs_weights
+
+    def load_frames(
+        self,
+        ideas: pd.DataFrame,
+        ra_weights: pd.DataFrame,
+        rs_weights: pd.DataFrame,
+        bg_rs_weights: pd.DataFrame,
+    ) -> tuple:
+        """
+        Validate input frames already in memory, as load_all does for files.
+
+        Args:
+            ideas: Raw IDEAS rows
+            ra_weights: RA weights rows
+            rs_weights: RS weights rows
+            bg_rs_weights: BG/RS weights rows
+
+        Returns:
+            Tuple of (ideas_df, ra_weights_df, rs_weights_df, bg_rs_weights_df)
+
+        Raises:
+            DataLoadError: If validation fails
+        """
+        ideas = self.ideas_from_frame(ideas)
+        ra_weights = self.weights_from_frame(ra_weights, 'ra_weights')
+        rs_weights = self.weights_from_frame(rs_weights, 'rs_weights')
+        bg_rs_weights = self.weights_from_frame(bg_rs_weights, 'bg_rs_weights')
+        self._cross_validate(ideas, ra_weights)
+        return ideas, ra_weights, rs_weights, bg_rs_weights
+
+    def _cross_validate(self, ideas: pd.DataFrame, ra_weights: pd.DataFrame) -> None:
+        """Cross-validate IDEAS with RA weights, raising DataLoadError on errors."""
         validation_result = self.validator.validate_ideas(ideas, ra_weights)
         if not validation_result.is_valid:
             error_msg = "Cross-validation failed:\n"
             error_msg += "\n".join([f"  - {err}" for err in validation_result.errors])
             raise DataLoadError(error_msg)
-
-        print("✓ All files loaded and validated successfully\n")
-
-        return ideas, ra_weights, rs_weights, bg_rs_weights
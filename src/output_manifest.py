@@ -0,0 +1,133 @@
+"""
+Output manifest for TOM Demand Management System.
+
+Each output directory keeps a small manifest.json with the content digest,
+size and mtime of every file the Exporter wrote there. Before replacing a
+file the Exporter compares the digest of the new output with the manifest,
+and leaves the file untouched when nothing changed, so synced directories
+and downstream caches only see files whose content actually differs.
+"""
+
+from typing import Dict, List, Optional
+import json
+import os
+import tempfile
+import threading
+
+
+MANIFEST_NAME = 'manifest.json'
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+# Mode of a newly created file under the process umask. mkstemp creates
+# owner-only (0600) files and os.replace keeps that mode, so atomic writes
+# set it explicitly. Read once, as reading the umask briefly changes it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+NEW_FILE_MODE = 0o666 & ~_UMASK
+
+# Serializes manifest saves, so concurrent exports to one directory merge
+# their entries instead of overwriting each other's
+_SAVE_LOCK = threading.Lock()
+
+
+class OutputManifest:
+    """Digests of the files written to one output directory."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.path = os.path.join(directory, MANIFEST_NAME)
+        self.updated: List[str] = []
+        self.unchanged: List[str] = []
+        self._files: Dict[str, Dict] = self._load()
+        self._recorded: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            # A corrupt manifest only costs one full rewrite
+            return {}
+        if payload.get('version') != MANIFEST_VERSION:
+            return {}
+        return dict(payload.get('files', {}))
+
+    def is_current(self, filepath: str, digest: str) -> bool:
+        """
+        Check whether a file already holds content with this digest.
+
+        The file must still have the size and mtime recorded when it was
+        written, so a file edited or replaced outside the Exporter is
+        always rewritten.
+
+        Args:
+            filepath: Output file path
+            digest: Digest of the new content
+
+        Returns:
+            True if the existing file can be kept as is
+        """
+        name = os.path.basename(filepath)
+        with self._lock:
+            entry = self._files.get(name)
+        if entry is None or entry.get('blake2b') != digest:
+            return False
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        return stat.st_size == entry.get('size') and stat.st_mtime_ns == entry.get('mtime_ns')
+
+    def record(self, filepath: str, digest: Optional[str], updated: bool) -> None:
+        """
+        Record the outcome of one write.
+
+        Args:
+            filepath: Output file path
+            digest: Digest of the file's content
+            updated: True if the file was replaced, False if it was kept
+        """
+        name = os.path.basename(filepath)
+        with self._lock:
+            if updated:
+                stat = os.stat(filepath)
+                entry = {'blake2b': digest, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+                self._files[name] = entry
+                self._recorded[name] = entry
+                self.updated.append(name)
+            else:
+                self.unchanged.append(name)
+
+    def save(self) -> None:
+        """
+        Write the manifest atomically.
+
+        The entries recorded here are merged into the manifest currently on
+        disk, so exports that saved to the same directory meanwhile keep theirs.
+        """
+        with self._lock:
+            recorded = dict(self._recorded)
+        os.makedirs(self.directory, exist_ok=True)
+        with _SAVE_LOCK:
+            files = self._load()
+            files.update(recorded)
+            payload = {'version': MANIFEST_VERSION, 'files': dict(sorted(files.items()))}
+            fd, temp_path = tempfile.mkstemp(prefix='.tmp_', suffix='.json', dir=self.directory)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(payload, f, indent=2)
+                os.chmod(temp_path, NEW_FILE_MODE)
+                os.replace(temp_path, self.path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+    def summary(self) -> Dict[str, List[str]]:
+        """Return the files updated and kept since the manifest was loaded."""
+        with self._lock:
+            return {'updated': sorted(self.updated), 'unchanged': sorted(self.unchanged)}
@@ -0,0 +1,182 @@
+"""
+Stage DAG executor for TOM Demand Management System.
+
+A pipeline is a set of named stages, each declaring the names of the stages
+(or provided values) whose outputs it takes as arguments. Stages whose
+inputs are ready run concurrently on a thread pool, or one by one in
+declaration order when the pool has a single worker. Every run reports the
+wall time of each stage and the critical path: the chain of dependent
+stages that bounds the run's duration however many workers are used.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import time
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One step of a pipeline.
+
+    func is called with the outputs of the stages named in inputs, in that
+    order, and its return value becomes this stage's output.
+    """
+    name: str
+    func: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageTiming:
+    """When a stage ran, in seconds relative to the start of the run."""
+    start: float
+    seconds: float
+
+
+@dataclass
+class PipelineResult:
+    """Outputs and timings of one pipeline run."""
+    outputs: Dict[str, Any]
+    timings: Dict[str, StageTiming] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def critical_path_seconds(self) -> float:
+        """Total wall time of the stages on the critical path."""
+        return sum(self.timings[name].seconds for name in self.critical_path)
+
+    def report(self) -> Dict:
+        """Return the timings as plain data (seconds per stage, in start order)."""
+        ordered = sorted(self.timings.items(), key=lambda item: item[1].start)
+        return {
+            "wall_time": self.wall_time,
+            "stage_seconds": {name: timing.seconds for name, timing in ordered},
+            "critical_path": list(self.critical_path),
+            "critical_path_seconds": self.critical_path_seconds,
+        }
+
+
+class Pipeline:
+    """A DAG of named stages."""
+
+    def __init__(self, stages: Iterable[Stage]) -> None:
+        """
+        Args:
+            stages: Stages in declaration order
+
+        Raises:
+            ValueError: If two stages share a name
+        """
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate pipeline stage '{stage.name}'")
+            self.stages[stage.name] = stage
+
+    def run(self, values: Optional[Dict[str, Any]] = None, max_workers: int = 1) -> PipelineResult:
+        """
+        Run every stage once its inputs are available.
+
+        Args:
+            values: Outputs provided up front, usable as stage inputs
+            max_workers: Stages run concurrently (1 runs them serially)
+
+        Returns:
+            PipelineResult with every output, including the provided values
+
+        Raises:
+            ValueError: If a stage input is unknown or the stages form a cycle
+            Exception: The first error raised by a stage; stages not yet
+                started are cancelled
+        """
+        outputs: Dict[str, Any] = dict(values or {})
+        order = self._topological_order(outputs)
+        timings: Dict[str, StageTiming] = {}
+        origin = time.perf_counter()
+
+        def execute(stage: Stage) -> Any:
+            start = time.perf_counter()
+            try:
+                return stage.func(*(outputs[name] for name in stage.inputs))
+            finally:
+                timings[stage.name] = StageTiming(start - origin, time.perf_counter() - start)
+
+        if max_workers <= 1:
+            for name in order:
+                outputs[name] = execute(self.stages[name])
+        else:
+            self._run_concurrently(order, outputs, execute, max_workers)
+
+        return PipelineResult(
+            outputs=outputs,
+            timings=timings,
+            critical_path=self._critical_path(order, timings),
+            wall_time=time.perf_counter() - origin,
+        )
+
+    def _run_concurrently(
+        self,
+        order: List[str],
+        outputs: Dict[str, Any],
+        execute: Callable[[Stage], Any],
+        max_workers: int,
+    ) -> None:
+        pending = list(order)
+        running = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while pending or running:
+                for name in [name for name in pending if all(dep in outputs for dep in self.stages[name].inputs)]:
+                    pending.remove(name)
+                    running[pool.submit(execute, self.stages[name])] = name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        for other in running:
+                            other.cancel()
+                        raise error
+                    outputs[name] = future.result()
+
+    def _topological_order(self, provided: Dict[str, Any]) -> List[str]:
+        """Order the stages so that each follows its inputs, keeping declaration order otherwise."""
+        for stage in self.stages.values():
+            if stage.name in provided:
+                raise ValueError(f"Pipeline stage '{stage.name}' is also a provided value")
+            for name in stage.inputs:
+                if name not in self.stages and name not in provided:
+                    raise ValueError(f"Pipeline stage '{stage.name}' has unknown input '{name}'")
+
+        order: List[str] = []
+        done = set(provided)
+        remaining = list(self.stages)
+        while remaining:
+            ready = [name for name in remaining if all(dep in done for dep in self.stages[name].inputs)]
+            if not ready:
+                raise ValueError(f"Pipeline stages form a cycle: {', '.join(remaining)}")
+            for name in ready:
+                remaining.remove(name)
+                done.add(name)
+                order.append(name)
+        return order
+
+    def _critical_path(self, order: List[str], timings: Dict[str, StageTiming]) -> List[str]:
+        """Return the chain of dependent stages with the largest total wall time."""
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for name in order:
+            deps = [dep for dep in self.stages[name].inputs if dep in finish]
+            before = max(deps, key=lambda dep: finish[dep], default=None)
+            previous[name] = before
+            finish[name] = timings[name].seconds + (finish[before] if before else 0.0)
+
+        path: List[str] = []
+        name = max(finish, key=finish.get, default=None)
+        while name is not None:
+            path.append(name)
+            name = previous[name]
+        return path[::-1]
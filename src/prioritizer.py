@@ -7,35 +7,36 @@ at both Level 2 (by Revenue Stream) and Level 3 (Global).
 
 from typing import Dict, List, Optional
 import pandas as pd
-import yaml
-import os
 try:
     from .algorithms.sainte_lague import sainte_lague_allocate
     from .algorithms.dhondt import dhondt_allocate
     from .algorithms.wsjf import wsjf_prioritize, calculate_wsjf
+    from .config_registry import CompiledConfig, get_config
+    from .schema import apply_compact_schema
 except ImportError:
     from algorithms.sainte_lague import sainte_lague_allocate
     from algorithms.dhondt import dhondt_allocate
     from algorithms.wsjf import wsjf_prioritize, calculate_wsjf
+    from config_registry import CompiledConfig, get_config
+    from schema import apply_compact_schema
 
 
 class Prioritizer:
     """Execute prioritization algorithms at different levels."""
 
-    def __init__(self, config_path: Optional[str] = None):
+    # Methods executed by an all-methods run, in output order
+    METHODS = ('sainte-lague', 'dhondt', 'wsjf')
+
+    def __init__(self, config_path: Optional[str] = None, config: Optional[CompiledConfig] = None):
         """
         Initialize the prioritizer.
 
         Args:
             config_path: Path to config.yaml file. If None, uses default config.
+            config: Compiled configuration to use instead of looking up config_path
         """
-        if config_path is None:
-            # Use default config path
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            config_path = os.path.join(base_dir, 'config', 'config.yaml')
-
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.compiled_config = config or get_config(config_path)
+        self.config = self.compiled_config.raw
 
         self.queues = self.config.get('queues', {})
 
@@ -60,10 +61,11 @@ class Prioritizer:
         if method not in ['sainte-lague', 'dhondt', 'wsjf']:
             raise ValueError(f"Invalid method: {method}. Must be 'sainte-lague', 'dhondt', or 'wsjf'")
 
-        # Calculate WSJF scores for all IDEAs (vectorized)
+        # Calculate WSJF scores for all IDEAs (vectorized).
+        # The row sum widens compact int8 scores so the cost of delay cannot overflow.
         ideas_copy = ideas.copy()
         ideas_copy['WSJF_Score'] = (
-            ideas_copy['Value'] + ideas_copy['Urgency'] + ideas_copy['Risk']
+            ideas_copy[['Value', 'Urgency', 'Risk']].sum(axis=1)
         ) / ideas_copy['Size']
 
         all_results = []
@@ -324,7 +326,7 @@ class Prioritizer:
 
         # Build indexed lookups to avoid O(N²) scanning
         level3_by_id = {
-            method: method_results['level3'].set_index('ID')
+            method: method_results['level3'].set_index('ID').astype({'GlobalRank': 'float64'})
             for method, method_results in results.items()
         }
 
@@ -480,7 +482,8 @@ class Prioritizer:
         # Sort by GlobalRank (nulls last)
         combined_df.sort_values('GlobalRank', na_position='last', inplace=True)
 
-        return combined_df
+        # Per-queue frames are rebuilt from records, so restore the compact dtypes
+        return apply_compact_schema(combined_df)
 
     def prioritize_all_methods_with_queues(
         self,
@@ -500,25 +503,46 @@ class Prioritizer:
         Returns:
             Dictionary with results from all methods
         """
-        results = {}
-
-        for method in ['sainte-lague', 'dhondt', 'wsjf']:
-            print(f"  → Executing {method.replace('-', ' ').title()} method...")
-
-            combined_result = self.prioritize_with_queues(
-                ideas,
-                ra_weights,
-                rs_weights,
-                bg_rs_weights,
-                default_method=method,
-            )
+        return {
+            method: self.prioritize_method_with_queues(ideas, ra_weights, rs_weights, bg_rs_weights, method)
+            for method in self.METHODS
+        }
 
-            # Split back into level2 and level3 for export compatibility
-            results[method] = {
-                'level2': combined_result[combined_result['Queue'] != 'PRODUCTION'].copy(),
-                'level3': combined_result
-            }
+    def prioritize_method_with_queues(
+        self,
+        ideas: pd.DataFrame,
+        ra_weights: pd.DataFrame,
+        rs_weights: pd.DataFrame,
+        bg_rs_weights: pd.DataFrame,
+        method: str
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Execute one method with queue-based ranking.
 
-            print(f"    ✓ {method.replace('-', ' ').title()}: {len(combined_result)} IDEAs processed")
+        Args:
+            ideas: DataFrame with all IDEAs (including Queue column)
+            ra_weights: RA weights
+            rs_weights: RS weights
+            bg_rs_weights: BudgetGroup weights per RS
+            method: Prioritization method
 
-        return results
+        Returns:
+            Dictionary with the method's 'level2' and 'level3' results
+        """
+        print(f"  → Executing {method.replace('-', ' ').title()} method...")
+
+        combined_result = self.prioritize_with_queues(
+            ideas,
+            ra_weights,
+            rs_weights,
+            bg_rs_weights,
+            default_method=method,
+        )
+
+        print(f"    ✓ {method.replace('-', ' ').title()}: {len(combined_result)} IDEAs processed")
+
+        # Split back into level2 and level3 for export compatibility
+        return {
+            'level2': combined_result[combined_result['Queue'] != 'PRODUCTION'].copy(),
+            'level3': combined_result
+        }
@@ -0,0 +1,145 @@
+"""
+Whole-run result cache for TOM Demand Management System.
+
+A prioritization run depends only on the content of its four input files,
+the configuration and the requested methods, so DemandService keys each run
+on those (see fingerprint.combined_key) and keeps the resulting
+PrioritizationRun. Identical requests - the same monthly files re-run by
+several people, or a frontend re-submitting - then skip loading, validation
+and ranking. Entries live in a small in-process LRU and, optionally, in an
+on-disk directory kept under a size limit by evicting the least recently
+used entries.
+
+On-disk entries are pickles kept private to the current user (see
+cache_files.py). Callers always get their own copy of a run, never the
+cached object itself.
+"""
+
+from collections import OrderedDict
+from typing import Any, Optional
+import copy
+import os
+import threading
+try:
+    from .cache_files import read_pickle, write_pickle
+except ImportError:
+    from cache_files import read_pickle, write_pickle
+
+
+# Bump when the cached payload layout or the ranking it holds changes
+RESULT_CACHE_VERSION = 2
+
+ENTRY_PREFIX = 'run-'
+ENTRY_SUFFIX = '.pkl'
+
+
+class ResultCache:
+    """Thread-safe in-process LRU with an optional size-bounded on-disk directory."""
+
+    def __init__(self) -> None:
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, cache_dir: Optional[str] = None) -> Optional[Any]:
+        """
+        Look up a cached run.
+
+        Args:
+            key: Cache key (see fingerprint.combined_key)
+            cache_dir: Optional on-disk cache directory to consult on a memory miss
+
+        Returns:
+            A private copy of the cached run, or None on a miss
+        """
+        with self._lock:
+            run = self._entries.get(key)
+            if run is not None:
+                self._entries.move_to_end(key)
+
+        if run is None and cache_dir:
+            run = self._read_disk(key, cache_dir)
+            if run is not None:
+                with self._lock:
+                    self._entries[key] = run
+
+        return copy.deepcopy(run) if run is not None else None
+
+    def put(
+        self,
+        key: str,
+        run: Any,
+        max_entries: int = 8,
+        cache_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Store a run.
+
+        Args:
+            key: Cache key (see fingerprint.combined_key)
+            run: Run to cache; it is copied
+            max_entries: Runs kept in process memory, least recently used dropped first
+            cache_dir: Optional on-disk cache directory to also write to
+            max_bytes: Size limit of cache_dir; older entries are evicted to stay under it
+        """
+        run = copy.deepcopy(run)
+        with self._lock:
+            self._entries[key] = run
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(1, max_entries):
+                self._entries.popitem(last=False)
+        if cache_dir:
+            self._write_disk(key, run, cache_dir)
+            if max_bytes is not None:
+                self._evict(cache_dir, max_bytes)
+
+    def clear(self) -> None:
+        """Drop every in-process entry (on-disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _disk_path(key: str, cache_dir: str) -> str:
+        return os.path.join(cache_dir, f"{ENTRY_PREFIX}{key}{ENTRY_SUFFIX}")
+
+    def _read_disk(self, key: str, cache_dir: str) -> Optional[Any]:
+        path = self._disk_path(key, cache_dir)
+        payload = read_pickle(path, cache_dir)
+        if not isinstance(payload, dict) or payload.get('version') != RESULT_CACHE_VERSION:
+            return None
+        try:
+            # The mtime records the last use, for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return payload['run']
+
+    def _write_disk(self, key: str, run: Any, cache_dir: str) -> None:
+        payload = {'version': RESULT_CACHE_VERSION, 'run': run}
+        write_pickle(payload, self._disk_path(key, cache_dir), cache_dir)
+
+    @staticmethod
+    def _evict(cache_dir: str, max_bytes: int) -> None:
+        """Delete the least recently used entries until cache_dir fits in max_bytes."""
+        entries = []
+        for name in os.listdir(cache_dir):
+            if not (name.startswith(ENTRY_PREFIX) and name.endswith(ENTRY_SUFFIX)):
+                continue
+            try:
+                stat = os.stat(os.path.join(cache_dir, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                continue
+            total -= size
+
+
+result_cache = ResultCache()
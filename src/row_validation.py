@@ -0,0 +1,295 @@
+"""
+Row-scoped validation of reference-data edits for TOM Demand Management System.
+
+An upsert or delete through the reference-data API changes one row, so only
+that row and the groups it belongs to are re-checked: the weight sum of its
+(RevenueStream, BudgetGroup) or RevenueStream group, or the PriorityRA
+sequence of its Requesting Area. Per-group aggregates are built once per file
+version and then updated in place, so checking an edit does not depend on the
+size of the file.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+import os
+import threading
+import pandas as pd
+try:
+    from .validator import Validator
+except ImportError:
+    from validator import Validator
+
+
+# Columns that identify the group a row's aggregate belongs to
+GROUP_COLUMNS = {
+    'ideas': ('RequestingArea',),
+    'ra_weights': ('RevenueStream', 'BudgetGroup'),
+    'bg_rs_weights': ('RevenueStream',),
+    'rs_weights': (),
+}
+
+IDEA_NUMERIC_COLUMNS = ['PriorityRA', 'Value', 'Urgency', 'Risk', 'Size']
+IDEA_TEXT_COLUMNS = ['ID', 'Name', 'RequestingArea', 'RevenueStream', 'BudgetGroup', 'MicroPhase']
+
+# PriorityRA value that takes an IDEA out of its RA's sequence
+UNRANKED_PRIORITY = 999
+
+
+def detect_kind(columns: Iterable[str]) -> Optional[str]:
+    """
+    Infer which reference file a header belongs to.
+
+    Args:
+        columns: CSV header, with IDEAS aliases already resolved
+
+    Returns:
+        'ideas', 'ra_weights', 'bg_rs_weights', 'rs_weights', or None if unknown
+    """
+    names = set(columns)
+    if {'ID', 'PriorityRA'} <= names:
+        return 'ideas'
+    if 'Weight' not in names or 'RevenueStream' not in names:
+        return None
+    if 'RequestingArea' in names and 'BudgetGroup' in names:
+        return 'ra_weights'
+    if 'BudgetGroup' in names:
+        return 'bg_rs_weights'
+    return 'rs_weights'
+
+
+def _text(value) -> Optional[str]:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _number(value) -> Optional[float]:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    try:
+        return float(str(value).strip().replace(',', '.'))
+    except ValueError:
+        return None
+
+
+def _priority(value):
+    number = _number(value)
+    if number is None or number == UNRANKED_PRIORITY:
+        return None
+    return int(number) if number.is_integer() else number
+
+
+@dataclass
+class GroupAggregates:
+    """
+    Per-group aggregates of one reference file.
+
+    For weight files each group maps to [weight sum, row count]; for IDEAS
+    each Requesting Area maps to a Counter of its ranked PriorityRA values.
+    """
+    kind: str
+    groups: Dict[Tuple, object] = field(default_factory=dict)
+
+    @classmethod
+    def from_frame(cls, kind: str, df: pd.DataFrame) -> 'GroupAggregates':
+        """
+        Build the aggregates of a whole file.
+
+        Args:
+            kind: File kind (see detect_kind)
+            df: File contents with canonical column names
+
+        Returns:
+            GroupAggregates for df
+        """
+        aggregates = cls(kind)
+        keys = list(GROUP_COLUMNS[kind])
+        if kind == 'ideas':
+            priorities = df['PriorityRA'].map(_priority)
+            ranked = pd.DataFrame({
+                'RequestingArea': df['RequestingArea'].map(_text),
+                'PriorityRA': priorities,
+            }).dropna()
+            counts = ranked.groupby(['RequestingArea', 'PriorityRA'], sort=False).size()
+            for (ra, priority), count in counts.items():
+                priority = int(priority) if float(priority).is_integer() else priority
+                aggregates.groups.setdefault((ra,), Counter())[priority] += int(count)
+            return aggregates
+
+        frame = pd.DataFrame({col: df[col].map(_text) for col in keys})
+        frame['Weight'] = df['Weight'].map(_number).astype('float64')
+        if keys:
+            grouped = frame.groupby(keys, sort=False, dropna=False)['Weight'].agg(['sum', 'size'])
+            for key, (total, size) in grouped.iterrows():
+                key = key if isinstance(key, tuple) else (key,)
+                aggregates.groups[key] = [float(total), int(size)]
+        elif len(frame):
+            aggregates.groups[()] = [float(frame['Weight'].sum()), len(frame)]
+        return aggregates
+
+    def copy(self) -> 'GroupAggregates':
+        """Return an independent copy."""
+        if self.kind == 'ideas':
+            return GroupAggregates(self.kind, {k: Counter(v) for k, v in self.groups.items()})
+        return GroupAggregates(self.kind, {k: list(v) for k, v in self.groups.items()})
+
+    def group_key(self, row: Mapping) -> Tuple:
+        """Return the group a row (with canonical column names) belongs to."""
+        return tuple(_text(row.get(col)) for col in GROUP_COLUMNS[self.kind])
+
+    def add(self, row: Mapping) -> None:
+        """Add a row's contribution to its group."""
+        self._apply(row, 1)
+
+    def remove(self, row: Mapping) -> None:
+        """Remove a row's contribution from its group."""
+        self._apply(row, -1)
+
+    def _apply(self, row: Mapping, sign: int) -> None:
+        key = self.group_key(row)
+        if self.kind == 'ideas':
+            priority = _priority(row.get('PriorityRA'))
+            if key[0] is None or priority is None:
+                return
+            counter = self.groups.setdefault(key, Counter())
+            counter[priority] += sign
+            if counter[priority] <= 0:
+                del counter[priority]
+            if not counter:
+                del self.groups[key]
+            return
+
+        weight = _number(row.get('Weight'))
+        entry = self.groups.setdefault(key, [0.0, 0])
+        entry[0] += sign * (weight if weight is not None else 0.0)
+        entry[1] += sign
+        if entry[1] <= 0:
+            del self.groups[key]
+
+    def warnings(self, keys: Iterable[Tuple]) -> List[str]:
+        """
+        Check the given groups, using the same messages as the Validator.
+
+        Args:
+            keys: Groups touched by an edit
+
+        Returns:
+            Warning messages for groups whose weights do not sum to 100 or
+            whose PriorityRA values are not sequential
+        """
+        warnings = []
+        for key in dict.fromkeys(keys):
+            entry = self.groups.get(key)
+            if entry is None:
+                continue
+            if self.kind == 'ideas':
+                priorities = sorted(entry.elements())
+                if priorities != list(range(1, len(priorities) + 1)):
+                    warnings.append(
+                        f"RequestingArea '{key[0]}': PriorityRA not sequential. "
+                        f"Expected 1-{len(priorities)}, got {priorities}"
+                    )
+                continue
+
+            total = entry[0]
+            if abs(total - 100) <= 0.01:
+                continue
+            if self.kind == 'ra_weights':
+                warnings.append(
+                    f"Revenue Stream '{key[0]}' / Budget Group '{key[1]}': weights sum to {total:.2f}, not 100.0"
+                )
+            elif self.kind == 'bg_rs_weights':
+                warnings.append(f"Revenue Stream '{key[0]}': BG weights sum to {total:.2f}, not 100.0")
+            else:
+                warnings.append(f"Weights sum to {total:.2f}, not 100.0")
+        return warnings
+
+
+class AggregateCache:
+    """Thread-safe GroupAggregates per file, valid while the file is unchanged."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[Tuple[int, int, int], GroupAggregates]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stamp(path: str) -> Tuple[int, int, int]:
+        stat = os.stat(path)
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def get(self, path: str, kind: str) -> Optional[GroupAggregates]:
+        """
+        Return a copy of the aggregates of the file's current version.
+
+        Args:
+            path: File path
+            kind: Expected file kind
+
+        Returns:
+            GroupAggregates, or None if the file changed since they were stored
+        """
+        path = os.path.abspath(path)
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is None or entry[1].kind != kind or entry[0] != self._stamp(path):
+            return None
+        return entry[1].copy()
+
+    def put(self, path: str, aggregates: GroupAggregates) -> None:
+        """Store aggregates for the file's current version."""
+        path = os.path.abspath(path)
+        stamp = self._stamp(path)
+        with self._lock:
+            self._entries[path] = (stamp, aggregates.copy())
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+aggregate_cache = AggregateCache()
+
+
+def validate_row(validator: Validator, kind: str, row: Mapping) -> List[str]:
+    """
+    Run the row-local rules of a file kind on a single row.
+
+    Args:
+        validator: Validator bound to the active configuration
+        kind: File kind (see detect_kind)
+        row: Row with canonical column names
+
+    Returns:
+        Error messages (empty if the row is valid)
+    """
+    frame = pd.DataFrame([dict(row)])
+    if kind != 'ideas':
+        validate = {
+            'ra_weights': validator.validate_ra_weights,
+            'bg_rs_weights': validator.validate_bg_rs_weights,
+            'rs_weights': validator.validate_rs_weights,
+        }[kind]
+        for col in GROUP_COLUMNS[kind]:
+            frame[col] = frame[col].map(_text)
+        # Group sums are checked against the whole file by GroupAggregates
+        return validate(frame).errors
+
+    errors = []
+    for col in IDEA_TEXT_COLUMNS:
+        if col in frame.columns:
+            frame[col] = frame[col].map(_text).astype(object)
+    for col in IDEA_NUMERIC_COLUMNS:
+        if col not in frame.columns:
+            continue
+        raw = frame.at[0, col]
+        number = _number(raw)
+        if number is None and _text(raw) is not None:
+            errors.append(f"IDEA {frame.at[0, 'ID']}: {col}={raw!r} is not numeric")
+        if number is not None and number.is_integer():
+            frame[col] = pd.Series([int(number)], dtype='int64')
+        else:
+            frame[col] = pd.Series([number], dtype='float64')
+    return errors + validator.validate_idea_rows(frame).errors
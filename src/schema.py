@@ -0,0 +1,95 @@
+"""
+Compact column dtypes for TOM Demand DataFrames.
+
+This module defines the dtype schema applied to IDEAS at load time and to
+prioritization results, so that low-cardinality labels are stored as
+categoricals and scores/ranks as small integers. The compact dtypes are an
+in-memory detail: apply_export_schema restores the dtypes the exported
+files have always been written with.
+"""
+
+from typing import List
+import pandas as pd
+
+
+# Low-cardinality labels stored as pandas categoricals
+CATEGORICAL_COLUMNS: List[str] = [
+    'RevenueStream', 'RequestingArea', 'BudgetGroup', 'MicroPhase', 'Queue', 'Method',
+]
+
+# Scores downcast to the smallest integer type that holds them (floats kept if fractional)
+SCORE_COLUMNS: List[str] = ['Value', 'Urgency', 'Risk', 'Size', 'PriorityRA']
+
+# Scores exported files write as decimals (e.g. 3,0), whatever their in-memory dtype
+EXPORT_FLOAT_COLUMNS: List[str] = ['Value', 'Urgency', 'Risk', 'Size']
+
+# Ranks stored as 32-bit integers (nullable when some rows are unranked)
+RANK_COLUMNS: List[str] = ['Rank_RS', 'Rank_RS_RA', 'GlobalRank']
+
+
+def apply_compact_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert known columns of a DataFrame to their compact dtypes in place.
+
+    Columns that are missing, or whose values do not fit the compact dtype
+    (e.g. fractional scores, non-numeric text), are left unchanged.
+
+    Args:
+        df: DataFrame with IDEAs or prioritization results
+
+    Returns:
+        The same DataFrame, for chaining
+    """
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+
+    for col in SCORE_COLUMNS:
+        if col in df.columns and _is_plain_numeric(df[col]):
+            if not df[col].isna().any():
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+
+    # GlobalRank is always nullable (PRODUCTION rows are unranked)
+    for col in RANK_COLUMNS:
+        if col in df.columns and _is_integral(df[col]):
+            if col == 'GlobalRank' or df[col].isna().any():
+                df[col] = df[col].astype('Int32')
+            else:
+                df[col] = df[col].astype('int32')
+
+    return df
+
+
+def apply_export_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert compact score columns back to the float dtype written to files, in place.
+
+    Args:
+        df: Output frame about to be exported
+
+    Returns:
+        The same DataFrame, for chaining
+    """
+    for col in EXPORT_FLOAT_COLUMNS:
+        if col in df.columns and _is_plain_numeric(df[col]):
+            df[col] = df[col].astype('float64')
+    return df
+
+
+def _is_plain_numeric(series: pd.Series) -> bool:
+    """Return True for numpy numeric (non-boolean) series."""
+    return (
+        pd.api.types.is_numeric_dtype(series.dtype)
+        and not pd.api.types.is_bool_dtype(series.dtype)
+        and not pd.api.types.is_extension_array_dtype(series.dtype)
+    )
+
+
+def _is_integral(series: pd.Series) -> bool:
+    """Return True if every non-null value of a series is a whole number."""
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return False
+    values = pd.to_numeric(series.dropna(), errors='coerce')
+    if values.isna().any():
+        return False
+    return bool((values == values.round()).all())
@@ -1,6 +1,14 @@
 """Service layer for TOM Demand workflows."""
 
-from .demand_service import DemandService
+from .demand_service import DemandService, PrioritizationRun
 from .reference_data_service import ReferenceDataService
+from .service_pool import ServicePool, get_service, service_pool
 
-__all__ = ["DemandService", "ReferenceDataService"]
+__all__ = [
+    "DemandService",
+    "PrioritizationRun",
+    "ReferenceDataService",
+    "ServicePool",
+    "get_service",
+    "service_pool",
+]
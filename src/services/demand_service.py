@@ -4,20 +4,95 @@ from __future__ import annotations
 
 import os
 import time
-from typing import Dict, Optional
+from dataclasses import dataclass, field, replace
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 try:
     # Package import path (e.g. `src.services`)
+    from ..columnar import find_columnar, read_columnar
+    from ..compression import SUFFIXES, detect_compression
+    from ..config_registry import get_config
     from ..exporter import Exporter
-    from ..loader import Loader
+    from ..fingerprint import combined_key, fingerprint_inputs
+    from ..loader import DataLoadError, Loader
+    from ..pipeline import Pipeline, Stage
     from ..prioritizer import Prioritizer
+    from ..result_cache import RESULT_CACHE_VERSION, result_cache
 except ImportError:
     # Flat import path used by CLI entrypoint (`tom_demand.py`)
+    from columnar import find_columnar, read_columnar
+    from compression import SUFFIXES, detect_compression
+    from config_registry import get_config
     from exporter import Exporter
-    from loader import Loader
+    from fingerprint import combined_key, fingerprint_inputs
+    from loader import DataLoadError, Loader
+    from pipeline import Pipeline, Stage
     from prioritizer import Prioritizer
+    from result_cache import RESULT_CACHE_VERSION, result_cache
+
+
+# Discard reasons, in the order they are checked
+DISCARD_REASONS = ("priority_ra_999", "unknown_queue", "missing_ra_weights", "other")
+
+
+@dataclass
+class PrioritizationRun:
+    """
+    In-memory result of a full prioritization.
+
+    results maps each executed method (or 'mixed') to its 'level2' and
+    'level3' frames; final is every method's Level 3 rows combined and
+    discarded holds the IDEAs left out, with a discard_reason.
+    load_warnings holds the warning lines printed while loading the input
+    files, so a run taken from the result cache can print them again.
+    """
+    results: Dict[str, Dict[str, pd.DataFrame]]
+    final: pd.DataFrame
+    discarded: pd.DataFrame
+    ideas_count: int
+    requesting_areas_count: int
+    revenue_streams_count: int
+    queue_counts: Dict[str, int]
+    final_queue_counts: Dict[str, int]
+    discarded_reasons: Dict[str, int]
+    queue_methods: Dict[str, str] = field(default_factory=dict)
+    default_method: str = "sainte-lague"
+    all_methods: bool = False
+    load_warnings: List[str] = field(default_factory=list)
+
+    def statistics(self) -> Dict:
+        """Return the run statistics in the layout of metadata.json."""
+        return {
+            "total_ideas": self.ideas_count,
+            "total_requesting_areas": self.requesting_areas_count,
+            "total_revenue_streams": self.revenue_streams_count,
+            **self.queue_counts,
+            **self.final_queue_counts,
+            "generated_rows": len(self.final),
+            "discarded_rows": int(self.discarded.shape[0]),
+            "discarded_reasons": dict(self.discarded_reasons),
+        }
+
+    def summary(self) -> Dict:
+        """Return the run summary reported by DemandService.prioritize."""
+        return {
+            "ideas_count": self.ideas_count,
+            "requesting_areas_count": self.requesting_areas_count,
+            "revenue_streams_count": self.revenue_streams_count,
+            "queue_counts": dict(self.queue_counts),
+            "final_queue_counts": dict(self.final_queue_counts),
+            "generated_rows": len(self.final),
+            "discarded_rows": int(self.discarded.shape[0]),
+            "discarded_reasons": dict(self.discarded_reasons),
+            "methods_executed": list(self.results.keys()),
+            "queue_methods": dict(self.queue_methods),
+            "default_method": self.default_method,
+            "all_methods": self.all_methods,
+        }
 
 
 class DemandService:
@@ -25,9 +100,21 @@ class DemandService:
 
     def __init__(self, config: Optional[str] = None):
         self.config = config
-        self.loader = Loader(config)
-        self.prioritizer = Prioritizer(config)
-        self.exporter = Exporter(config)
+        # Parsed once per process and shared by every component
+        self.compiled_config = get_config(config)
+        self.loader = Loader(config=self.compiled_config)
+        self.prioritizer = Prioritizer(config=self.compiled_config)
+        self.exporter = Exporter(config=self.compiled_config)
+        # Independent pipeline stages run concurrently only when enabled
+        performance = self.compiled_config.raw.get("performance", {})
+        self.pipeline_workers = 1
+        if performance.get("parallel_processing", False):
+            self.pipeline_workers = max(1, int(performance.get("pipeline_workers", 4)))
+        # Whole-run result cache (see result_cache.py)
+        self.result_cache_enabled = bool(performance.get("result_cache", True))
+        self.result_cache_entries = max(1, int(performance.get("result_cache_entries", 8)))
+        self.result_cache_dir = performance.get("result_cache_dir")
+        self.result_cache_max_bytes = int(float(performance.get("result_cache_max_mb", 512)) * 1024 * 1024)
 
     def prioritize(
         self,
@@ -42,104 +129,350 @@ class DemandService:
         next_method: Optional[str] = None,
         later_method: Optional[str] = None,
         include_discarded: bool = False,
+        output_formats: Optional[List[str]] = None,
+        delta: bool = False,
+        previous_dir: Optional[str] = None,
+        demand_layout: Optional[str] = None,
     ) -> Dict:
-        """Execute full prioritization with optional per-queue methods."""
+        """
+        Execute full prioritization with optional per-queue methods.
+
+        With delta, the previous run's demand.csv (read from previous_dir, by
+        default output_dir, before it is overwritten) is compared with this
+        run and the new, removed and moved IDEAs are written to
+        demand_delta.csv. demand_layout ('long' or 'wide') overrides
+        output.demand_layout for all-methods runs.
+
+        The run is a pipeline of stages (load, one ranking stage per method,
+        discard accounting, exports); with performance.parallel_processing
+        independent stages run concurrently. The result's 'pipeline' entry
+        holds each stage's wall time and the critical path. A run already
+        computed for identical inputs, config and methods is taken from the
+        result cache and only exported.
+        """
         start_time = time.time()
 
-        queue_methods = {}
-        if now_method:
-            queue_methods["NOW"] = now_method.lower()
-        if next_method:
-            queue_methods["NEXT"] = next_method.lower()
-        if later_method:
-            queue_methods["LATER"] = later_method.lower()
+        inputs = {
+            "ideas": ideas,
+            "ra_weights": ra_weights,
+            "rs_weights": rs_weights,
+            "bg_rs_weights": bg_rs_weights,
+        }
+        run_stages, values = self._file_run_stages(
+            inputs,
+            method=method,
+            all_methods=all_methods,
+            now_method=now_method,
+            next_method=next_method,
+            later_method=later_method,
+        )
+        pipeline = Pipeline([
+            *run_stages,
+            *self._export_stages(
+                "run",
+                output_dir,
+                inputs=inputs,
+                include_discarded=include_discarded,
+                output_formats=output_formats,
+                delta=delta,
+                previous_dir=previous_dir,
+                demand_layout=demand_layout,
+            ),
+        ])
+        result = pipeline.run(values, max_workers=self.pipeline_workers)
 
-        default_method = method.lower() if method else "sainte-lague"
+        return {
+            "elapsed_time": time.time() - start_time,
+            **result.outputs["run"].summary(),
+            "output_directory": output_dir,
+            "delta": self._delta_counts(result.outputs.get("delta")),
+            "pipeline": result.report(),
+        }
+
+    def prioritize_frames(
+        self,
+        ideas: pd.DataFrame,
+        ra_weights: pd.DataFrame,
+        rs_weights: pd.DataFrame,
+        bg_rs_weights: pd.DataFrame,
+        method: str = "sainte-lague",
+        all_methods: bool = False,
+        now_method: Optional[str] = None,
+        next_method: Optional[str] = None,
+        later_method: Optional[str] = None,
+    ) -> PrioritizationRun:
+        """
+        Execute full prioritization on in-memory frames, without any file I/O.
+
+        The frames get the same normalization and validation as the input
+        files of prioritize. Call export_run to write the result.
 
-        ideas_df, ra_weights_df, rs_weights_df, bg_rs_weights_df = self.loader.load_all(
+        Returns:
+            PrioritizationRun with the result frames and statistics
+
+        Raises:
+            DataLoadError: If validation fails
+        """
+        ideas_df, ra_weights_df, rs_weights_df, bg_rs_weights_df = self.loader.load_frames(
             ideas, ra_weights, rs_weights, bg_rs_weights
         )
+        return self._run(
+            ideas_df, ra_weights_df, rs_weights_df, bg_rs_weights_df,
+            method=method,
+            all_methods=all_methods,
+            now_method=now_method,
+            next_method=next_method,
+            later_method=later_method,
+        )
+
+    def export_run(
+        self,
+        run: PrioritizationRun,
+        output_dir: str,
+        inputs: Optional[Dict[str, str]] = None,
+        include_discarded: bool = False,
+        output_formats: Optional[List[str]] = None,
+        delta: bool = False,
+        previous_dir: Optional[str] = None,
+        demand_layout: Optional[str] = None,
+    ) -> Optional[Dict[str, int]]:
+        """
+        Write a prioritization run to an output directory.
+
+        Args:
+            run: Result of prioritize_frames (or prioritize's own run)
+            output_dir: Output directory
+            inputs: Input file paths by kind, recorded (with fingerprints)
+                in metadata.json when the run was loaded from files
+            include_discarded: Also write discarded_ideas.csv
+            output_formats: Output formats; defaults to output.formats
+            delta: Also write demand_delta.csv against the previous run
+            previous_dir: Directory of the previous run (default output_dir)
+            demand_layout: Layout of demand.csv; defaults to output.demand_layout
+
+        Returns:
+            New/removed/moved counts when a delta was written, else None
+        """
+        pipeline = Pipeline(self._export_stages(
+            "run",
+            output_dir,
+            inputs=inputs,
+            include_discarded=include_discarded,
+            output_formats=output_formats,
+            delta=delta,
+            previous_dir=previous_dir,
+            demand_layout=demand_layout,
+        ))
+        result = pipeline.run({"run": run}, max_workers=self.pipeline_workers)
+        return self._delta_counts(result.outputs.get("delta"))
+
+    def _run(
+        self,
+        ideas_df: pd.DataFrame,
+        ra_weights_df: pd.DataFrame,
+        rs_weights_df: pd.DataFrame,
+        bg_rs_weights_df: pd.DataFrame,
+        method: str = "sainte-lague",
+        all_methods: bool = False,
+        now_method: Optional[str] = None,
+        next_method: Optional[str] = None,
+        later_method: Optional[str] = None,
+    ) -> PrioritizationRun:
+        """Prioritize validated inputs and collect the run statistics."""
+        pipeline = Pipeline(self._run_stages(
+            "inputs",
+            method=method,
+            all_methods=all_methods,
+            now_method=now_method,
+            next_method=next_method,
+            later_method=later_method,
+        ))
+        result = pipeline.run(
+            {"inputs": (ideas_df, ra_weights_df, rs_weights_df, bg_rs_weights_df)},
+            max_workers=self.pipeline_workers,
+        )
+        return result.outputs["run"]
 
+    def _run_stages(
+        self,
+        source: str,
+        method: str = "sainte-lague",
+        all_methods: bool = False,
+        now_method: Optional[str] = None,
+        next_method: Optional[str] = None,
+        later_method: Optional[str] = None,
+    ) -> List[Stage]:
+        """
+        Stages that rank the validated inputs and build the 'run' output.
+
+        Args:
+            source: Stage (or provided value) holding the validated
+                (ideas, ra_weights, rs_weights, bg_rs_weights) frames
+        """
+        queue_methods = self._queue_methods(now_method, next_method, later_method)
+        default_method = method.lower() if method else "sainte-lague"
+
+        # One ranking stage per result; all-methods runs rank each method independently
         if all_methods:
-            results = self.prioritizer.prioritize_all_methods_with_queues(
-                ideas_df, ra_weights_df, rs_weights_df, bg_rs_weights_df
-            )
-            final_df = pd.concat(
-                [method_results["level3"] for method_results in results.values()],
-                ignore_index=True,
-            )
+            rankers = {name: partial(self._rank_method, name) for name in self.prioritizer.METHODS}
         else:
-            combined_result = self.prioritizer.prioritize_with_queues(
-                ideas_df,
-                ra_weights_df,
-                rs_weights_df,
-                bg_rs_weights_df,
-                queue_methods=queue_methods,
-                default_method=default_method,
-            )
-
             result_name = "mixed" if queue_methods else default_method
-            results = {
-                result_name: {
-                    "level2": combined_result[combined_result["Queue"] != "PRODUCTION"].copy(),
-                    "level3": combined_result,
-                }
-            }
-            final_df = combined_result
+            rankers = {result_name: partial(self._rank_queues, queue_methods, default_method)}
+        rank_stages = [Stage(f"rank:{name}", ranker, (source,)) for name, ranker in rankers.items()]
+
+        return [
+            *rank_stages,
+            Stage("results", partial(self._collect_results, list(rankers)), tuple(stage.name for stage in rank_stages)),
+            Stage("discarded", self._discarded_from_results, (source, "results")),
+            Stage(
+                "run",
+                partial(self._summarize_run, queue_methods, default_method, all_methods),
+                (source, "results", "discarded"),
+            ),
+        ]
+
+    @staticmethod
+    def _queue_methods(
+        now_method: Optional[str], next_method: Optional[str], later_method: Optional[str]
+    ) -> Dict[str, str]:
+        queue_methods = {}
+        if now_method:
+            queue_methods["NOW"] = now_method.lower()
+        if next_method:
+            queue_methods["NEXT"] = next_method.lower()
+        if later_method:
+            queue_methods["LATER"] = later_method.lower()
+        return queue_methods
 
-        # Build final combined level3 output (including all methods in all_methods mode)
-        if all_methods:
-            final_df = pd.concat(
-                [method_results["level3"] for method_results in results.values()],
-                ignore_index=True,
+    def _file_run_stages(
+        self,
+        inputs: Dict[str, str],
+        method: str = "sainte-lague",
+        all_methods: bool = False,
+        now_method: Optional[str] = None,
+        next_method: Optional[str] = None,
+        later_method: Optional[str] = None,
+    ) -> Tuple[List[Stage], Dict]:
+        """
+        Stages that load the input files and build the 'run' output.
+
+        On a result cache hit no stage is needed: the cached run's loader
+        warnings are printed again and the run is returned as a provided
+        value. On a miss a 'store' stage caches the new run with the
+        warnings printed while loading.
+
+        Args:
+            inputs: Input file paths by kind (ideas, ra_weights, rs_weights, bg_rs_weights)
+
+        Returns:
+            (stages, values) to build and run the pipeline with
+        """
+        paths = [inputs[kind] for kind in ("ideas", "ra_weights", "rs_weights", "bg_rs_weights")]
+        cache_key = None
+        if self.result_cache_enabled:
+            cache_key = combined_key(
+                [*paths, self.compiled_config.path],
+                "run",
+                RESULT_CACHE_VERSION,
+                pd.__version__,
+                method.lower() if method else "sainte-lague",
+                bool(all_methods),
+                sorted(self._queue_methods(now_method, next_method, later_method).items()),
             )
-        else:
-            final_df = combined_result
-
-        # Track items dropped and reasons
-        ideas_with_ra = ideas_df.copy()
-        ra_keys = set(zip(ra_weights_df["RevenueStream"], ra_weights_df["RequestingArea"]))
-        ideas_with_ra["has_ra_weight"] = ideas_with_ra.apply(
-            lambda r: (r["RevenueStream"], r["RequestingArea"]) in ra_keys,
-            axis=1,
+            cached = result_cache.get(cache_key, self.result_cache_dir)
+            if cached is not None:
+                print("  ✓ Inputs unchanged since a cached run; reusing its results")
+                for line in cached.load_warnings:
+                    print(line)
+                return [], {"run": cached}
+
+        load_warnings: List[str] = []
+        stages = [
+            Stage("inputs", partial(self._load_inputs, paths, load_warnings)),
+            *self._run_stages(
+                "inputs",
+                method=method,
+                all_methods=all_methods,
+                now_method=now_method,
+                next_method=next_method,
+                later_method=later_method,
+            ),
+        ]
+        if cache_key is not None:
+            stages.append(Stage("store", partial(self._store_run, cache_key, load_warnings), ("run",)))
+        return stages, {}
+
+    def _load_inputs(self, paths: List[str], load_warnings: List[str]) -> Tuple[pd.DataFrame, ...]:
+        """Load the input files, adding the warning lines printed to load_warnings."""
+        with self.loader.collect_warnings() as lines:
+            frames = self.loader.load_all(*paths)
+        load_warnings.extend(lines)
+        return frames
+
+    def _store_run(self, cache_key: str, load_warnings: List[str], run: PrioritizationRun) -> None:
+        result_cache.put(
+            cache_key,
+            replace(run, load_warnings=list(load_warnings)),
+            max_entries=self.result_cache_entries,
+            cache_dir=self.result_cache_dir,
+            max_bytes=self.result_cache_max_bytes,
         )
 
-        accepted_ids = set(final_df["ID"].astype(str))
-        discarded_df = ideas_with_ra[~ideas_with_ra["ID"].astype(str).isin(accepted_ids)].copy()
+    def _rank_method(self, method: str, frames: Tuple[pd.DataFrame, ...]) -> Dict[str, pd.DataFrame]:
+        return self.prioritizer.prioritize_method_with_queues(*frames, method)
 
-        def get_discard_reason(r):
-            if r["PriorityRA"] == 999:
-                return "priority_ra_999"
-            if r["Queue"] == "UNKNOWN":
-                return "unknown_queue"
-            if not r["has_ra_weight"]:
-                return "missing_ra_weights"
-            return "other"
+    def _rank_queues(
+        self, queue_methods: Dict[str, str], default_method: str, frames: Tuple[pd.DataFrame, ...]
+    ) -> Dict[str, pd.DataFrame]:
+        combined_result = self.prioritizer.prioritize_with_queues(
+            *frames,
+            queue_methods=queue_methods,
+            default_method=default_method,
+        )
+        return {
+            "level2": combined_result[combined_result["Queue"] != "PRODUCTION"].copy(),
+            "level3": combined_result,
+        }
 
-        discarded_df["discard_reason"] = discarded_df.apply(get_discard_reason, axis=1)
+    @staticmethod
+    def _collect_results(names: List[str], *ranked: Dict[str, pd.DataFrame]) -> Tuple[Dict, pd.DataFrame]:
+        """Return the results by name and every result's Level 3 rows combined."""
+        results = dict(zip(names, ranked))
+        if len(results) == 1:
+            return results, ranked[0]["level3"]
+        # Combined level3 output (all methods), built once and reused downstream
+        final_df = pd.concat([method_results["level3"] for method_results in ranked], ignore_index=True)
+        return results, final_df
+
+    def _discarded_from_results(self, frames: Tuple[pd.DataFrame, ...], collected: Tuple[Dict, pd.DataFrame]) -> pd.DataFrame:
+        ideas_df, ra_weights_df = frames[0], frames[1]
+        return self._discarded_ideas(ideas_df, ra_weights_df, collected[1])
+
+    @staticmethod
+    def _summarize_run(
+        queue_methods: Dict[str, str],
+        default_method: str,
+        all_methods: bool,
+        frames: Tuple[pd.DataFrame, ...],
+        collected: Tuple[Dict, pd.DataFrame],
+        discarded_df: pd.DataFrame,
+    ) -> PrioritizationRun:
+        """Collect the run statistics into a PrioritizationRun."""
+        ideas_df = frames[0]
+        results, final_df = collected
 
         discarded_reasons = discarded_df["discard_reason"].value_counts().to_dict()
-        for key in ["priority_ra_999", "unknown_queue", "missing_ra_weights", "other"]:
+        for key in DISCARD_REASONS:
             discarded_reasons.setdefault(key, 0)
 
         queue_stats = {}
-        final_queue_stats = {}
-
         if "Queue" in ideas_df.columns:
+            input_queue_counts = ideas_df["Queue"].value_counts()
             for queue_name in ["NOW", "NEXT", "LATER", "PRODUCTION"]:
-                queue_stats[f"{queue_name.lower()}_queue"] = len(
-                    ideas_df[ideas_df["Queue"] == queue_name]
-                )
+                queue_stats[f"{queue_name.lower()}_queue"] = int(input_queue_counts.get(queue_name, 0))
 
         # Determine final queue counts after prioritization and filtering
-        if all_methods:
-            all_level3 = pd.concat(
-                [meth_results["level3"] for meth_results in results.values()],
-                ignore_index=True,
-            )
-            final_queue_counts = all_level3["Queue"].value_counts().to_dict()
-        else:
-            final_queue_counts = combined_result["Queue"].value_counts().to_dict()
+        final_queue_counts = final_df["Queue"].value_counts().to_dict()
 
         final_queue_stats = {
             "now_queue": int(final_queue_counts.get("NOW", 0)),
@@ -148,51 +481,110 @@ class DemandService:
             "production_queue": int(final_queue_counts.get("PRODUCTION", 0)),
         }
 
-        execution_params = {
-            "input_files": {
-                "ideas": ideas,
-                "ra_weights": ra_weights,
-                "rs_weights": rs_weights,
-                "bg_rs_weights": bg_rs_weights,
-            },
-            "output_directory": output_dir,
-            "methods_executed": list(results.keys()),
-            "queue_mode": "sequential",
-            "queue_methods": queue_methods if queue_methods else None,
-            "default_method": default_method,
-            "statistics": {
-                "total_ideas": len(ideas_df),
-                "total_requesting_areas": ideas_df["RequestingArea"].nunique(),
-                "total_revenue_streams": ideas_df["RevenueStream"].nunique(),
-                **queue_stats,
-                **final_queue_stats,
-                "generated_rows": len(final_df),
-                "discarded_rows": int(discarded_df.shape[0]),
-                "discarded_reasons": discarded_reasons,
-            },
-        }
-
-        self.exporter.export_all(results, output_dir, execution_params)
-
-        if include_discarded:
-            self.exporter.export_discarded(discarded_df, output_dir)
+        return PrioritizationRun(
+            results=results,
+            final=final_df,
+            discarded=discarded_df,
+            ideas_count=len(ideas_df),
+            requesting_areas_count=ideas_df["RequestingArea"].nunique(),
+            revenue_streams_count=ideas_df["RevenueStream"].nunique(),
+            queue_counts=queue_stats,
+            final_queue_counts=final_queue_stats,
+            discarded_reasons=discarded_reasons,
+            queue_methods=queue_methods,
+            default_method=default_method,
+            all_methods=all_methods,
+        )
 
-        return {
-            "elapsed_time": time.time() - start_time,
-            "ideas_count": len(ideas_df),
-            "requesting_areas_count": ideas_df["RequestingArea"].nunique(),
-            "revenue_streams_count": ideas_df["RevenueStream"].nunique(),
-            "queue_counts": queue_stats,
-            "final_queue_counts": final_queue_stats,
-            "generated_rows": len(final_df),
-            "discarded_rows": int(discarded_df.shape[0]),
-            "discarded_reasons": discarded_reasons,
-            "methods_executed": list(results.keys()),
+    def _export_stages(
+        self,
+        source: str,
+        output_dir: str,
+        inputs: Optional[Dict[str, str]] = None,
+        include_discarded: bool = False,
+        output_formats: Optional[List[str]] = None,
+        delta: bool = False,
+        previous_dir: Optional[str] = None,
+        demand_layout: Optional[str] = None,
+    ) -> List[Stage]:
+        """
+        Stages that write the run held by source (see export_run).
+
+        The previous demand.csv is read before the results are exported, as
+        the export overwrites it; discarded IDEAs and the delta are written
+        by the same export, so metadata.json lists them among the artifacts.
+        """
+        stages = []
+        export_inputs = (source,)
+        if delta:
+            previous_dir = previous_dir or output_dir
+            stages += [
+                Stage("previous", partial(self._read_previous_demand, previous_dir)),
+                Stage("delta", partial(self._delta_frame, previous_dir), ("previous", source)),
+            ]
+            export_inputs = (source, "delta")
+
+        stages.append(Stage(
+            "export",
+            partial(self._export_results, output_dir, inputs, output_formats, demand_layout, include_discarded),
+            export_inputs,
+        ))
+        return stages
+
+    def _delta_frame(
+        self, previous_dir: str, previous_df: Optional[pd.DataFrame], run: PrioritizationRun
+    ) -> Optional[pd.DataFrame]:
+        if previous_df is None:
+            print(f"    ! No previous demand.csv in {previous_dir}; delta skipped")
+            return None
+        return self.exporter.delta_frame(previous_df, run.final)
+
+    def _delta_counts(self, delta_df: Optional[pd.DataFrame]) -> Optional[Dict[str, int]]:
+        """Return the new/removed/moved counts of a delta, or None without one."""
+        if delta_df is None:
+            return None
+        counts = delta_df["Change"].value_counts()
+        return {change: int(counts.get(change, 0)) for change in self.exporter.DELTA_CHANGES}
+
+    def _export_results(
+        self,
+        output_dir: str,
+        inputs: Optional[Dict[str, str]],
+        output_formats: Optional[List[str]],
+        demand_layout: Optional[str],
+        include_discarded: bool,
+        run: PrioritizationRun,
+        delta_df: Optional[pd.DataFrame] = None,
+    ) -> None:
+        execution_params = {}
+        if inputs:
+            execution_params["input_files"] = dict(inputs)
+            execution_params["input_fingerprints"] = fingerprint_inputs({
+                **inputs,
+                "config": self.compiled_config.path,
+            })
+        execution_params.update({
             "output_directory": output_dir,
-            "queue_methods": queue_methods,
-            "default_method": default_method,
-            "all_methods": all_methods,
-        }
+            "methods_executed": list(run.results.keys()),
+            "queue_mode": "sequential",
+            "queue_methods": run.queue_methods if run.queue_methods else None,
+            "default_method": run.default_method,
+            "statistics": run.statistics(),
+        })
+        delta_counts = self._delta_counts(delta_df)
+        if delta_counts is not None:
+            execution_params["statistics"]["delta"] = delta_counts
+
+        self.exporter.export_all(
+            run.results,
+            output_dir,
+            execution_params,
+            formats=output_formats,
+            layout=demand_layout,
+            combined=run.final,
+            discarded=run.discarded if include_discarded else None,
+            delta=delta_df,
+        )
 
     def prioritize_rs(
         self,
@@ -200,12 +592,19 @@ class DemandService:
         ra_weights: str,
         output: str,
         method: str = "sainte-lague",
+        output_formats: Optional[List[str]] = None,
     ) -> Dict:
-        """Execute Level 2 prioritization only."""
+        """
+        Execute Level 2 prioritization only.
+
+        With 'columnar' in output_formats a typed binary artifact is written
+        next to the CSV; prioritize_global reads it instead of re-parsing the
+        CSV while it is up to date.
+        """
         ideas_df = self.loader.load_ideas(ideas)
         ra_weights_df = self.loader.load_ra_weights(ra_weights)
         result = self.prioritizer.prioritize_level2(ideas_df, ra_weights_df, method)
-        self.exporter.export_rs_prioritization(result, output)
+        self.exporter.export_rs_prioritization(result, output, formats=output_formats)
         return {"output": output, "count": len(result)}
 
     def prioritize_global(
@@ -216,13 +615,7 @@ class DemandService:
         method: str = "sainte-lague",
     ) -> Dict:
         """Execute Level 3 prioritization only."""
-        csv_delimiter, decimal_separator, csv_encoding = self._resolve_locale_settings()
-        rs_df = pd.read_csv(
-            rs_prioritized,
-            sep=csv_delimiter,
-            decimal=decimal_separator,
-            encoding=csv_encoding,
-        )
+        rs_df = self._read_result(rs_prioritized)
         rs_weights_df = self.loader.load_rs_weights(rs_weights)
         result = self.prioritizer.prioritize_level3(rs_df, rs_weights_df, method)
         self.exporter.export_demand(result, output)
@@ -238,15 +631,20 @@ class DemandService:
         top_n: Optional[int] = None,
     ) -> Dict:
         """Compare all methods and export report."""
-        ideas_df, ra_weights_df, rs_weights_df, bg_rs_weights_df = self.loader.load_all(
-            ideas, ra_weights, rs_weights, bg_rs_weights
-        )
-        # Use the same queue-based flow as full prioritization exports so
-        # method ranks in compare.csv match demand_<method>.csv files.
-        results = self.prioritizer.prioritize_all_methods_with_queues(
-            ideas_df, ra_weights_df, rs_weights_df, bg_rs_weights_df
+        # Use the same queue-based all-methods run as full prioritization
+        # (and its cached result) so method ranks in compare.csv match
+        # demand_<method>.csv files.
+        run_stages, values = self._file_run_stages(
+            {
+                "ideas": ideas,
+                "ra_weights": ra_weights,
+                "rs_weights": rs_weights,
+                "bg_rs_weights": bg_rs_weights,
+            },
+            all_methods=True,
         )
-        comparison = self.prioritizer.compare_methods(results, top_n)
+        run = Pipeline(run_stages).run(values, max_workers=self.pipeline_workers).outputs["run"]
+        comparison = self.prioritizer.compare_methods(run.results, top_n)
         self.exporter.export_comparison_report(comparison, output)
         return {"output": output, "count": len(comparison), "comparison": comparison}
 
@@ -260,6 +658,131 @@ class DemandService:
             "average_size": ideas_df["Size"].mean(),
         }
 
+    def quick_check(
+        self,
+        tier: int,
+        ideas: Optional[str] = None,
+        ra_weights: Optional[str] = None,
+        rs_weights: Optional[str] = None,
+        bg_rs_weights: Optional[str] = None,
+    ) -> Dict:
+        """
+        Run a single quick-check tier on the given input files.
+
+        Tier 0 checks headers only, tier 1 checks enum and range rules of
+        each file on its own, and tier 2 is the full cross-file validation
+        (all four files required). Each tier runs independently so callers
+        can show fast feedback before requesting a more expensive tier.
+        """
+        start_time = time.perf_counter()
+        inputs = {
+            "ideas": ideas,
+            "ra_weights": ra_weights,
+            "rs_weights": rs_weights,
+            "bg_rs_weights": bg_rs_weights,
+        }
+        provided = {kind: path for kind, path in inputs.items() if path}
+        if not provided:
+            raise ValueError("At least one input file is required")
+
+        files = {}
+        summary = None
+        if tier in (0, 1):
+            check = self.loader.check_header if tier == 0 else self.loader.check_rows
+            for kind, path in provided.items():
+                result = check(path, kind)
+                files[kind] = {
+                    "is_valid": result.is_valid,
+                    "errors": result.errors,
+                    "warnings": result.warnings,
+                }
+        elif tier == 2:
+            missing = [kind for kind in inputs if kind not in provided]
+            if missing:
+                raise ValueError(f"Tier 2 requires every input file (missing: {', '.join(missing)})")
+            try:
+                summary = self.validate(ideas, ra_weights, rs_weights, bg_rs_weights)
+                files["inputs"] = {"is_valid": True, "errors": [], "warnings": []}
+            except DataLoadError as exc:
+                files["inputs"] = {"is_valid": False, "errors": [str(exc)], "warnings": []}
+        else:
+            raise ValueError(f"Unknown quick-check tier: {tier}")
+
+        return {
+            "tier": tier,
+            "is_valid": all(result["is_valid"] for result in files.values()),
+            "elapsed_ms": (time.perf_counter() - start_time) * 1000,
+            "files": files,
+            "summary": summary,
+        }
+
+    def _read_result(self, path: str) -> pd.DataFrame:
+        """Read an exported result, preferring its up-to-date columnar artifact."""
+        columnar = find_columnar(path)
+        if columnar:
+            return read_columnar(columnar)
+        csv_delimiter, decimal_separator, csv_encoding = self._resolve_locale_settings()
+        return pd.read_csv(
+            path,
+            compression=detect_compression(path),
+            sep=csv_delimiter,
+            decimal=decimal_separator,
+            encoding=csv_encoding,
+        )
+
+    @staticmethod
+    def _discarded_ideas(
+        ideas_df: pd.DataFrame, ra_weights_df: pd.DataFrame, final_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Return the IDEAs missing from the final result, with a discard_reason.
+
+        Reasons are checked in DISCARD_REASONS order; the first that applies wins.
+        """
+        accepted = ideas_df["ID"].astype(str).isin(final_df["ID"].astype(str).unique())
+        discarded_df = ideas_df[~accepted].copy()
+
+        ra_keys = pd.MultiIndex.from_arrays([ra_weights_df["RevenueStream"], ra_weights_df["RequestingArea"]])
+        has_ra_weight = pd.MultiIndex.from_arrays(
+            [discarded_df["RevenueStream"], discarded_df["RequestingArea"]]
+        ).isin(ra_keys)
+        unknown_queue = (
+            (discarded_df["Queue"] == "UNKNOWN").to_numpy(dtype=bool)
+            if "Queue" in discarded_df.columns
+            else np.zeros(len(discarded_df), dtype=bool)
+        )
+
+        discarded_df["discard_reason"] = np.select(
+            [
+                (discarded_df["PriorityRA"] == 999).to_numpy(dtype=bool),
+                unknown_queue,
+                ~has_ra_weight,
+            ],
+            list(DISCARD_REASONS[:3]),
+            default=DISCARD_REASONS[3],
+        )
+        return discarded_df
+
+    def _read_previous_demand(self, directory: str, name: str = "demand.csv") -> Optional[pd.DataFrame]:
+        """Read the combined demand.csv of an earlier run, or None if there is none."""
+        path = os.path.join(directory, name)
+        candidates = [path] + [path + suffix for suffix in SUFFIXES.values()]
+        if find_columnar(path) is None:
+            existing = [candidate for candidate in candidates if os.path.exists(candidate)]
+            if not existing:
+                return None
+            path = existing[0]
+        previous = self._read_result(path)
+        if "Method" in previous.columns:
+            return previous
+
+        # Wide layout: one GlobalRank_<method> column per method; the
+        # per-method demand_<method>.csv files hold the same results by row
+        methods = [col[len("GlobalRank_"):] for col in previous.columns if col.startswith("GlobalRank_")]
+        frames = [self._read_previous_demand(directory, f"demand_{method}.csv") for method in methods]
+        frames = [frame for frame in frames if frame is not None]
+        return pd.concat(frames, ignore_index=True) if frames else None
+
     def _resolve_locale_settings(self) -> tuple[str, str, str]:
         """Read locale CSV settings from the already-loaded configuration."""
         locale = self.loader.config.get("locale", {})
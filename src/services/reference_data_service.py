@@ -4,26 +4,46 @@ from __future__ import annotations
 
 import os
 import tempfile
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
-import yaml
+
+try:
+    from ..columnar import find_columnar, read_columnar
+    from ..compression import detect_compression
+    from ..config_registry import DEFAULT_CONFIG_PATH, get_config
+    from ..loader import Loader
+    from ..row_validation import GroupAggregates, aggregate_cache, detect_kind, validate_row
+    from ..validator import Validator
+except ImportError:
+    from columnar import find_columnar, read_columnar
+    from compression import detect_compression
+    from config_registry import DEFAULT_CONFIG_PATH, get_config
+    from loader import Loader
+    from row_validation import GroupAggregates, aggregate_cache, detect_kind, validate_row
+    from validator import Validator
 
 
 class ReferenceDataService:
     """Manages CRUD-like operations for CSV reference data."""
 
     def __init__(self, config_path: Optional[str] = None):
-        self.config_path = config_path or self._default_config_path()
-        with open(self.config_path, "r") as cfg_file:
-            cfg = yaml.safe_load(cfg_file)
+        self.config_path = config_path or DEFAULT_CONFIG_PATH
+        self.compiled_config = get_config(self.config_path)
+        cfg = self.compiled_config.raw
         locale = cfg.get("locale", {})
         self.csv_delimiter = locale.get("csv_delimiter", ";")
         self.decimal_separator = locale.get("decimal_separator", ",")
         self.csv_encoding = locale.get("csv_encoding", "utf-8-sig")
+        self.column_aliases = {
+            **Loader.DEFAULT_COLUMN_ALIASES,
+            **cfg.get("input", {}).get("column_aliases", {}),
+        }
+        self.validator = Validator(config=self.compiled_config)
 
     def read_rows(self, path: str, limit: Optional[int] = None, offset: int = 0) -> Dict:
-        df = self._read_csv(path)
+        columnar = find_columnar(path)
+        df = read_columnar(columnar) if columnar else self._read_csv(path)
         total = len(df)
         if offset < 0:
             offset = 0
@@ -38,7 +58,7 @@ class ReferenceDataService:
         self._write_csv_atomic(df, path)
         return {"path": path, "count": len(df)}
 
-    def upsert_row(self, path: str, key_column: str, row: Dict) -> Dict:
+    def upsert_row(self, path: str, key_column: str, row: Dict, strict: bool = False) -> Dict:
         if key_column not in row:
             raise ValueError(f"Missing key column '{key_column}' in row payload.")
 
@@ -47,9 +67,12 @@ class ReferenceDataService:
         if key_column not in df.columns:
             raise ValueError(f"Key column '{key_column}' not found in CSV.")
 
+        aggregates, canonical = self._group_aggregates(path, df)
+        old_row = None
         mask = df[key_column].astype(str) == str(key_value)
         if mask.any():
             idx = df.index[mask][0]
+            old_row = df.loc[idx].to_dict()
             for column, value in row.items():
                 if column in df.columns:
                     df.at[idx, column] = value
@@ -62,22 +85,40 @@ class ReferenceDataService:
                 if column not in df.columns:
                     df[column] = None
             df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
+            idx = df.index[-1]
             action = "created"
 
+        errors, warnings = self._check_mutation(
+            aggregates, canonical, [old_row] if old_row else [], df.loc[idx].to_dict()
+        )
+        if strict and errors:
+            raise ValueError(f"Row validation failed: {'; '.join(errors)}")
+
         self._write_csv_atomic(df, path)
-        return {"path": path, "action": action, "key": str(key_value)}
+        if aggregates is not None:
+            aggregate_cache.put(path, aggregates)
+        return {
+            "path": path,
+            "action": action,
+            "key": str(key_value),
+            "errors": errors,
+            "warnings": warnings,
+        }
 
     def delete_row(self, path: str, key_column: str, key_value: str) -> Dict:
         df = self._read_csv(path)
         if key_column not in df.columns:
             raise ValueError(f"Key column '{key_column}' not found in CSV.")
 
-        before = len(df)
-        df = df[df[key_column].astype(str) != str(key_value)]
-        after = len(df)
-        deleted = before - after
+        aggregates, canonical = self._group_aggregates(path, df)
+        mask = df[key_column].astype(str) == str(key_value)
+        deleted = int(mask.sum())
+        _, warnings = self._check_mutation(aggregates, canonical, df[mask].to_dict("records"), None)
+        df = df[~mask]
         self._write_csv_atomic(df, path)
-        return {"path": path, "deleted": deleted, "key": str(key_value)}
+        if aggregates is not None:
+            aggregate_cache.put(path, aggregates)
+        return {"path": path, "deleted": deleted, "key": str(key_value), "warnings": warnings}
 
     def list_requesting_areas(self, ideas_path: str, ra_weights_path: Optional[str] = None) -> Dict:
         ideas_df = self._read_csv(ideas_path)
@@ -129,11 +170,67 @@ class ReferenceDataService:
                 total_replaced += replaced
         return {"updated_files": updated_files, "replaced": total_replaced}
 
+    def _group_aggregates(
+        self, path: str, df: pd.DataFrame
+    ) -> Tuple[Optional[GroupAggregates], Dict[str, str]]:
+        """Return the pre-edit group aggregates of a file (None if not a reference file).
+
+        Aggregates come from row_validation.aggregate_cache, so ``df`` is only
+        scanned when the file changed since the last edit through this service.
+        """
+        canonical = self._canonical_columns(df.columns)
+        kind = detect_kind(canonical.values())
+        if kind is None:
+            return None, canonical
+        aggregates = aggregate_cache.get(path, kind)
+        if aggregates is None:
+            aggregates = GroupAggregates.from_frame(kind, df.rename(columns=canonical))
+        return aggregates, canonical
+
+    def _check_mutation(
+        self,
+        aggregates: Optional[GroupAggregates],
+        canonical: Dict[str, str],
+        old_rows: List[Dict],
+        new_row: Optional[Dict],
+    ) -> Tuple[List[str], List[str]]:
+        """Apply one edit to the aggregates; validate the new row and the touched groups."""
+        if aggregates is None:
+            return [], []
+
+        touched = []
+        for old_row in old_rows:
+            old_row = self._canonical_row(old_row, canonical)
+            aggregates.remove(old_row)
+            touched.append(aggregates.group_key(old_row))
+
+        errors = []
+        if new_row is not None:
+            new_row = self._canonical_row(new_row, canonical)
+            aggregates.add(new_row)
+            touched.append(aggregates.group_key(new_row))
+            errors = validate_row(self.validator, aggregates.kind, new_row)
+
+        return errors, aggregates.warnings(touched)
+
+    def _canonical_columns(self, columns) -> Dict[str, str]:
+        """Map raw CSV headers to canonical names, as the loader does."""
+        mapping = {}
+        for column in columns:
+            target = self.column_aliases.get(column)
+            mapping[column] = target if target and target not in columns else column
+        return mapping
+
+    @staticmethod
+    def _canonical_row(row: Dict, canonical: Dict[str, str]) -> Dict:
+        return {canonical.get(column, column): value for column, value in row.items()}
+
     def _read_csv(self, path: str) -> pd.DataFrame:
         if not os.path.exists(path):
             raise FileNotFoundError(f"File not found: {path}")
         return pd.read_csv(
             path,
+            compression=detect_compression(path),
             sep=self.csv_delimiter,
             decimal=self.decimal_separator,
             encoding=self.csv_encoding,
@@ -156,8 +253,3 @@ class ReferenceDataService:
         finally:
             if os.path.exists(temp_path):
                 os.remove(temp_path)
-
-    @staticmethod
-    def _default_config_path() -> str:
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        return os.path.join(base_dir, "config", "config.yaml")
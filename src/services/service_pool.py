@@ -0,0 +1,66 @@
+"""Process-wide pool of warm DemandService instances keyed by config path."""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Optional
+
+try:
+    from ..config_registry import get_config
+    from .demand_service import DemandService
+except ImportError:
+    from config_registry import get_config
+    from services.demand_service import DemandService
+
+
+class ServicePool:
+    """
+    Thread-safe cache of one DemandService per configuration file.
+
+    A DemandService keeps no per-call state (exports track their output
+    manifest per call), so a single instance serves concurrent requests.
+    An instance is rebuilt when its config.yaml changes on disk.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, DemandService] = {}
+        self._lock = threading.Lock()
+
+    def get(self, config_path: Optional[str] = None) -> DemandService:
+        """
+        Return the shared service for a configuration file.
+
+        Args:
+            config_path: Path to config.yaml. If None, uses default config.
+
+        Returns:
+            DemandService bound to the file's current configuration
+        """
+        compiled = get_config(config_path)
+        with self._lock:
+            service = self._entries.get(compiled.path)
+            if service is not None and self._stamp(service.compiled_config) == self._stamp(compiled):
+                return service
+
+            service = DemandService(config_path)
+            self._entries[compiled.path] = service
+            return service
+
+    @staticmethod
+    def _stamp(compiled) -> tuple:
+        # Concurrent first lookups may compile the same file twice; compare
+        # file versions rather than CompiledConfig identity
+        return (compiled.mtime_ns, compiled.size)
+
+    def clear(self) -> None:
+        """Drop every pooled service."""
+        with self._lock:
+            self._entries.clear()
+
+
+service_pool = ServicePool()
+
+
+def get_service(config_path: Optional[str] = None) -> DemandService:
+    """Return the pooled DemandService for a config.yaml path."""
+    return service_pool.get(config_path)
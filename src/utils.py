@@ -3,27 +3,6 @@ Utility functions for TOM Demand Management System.
 """
 
 from typing import Dict, List
-import hashlib
-
-
-def calculate_file_checksum(filepath: str) -> str:
-    """
-    Calculate MD5 checksum of a file.
-
-    Args:
-        filepath: Path to file
-
-    Returns:
-        MD5 checksum as hexadecimal string
-    """
-    md5_hash = hashlib.md5()
-
-    with open(filepath, 'rb') as f:
-        # Read file in chunks to handle large files
-        for chunk in iter(lambda: f.read(4096), b""):
-            md5_hash.update(chunk)
-
-    return md5_hash.hexdigest()
 
 
 def format_duration(seconds: float) -> str:
@@ -0,0 +1,103 @@
+"""
+Validation result cache for TOM Demand Management System.
+
+Reference files (RA, RS and BG/RS weights) rarely change, so their
+ValidationResult and normalized DataFrame are memoized under a key built
+from the file's content fingerprint and the configuration's fingerprint.
+Entries live in process memory and, optionally, in an on-disk directory
+shared by CLI runs and private to the current user (see cache_files.py).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+import os
+import threading
+import pandas as pd
+try:
+    from .cache_files import read_pickle, write_pickle
+    from .validator import ValidationResult
+except ImportError:
+    from cache_files import read_pickle, write_pickle
+    from validator import ValidationResult
+
+
+# Bump when the cached payload layout changes
+CACHE_FORMAT_VERSION = 3
+
+
+@dataclass(frozen=True)
+class CachedValidation:
+    """A validation outcome and the frame it produced (None if invalid)."""
+    result: ValidationResult
+    frame: Optional[pd.DataFrame]
+
+
+class ValidationCache:
+    """Thread-safe in-process cache with an optional on-disk pickle directory."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, CachedValidation] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, cache_dir: Optional[str] = None) -> Optional[CachedValidation]:
+        """
+        Look up a cached validation.
+
+        Args:
+            key: Cache key (see fingerprint.combined_key)
+            cache_dir: Optional on-disk cache directory to consult on a memory miss
+
+        Returns:
+            CachedValidation with a private copy of the frame, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None and cache_dir:
+            entry = self._read_disk(key, cache_dir)
+            if entry is not None:
+                with self._lock:
+                    self._entries[key] = entry
+
+        if entry is None:
+            return None
+        frame = entry.frame.copy() if entry.frame is not None else None
+        return CachedValidation(entry.result, frame)
+
+    def put(self, key: str, entry: CachedValidation, cache_dir: Optional[str] = None) -> None:
+        """
+        Store a validation outcome.
+
+        Args:
+            key: Cache key (see fingerprint.combined_key)
+            entry: Validation outcome; its frame is copied
+            cache_dir: Optional on-disk cache directory to also write to
+        """
+        frame = entry.frame.copy() if entry.frame is not None else None
+        entry = CachedValidation(entry.result, frame)
+        with self._lock:
+            self._entries[key] = entry
+        if cache_dir:
+            self._write_disk(key, entry, cache_dir)
+
+    def clear(self) -> None:
+        """Drop every in-process entry (on-disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _disk_path(key: str, cache_dir: str) -> str:
+        return os.path.join(cache_dir, f"validation-{key}.pkl")
+
+    def _read_disk(self, key: str, cache_dir: str) -> Optional[CachedValidation]:
+        payload = read_pickle(self._disk_path(key, cache_dir), cache_dir)
+        if not isinstance(payload, dict) or payload.get('version') != CACHE_FORMAT_VERSION:
+            return None
+        return CachedValidation(payload['result'], payload['frame'])
+
+    def _write_disk(self, key: str, entry: CachedValidation, cache_dir: str) -> None:
+        payload = {'version': CACHE_FORMAT_VERSION, 'result': entry.result, 'frame': entry.frame}
+        write_pickle(payload, self._disk_path(key, cache_dir), cache_dir)
+
+
+validation_cache = ValidationCache()
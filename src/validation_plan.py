@@ -0,0 +1,398 @@
+"""
+Declarative IDEAS validation plans for TOM Demand Management System.
+
+The IDEAS rules (required columns, nulls, unique IDs, allowed values,
+score ranges, MicroPhase list, PriorityRA sequencing, RA references) are
+declared as data, generated from config.yaml, and compiled once per
+configuration into a ValidationPlan. Running the plan scans each referenced
+column once (a single factorize for label columns, a single numeric view
+for scores) and evaluates every rule on that column against the shared
+scan, recording per-rule timings.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+import numpy as np
+import pandas as pd
+try:
+    from .config_registry import CompiledConfig
+except ImportError:
+    from config_registry import CompiledConfig
+
+
+IDEA_REQUIRED_COLUMNS = ['ID', 'Name', 'RequestingArea', 'RevenueStream', 'BudgetGroup', 'PriorityRA']
+
+# Per-rule cap on individually reported offending rows
+DEFAULT_MAX_ERRORS = 50
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    One declarative validation rule.
+
+    Attributes:
+        name: Unique rule name, used as the key of per-rule timings
+        check: Rule type ('required', 'not_null', 'unique', 'allowed',
+            'range', 'sequential' or 'reference')
+        error_class: Group of related rules; fail-fast stops after the
+            first class that produced errors
+        column: Column the rule applies to (None for 'required')
+        params: Check parameters (allowed values, bounds, message labels)
+        row_local: False for rules that need the whole file
+    """
+    name: str
+    check: str
+    error_class: str
+    column: Optional[str] = None
+    params: Mapping[str, Any] = field(default_factory=dict)
+    row_local: bool = True
+
+
+@dataclass
+class PlanOutcome:
+    """
+    Messages and per-rule timings (seconds) from running a plan.
+
+    error_rows runs parallel to errors: the index labels of the rows each
+    error is about (at most max_errors), empty for file-level errors.
+    """
+    errors: List[str]
+    warnings: List[str]
+    timings: Dict[str, float]
+    error_rows: List[List] = field(default_factory=list)
+
+    def add_error(self, message: str, rows: Iterable = ()) -> None:
+        """Append an error and the index labels of its offending rows."""
+        self.errors.append(message)
+        self.error_rows.append(list(rows))
+
+
+def build_idea_rules(config: CompiledConfig) -> Tuple[Rule, ...]:
+    """
+    Declare the IDEAS rules for a configuration, in reporting order.
+
+    Args:
+        config: Compiled configuration
+
+    Returns:
+        Tuple of rules
+    """
+    validation = config.raw.get('validation') or {}
+    rules = [Rule('required_columns', 'required', 'schema', params={'columns': tuple(IDEA_REQUIRED_COLUMNS)})]
+
+    rules += [Rule(f'not_null:{col}', 'not_null', 'nulls', column=col) for col in IDEA_REQUIRED_COLUMNS]
+
+    rules.append(Rule('unique:ID', 'unique', 'uniqueness', column='ID', row_local=False))
+
+    rules.append(Rule('allowed:RevenueStream', 'allowed', 'domain', column='RevenueStream', params={
+        'allowed': config.revenue_stream_set,
+        'listed': config.revenue_streams,
+        'messages': ("Invalid Revenue Stream values: {invalid}", "Valid values are: {listed}"),
+    }))
+    rules.append(Rule('allowed:BudgetGroup', 'allowed', 'domain', column='BudgetGroup', params={
+        'allowed': config.budget_group_set,
+        'listed': config.budget_groups,
+        'messages': ("Invalid Budget Group values: {invalid}", "Valid values are: {listed}"),
+    }))
+
+    rules.append(Rule('sequential:PriorityRA', 'sequential', 'sequencing', column='PriorityRA', row_local=False))
+
+    for col, range_key in (('Value', 'value_range'), ('Urgency', 'urgency_range'), ('Risk', 'risk_range')):
+        low, high = validation[range_key]
+        rules.append(Rule(f'range:{col}', 'range', 'range', column=col, params={
+            'low': low, 'high': high, 'detail': f"outside range {[low, high]}",
+        }))
+    size_min = validation['size_min']
+    rules.append(Rule('range:Size', 'range', 'range', column='Size', params={
+        'low': size_min, 'high': None, 'detail': f"must be >= {size_min}",
+    }))
+
+    # An empty valid_micro_phases list disables the MicroPhase check
+    rules.append(Rule('allowed:MicroPhase', 'allowed', 'domain', column='MicroPhase', params={
+        'allowed': config.valid_micro_phase_set,
+        'listed': config.valid_micro_phases,
+        'messages': ("Invalid MicroPhase values found: {invalid}. Valid phases: {listed}",),
+        'skip_if_empty': True,
+        'missing_warning': "MicroPhase column missing - will use default 'Backlog'",
+    }))
+
+    rules.append(Rule('reference:RequestingArea', 'reference', 'reference', column='RequestingArea', row_local=False))
+
+    return tuple(rules)
+
+
+@lru_cache(maxsize=32)
+def compile_idea_plan(config: CompiledConfig) -> 'ValidationPlan':
+    """
+    Return the IDEAS validation plan for a configuration, compiling it once.
+
+    Args:
+        config: Compiled configuration (cached by identity)
+
+    Returns:
+        ValidationPlan shared by every Validator using this configuration
+    """
+    validation = config.raw.get('validation') or {}
+    max_errors = int(validation.get('max_errors', DEFAULT_MAX_ERRORS))
+    return ValidationPlan(build_idea_rules(config), max_errors=max_errors)
+
+
+class _ColumnScan:
+    """Lazily computed, shared views of one column used by every rule on it."""
+
+    def __init__(self, series: pd.Series) -> None:
+        self.series = series
+        self._factorized = None
+        self._numeric = None
+
+    @property
+    def factorized(self) -> Tuple[np.ndarray, list]:
+        """Codes and first-seen unique values (NaN kept as a value)."""
+        if self._factorized is None:
+            codes, uniques = pd.factorize(self.series, use_na_sentinel=False)
+            self._factorized = (codes, list(uniques))
+        return self._factorized
+
+    @property
+    def numeric(self):
+        """float64 values for numeric columns, else the series itself."""
+        if self._numeric is None:
+            dtype = self.series.dtype
+            if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                self._numeric = self.series.to_numpy(dtype='float64', na_value=np.nan)
+            else:
+                self._numeric = self.series
+        return self._numeric
+
+    def null_count(self) -> int:
+        return int(self.null_mask().sum())
+
+    def null_mask(self) -> np.ndarray:
+        """Mask of the missing values."""
+        return self.value_mask(lambda value: pd.isna(value))
+
+    def value_mask(self, predicate) -> np.ndarray:
+        """Mask of the rows whose value satisfies predicate, evaluated once per distinct value."""
+        codes, uniques = self.factorized
+        matching = [i for i, value in enumerate(uniques) if predicate(value)]
+        if not matching:
+            return np.zeros(len(codes), dtype=bool)
+        return np.isin(codes, matching)
+
+    def duplicated(self) -> np.ndarray:
+        """Mask of every occurrence after the first of each value."""
+        codes, uniques = self.factorized
+        positions = np.arange(len(codes))
+        first = np.full(len(uniques), len(codes))
+        np.minimum.at(first, codes, positions)
+        return first[codes] != positions
+
+
+class ValidationPlan:
+    """Compiled, reusable evaluation of a declarative rule set."""
+
+    def __init__(self, rules: Iterable[Rule], max_errors: int = DEFAULT_MAX_ERRORS) -> None:
+        self.rules = tuple(rules)
+        self.max_errors = max_errors
+
+    def run(
+        self,
+        df: pd.DataFrame,
+        ra_weights: Optional[pd.DataFrame] = None,
+        row_local_only: bool = False,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+    ) -> PlanOutcome:
+        """
+        Evaluate the plan against a DataFrame.
+
+        Args:
+            df: DataFrame with IDEAs
+            ra_weights: Optional RA weights for the reference rule (skipped if None)
+            row_local_only: Skip rules that need the whole file
+            fail_fast: Stop after the first error class that produced errors
+            max_errors: Per-rule cap on individually reported rows (defaults to the plan's)
+
+        Returns:
+            PlanOutcome with errors, warnings and per-rule timings
+        """
+        outcome = PlanOutcome([], [], {})
+        if max_errors is None:
+            max_errors = self.max_errors
+        scans: Dict[str, _ColumnScan] = {}
+        current_class = None
+
+        for rule in self.rules:
+            if row_local_only and not rule.row_local:
+                continue
+            if rule.check == 'reference' and ra_weights is None:
+                continue
+            if fail_fast and outcome.errors and rule.error_class != current_class:
+                break
+            current_class = rule.error_class
+
+            start = perf_counter()
+            if rule.check == 'required':
+                missing = [col for col in rule.params['columns'] if col not in df.columns]
+                for col in missing:
+                    outcome.add_error(f"Missing required column: {col}")
+            elif rule.column not in df.columns:
+                if 'missing_warning' in rule.params:
+                    outcome.warnings.append(rule.params['missing_warning'])
+            else:
+                if rule.column not in scans:
+                    scans[rule.column] = _ColumnScan(df[rule.column])
+                self._evaluate(rule, df, scans[rule.column], ra_weights, outcome, max_errors)
+            outcome.timings[rule.name] = perf_counter() - start
+
+            # Nothing else can be evaluated without the required columns
+            if rule.check == 'required' and outcome.errors:
+                break
+
+        return outcome
+
+    def _evaluate(
+        self,
+        rule: Rule,
+        df: pd.DataFrame,
+        scan: _ColumnScan,
+        ra_weights: Optional[pd.DataFrame],
+        outcome: PlanOutcome,
+        max_errors: int,
+    ) -> None:
+        """Evaluate one column rule against its shared column scan."""
+        if rule.check == 'not_null':
+            nulls = scan.null_mask()
+            if nulls.any():
+                outcome.add_error(
+                    f"Column '{rule.column}' has {int(nulls.sum())} null value(s)",
+                    self._row_labels(df, nulls, max_errors),
+                )
+
+        elif rule.check == 'unique':
+            duplicated = scan.duplicated()
+            if duplicated.any():
+                duplicates = scan.series[duplicated].head(5).tolist()
+                outcome.add_error(
+                    f"Duplicate IDs found: {', '.join(str(d) for d in duplicates)}",
+                    self._row_labels(df, duplicated, max_errors),
+                )
+
+        elif rule.check == 'allowed':
+            listed = rule.params['listed']
+            if not listed and rule.params.get('skip_if_empty'):
+                return
+            _, uniques = scan.factorized
+            invalid = [value for value in uniques if value not in rule.params['allowed']]
+            if invalid:
+                invalid_text = ', '.join(str(v) for v in invalid)
+                rows = self._row_labels(df, scan.value_mask(lambda value: value in invalid), max_errors)
+                for i, message in enumerate(rule.params['messages']):
+                    # Follow-up messages (e.g. the valid values) are not about rows
+                    outcome.add_error(message.format(invalid=invalid_text, listed=', '.join(listed)), rows if i == 0 else ())
+
+        elif rule.check == 'range':
+            values = scan.numeric
+            invalid = values < rule.params['low']
+            if rule.params['high'] is not None:
+                invalid = invalid | (values > rule.params['high'])
+            self._report_invalid_rows(df, np.asarray(invalid, dtype=bool), rule, outcome, max_errors)
+
+        elif rule.check == 'sequential':
+            outcome.warnings.extend(priority_sequencing_warnings(df))
+
+        elif rule.check == 'reference':
+            _, uniques = scan.factorized
+            known = pd.Index(uniques).isin(ra_weights['RequestingArea'].unique())
+            missing = [value for value, ok in zip(uniques, known) if not ok]
+            if missing:
+                outcome.add_error(
+                    f"Requesting Areas not found in weights: {', '.join(str(v) for v in missing)}",
+                    self._row_labels(df, scan.value_mask(lambda value: value in missing), max_errors),
+                )
+
+    @staticmethod
+    def _row_labels(df: pd.DataFrame, mask: np.ndarray, max_errors: int) -> List:
+        """Index labels of the first max_errors rows flagged in a mask."""
+        return df.index[np.flatnonzero(mask)[:max_errors]].tolist()
+
+    @staticmethod
+    def _report_invalid_rows(
+        df: pd.DataFrame,
+        invalid: np.ndarray,
+        rule: Rule,
+        outcome: PlanOutcome,
+        max_errors: int,
+    ) -> None:
+        """
+        Append range errors for the rows flagged in a boolean mask.
+
+        Up to ``max_errors`` offending rows are reported one per message;
+        beyond that a single message carries the count and the first
+        ``max_errors`` IDs.
+        """
+        count = int(invalid.sum())
+        if count == 0:
+            return
+
+        col, detail = rule.column, rule.params['detail']
+        flagged = df.loc[invalid, ['ID', col]].head(max_errors)
+        if count <= max_errors:
+            for label, idea_id, value in zip(flagged.index.tolist(), flagged['ID'].tolist(), flagged[col].tolist()):
+                outcome.add_error(f"IDEA {idea_id}: {col}={value} {detail}", [label])
+        else:
+            first_ids = ', '.join(str(v) for v in flagged['ID'].tolist())
+            outcome.add_error(
+                f"{count} IDEAs have {col} {detail} (first {max_errors}: {first_ids})",
+                flagged.index.tolist(),
+            )
+
+
+def priority_sequencing_warnings(
+    df: pd.DataFrame,
+    requesting_areas: Optional[Iterable] = None,
+) -> List[str]:
+    """
+    Check that PriorityRA is sequential (1..N) within each Requesting Area.
+
+    Rows with PriorityRA = 999 are ignored.
+
+    Args:
+        df: DataFrame with IDEAs
+        requesting_areas: Optional subset of Requesting Areas to check.
+            If None, every Requesting Area in df is checked.
+
+    Returns:
+        List of warning messages (one per non-sequential Requesting Area)
+    """
+    warnings = []
+
+    if requesting_areas is not None:
+        df = df[df['RequestingArea'].isin(list(requesting_areas))]
+
+    # Validate PriorityRA sequencing within each RA
+    # SARAIVA - IGNORAR PRIO 999, POIS É USADO PARA IDEAS QUE NÃO DEVEM SER CONSIDERADAS NA PRIORITIZAÇÃO (EX: IDEAS DE BAIXA PRIORIDADE OU IDEAS QUE FORAM REJEITADAS)
+    # Rows without a Requesting Area belong to no sequence
+    ranked = df.loc[(df['PriorityRA'] != 999) & df['RequestingArea'].notna(), ['RequestingArea', 'PriorityRA']]
+    ranked = ranked.sort_values(['RequestingArea', 'PriorityRA'], kind='mergesort')
+
+    # Sequential means the k-th smallest PriorityRA of each RA equals k
+    by_ra = ranked.groupby('RequestingArea', sort=False, observed=True)
+    expected = by_ra.cumcount() + 1
+    broken = set(ranked.loc[ranked['PriorityRA'] != expected, 'RequestingArea'])
+
+    if broken:
+        priorities_by_ra = by_ra['PriorityRA'].agg(list)
+        for ra in df['RequestingArea'].unique():
+            if ra not in broken:
+                continue
+            priorities = priorities_by_ra[ra]
+            warnings.append(
+                f"RequestingArea '{ra}': PriorityRA not sequential. "
+                f"Expected 1-{len(priorities)}, got {priorities}"
+            )
+
+    return warnings
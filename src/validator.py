@@ -4,19 +4,34 @@ Data validation module for TOM Demand Management System.
 This module provides comprehensive validation for IDEAS, RA weights, BG/RS weights, and RS weights.
 """
 
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple, Optional
+from dataclasses import dataclass, field
 import pandas as pd
-import yaml
-import os
+try:
+    from .config_registry import CompiledConfig, get_config
+    from .validation_plan import (
+        DEFAULT_MAX_ERRORS, IDEA_REQUIRED_COLUMNS, compile_idea_plan, priority_sequencing_warnings,
+    )
+except ImportError:
+    from config_registry import CompiledConfig, get_config
+    from validation_plan import (
+        DEFAULT_MAX_ERRORS, IDEA_REQUIRED_COLUMNS, compile_idea_plan, priority_sequencing_warnings,
+    )
 
 
 @dataclass
 class ValidationResult:
-    """Result of a validation operation."""
+    """
+    Result of a validation operation.
+
+    error_rows, when set, runs parallel to errors with the index labels of
+    the rows each error is about (empty for file-level errors).
+    """
     is_valid: bool
     errors: List[str]
     warnings: List[str]
+    rule_timings: Dict[str, float] = field(default_factory=dict)
+    error_rows: List[List] = field(default_factory=list)
 
     def __str__(self) -> str:
         if self.is_valid:
@@ -31,156 +46,96 @@ class ValidationResult:
 class Validator:
     """Centralized data validation for TOM Demand System."""
 
-    def __init__(self, config_path: Optional[str] = None):
+    IDEA_REQUIRED_COLUMNS = IDEA_REQUIRED_COLUMNS
+    RA_WEIGHTS_REQUIRED_COLUMNS = ['RevenueStream', 'BudgetGroup', 'RequestingArea', 'Weight']
+    BG_RS_WEIGHTS_REQUIRED_COLUMNS = ['RevenueStream', 'BudgetGroup', 'Weight']
+    RS_WEIGHTS_REQUIRED_COLUMNS = ['RevenueStream', 'Weight']
+
+    def __init__(self, config_path: Optional[str] = None, config: Optional[CompiledConfig] = None):
         """
         Initialize validator with configuration.
 
         Args:
             config_path: Path to config.yaml file. If None, uses default config.
+            config: Compiled configuration to use instead of looking up config_path
         """
-        if config_path is None:
-            # Use default config path
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            config_path = os.path.join(base_dir, 'config', 'config.yaml')
-
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.compiled_config = config or get_config(config_path)
+        self.config = self.compiled_config.raw
 
-        self.revenue_streams = self.config['revenue_streams']
-        self.budget_groups = self.config['budget_groups']
+        self.revenue_streams = self.compiled_config.revenue_streams
+        self.budget_groups = self.compiled_config.budget_groups
+        self.valid_micro_phases = self.compiled_config.valid_micro_phases
         self.validation_config = self.config['validation']
+        self.max_errors = int(self.validation_config.get('max_errors', DEFAULT_MAX_ERRORS))
 
-    def validate_ideas(self, df: pd.DataFrame, ra_weights: Optional[pd.DataFrame] = None) -> ValidationResult:
+        # Declarative IDEAS rules, compiled once per configuration
+        self.idea_plan = compile_idea_plan(self.compiled_config)
+
+    def validate_ideas(
+        self,
+        df: pd.DataFrame,
+        ra_weights: Optional[pd.DataFrame] = None,
+        fail_fast: bool = False,
+    ) -> ValidationResult:
         """
         Validate IDEAS dataframe.
 
         Args:
             df: DataFrame with IDEAs
             ra_weights: Optional DataFrame with RA weights for referential integrity
+            fail_fast: Stop after the first class of rules that reports errors
 
         Returns:
-            ValidationResult with validation status and messages
+            ValidationResult with validation status, messages and per-rule timings
         """
-        errors = []
-        warnings = []
-
-        # Check required columns
-        required_cols = ['ID', 'Name', 'RequestingArea', 'RevenueStream', 'BudgetGroup', 'PriorityRA']
-        optional_cols = ['Value', 'Urgency', 'Risk', 'Size']
-
-        for col in required_cols:
-            if col not in df.columns:
-                errors.append(f"Missing required column: {col}")
-
-        if errors:
-            return ValidationResult(False, errors, warnings)
-
-        # Check for empty values in required columns
-        for col in required_cols:
-            if df[col].isna().any():
-                null_count = df[col].isna().sum()
-                errors.append(f"Column '{col}' has {null_count} null value(s)")
-
-        # Check ID uniqueness
-        if df['ID'].duplicated().any():
-            duplicates = df[df['ID'].duplicated()]['ID'].tolist()
-            errors.append(f"Duplicate IDs found: {', '.join(str(d) for d in duplicates[:5])}")
-
-        # Validate RevenueStream values
-        invalid_rs = df[~df['RevenueStream'].isin(self.revenue_streams)]
-        if not invalid_rs.empty:
-            invalid_values = invalid_rs['RevenueStream'].unique().tolist()
-            errors.append(f"Invalid Revenue Stream values: {', '.join(str(v) for v in invalid_values)}")
-            errors.append(f"Valid values are: {', '.join(self.revenue_streams)}")
+        outcome = self.idea_plan.run(
+            df, ra_weights=ra_weights, fail_fast=fail_fast, max_errors=self.max_errors
+        )
+        return ValidationResult(
+            len(outcome.errors) == 0, outcome.errors, outcome.warnings, outcome.timings, outcome.error_rows
+        )
+
+    def validate_idea_rows(self, df: pd.DataFrame, fail_fast: bool = False) -> ValidationResult:
+        """
+        Validate the row-local IDEAS rules only.
 
-        # Validate BudgetGroup values
-        invalid_bg = df[~df['BudgetGroup'].isin(self.budget_groups)]
-        if not invalid_bg.empty:
-            invalid_values = invalid_bg['BudgetGroup'].unique().tolist()
-            errors.append(f"Invalid Budget Group values: {', '.join(str(v) for v in invalid_values)}")
-            errors.append(f"Valid values are: {', '.join(self.budget_groups)}")
+        Rules that need the whole file (ID uniqueness, PriorityRA sequencing,
+        referential integrity) are skipped, so this can run on any slice of
+        the IDEAS file, e.g. one chunk of a streamed load.
 
-        # Validate PriorityRA sequencing within each RA
-        # SARAIVA - IGNORAR PRIO 999, POIS É USADO PARA IDEAS QUE NÃO DEVEM SER CONSIDERADAS NA PRIORITIZAÇÃO (EX: IDEAS DE BAIXA PRIORIDADE OU IDEAS QUE FORAM REJEITADAS)
-        for ra in df['RequestingArea'].unique():
-            ra_data = df[df['RequestingArea'] == ra]
+        Args:
+            df: DataFrame with IDEAs (or a chunk of them)
+            fail_fast: Stop after the first class of rules that reports errors
 
-            # Filter out rows with PriorityRA = 999
-            ra_data = ra_data[ra_data['PriorityRA'] != 999].sort_values('PriorityRA')
-            
-            priorities = ra_data['PriorityRA'].tolist()
-            expected = list(range(1, len(priorities) + 1))
+        Returns:
+            ValidationResult with validation status, messages and per-rule timings
+        """
+        outcome = self.idea_plan.run(
+            df, row_local_only=True, fail_fast=fail_fast, max_errors=self.max_errors
+        )
+        return ValidationResult(
+            len(outcome.errors) == 0, outcome.errors, outcome.warnings, outcome.timings, outcome.error_rows
+        )
+
+    def check_priority_sequencing(
+        self,
+        df: pd.DataFrame,
+        requesting_areas: Optional[Iterable] = None,
+    ) -> List[str]:
+        """
+        Check that PriorityRA is sequential (1..N) within each Requesting Area.
 
-            if priorities != expected:
-                #errors.append(                    
-                warnings.append(
-                    f"RequestingArea '{ra}': PriorityRA not sequential. "
-                    f"Expected 1-{len(priorities)}, got {priorities}"
-                )
+        Rows with PriorityRA = 999 are ignored.
 
-        # Validate optional columns if present
-        if 'Value' in df.columns:
-            value_range = self.validation_config['value_range']
-            invalid_value = df[(df['Value'] < value_range[0]) | (df['Value'] > value_range[1])]
-            if not invalid_value.empty:
-                for idx, row in invalid_value.iterrows():
-                    errors.append(
-                        f"IDEA {row['ID']}: Value={row['Value']} outside range {value_range}"
-                    )
-
-        if 'Urgency' in df.columns:
-            urgency_range = self.validation_config['urgency_range']
-            invalid_urgency = df[(df['Urgency'] < urgency_range[0]) | (df['Urgency'] > urgency_range[1])]
-            if not invalid_urgency.empty:
-                for idx, row in invalid_urgency.iterrows():
-                    errors.append(
-                        f"IDEA {row['ID']}: Urgency={row['Urgency']} outside range {urgency_range}"
-                    )
-
-        if 'Risk' in df.columns:
-            risk_range = self.validation_config['risk_range']
-            invalid_risk = df[(df['Risk'] < risk_range[0]) | (df['Risk'] > risk_range[1])]
-            if not invalid_risk.empty:
-                for idx, row in invalid_risk.iterrows():
-                    errors.append(
-                        f"IDEA {row['ID']}: Risk={row['Risk']} outside range {risk_range}"
-                    )
-
-        if 'Size' in df.columns:
-            size_min = self.validation_config['size_min']
-            invalid_size = df[df['Size'] < size_min]
-            if not invalid_size.empty:
-                for idx, row in invalid_size.iterrows():
-                    errors.append(
-                        f"IDEA {row['ID']}: Size={row['Size']} must be >= {size_min}"
-                    )
-
-        # Validate MicroPhase field
-        if 'MicroPhase' not in df.columns:
-            warnings.append("MicroPhase column missing - will use default 'Backlog'")
-        else:
-            valid_phases = self.validation_config.get('valid_micro_phases', [])
-            if valid_phases:
-                invalid_phases_mask = ~df['MicroPhase'].isin(valid_phases)
-                if invalid_phases_mask.any():
-                    invalid_phase_values = df[invalid_phases_mask]['MicroPhase'].unique().tolist()
-                    errors.append(
-                        f"Invalid MicroPhase values found: {', '.join(str(v) for v in invalid_phase_values)}. "
-                        f"Valid phases: {', '.join(valid_phases)}"
-                    )
-
-        # Check referential integrity with RA weights if provided
-        if ra_weights is not None:
-            valid_ras = ra_weights['RequestingArea'].unique()
-            invalid_ras = df[~df['RequestingArea'].isin(valid_ras)]
-            if not invalid_ras.empty:
-                missing_ras = invalid_ras['RequestingArea'].unique().tolist()
-                errors.append(
-                    f"Requesting Areas not found in weights: {', '.join(str(v) for v in missing_ras)}"
-                )
+        Args:
+            df: DataFrame with IDEAs
+            requesting_areas: Optional subset of Requesting Areas to check.
+                If None, every Requesting Area in df is checked.
 
-        is_valid = len(errors) == 0
-        return ValidationResult(is_valid, errors, warnings)
+        Returns:
+            List of warning messages (one per non-sequential Requesting Area)
+        """
+        return priority_sequencing_warnings(df, requesting_areas)
 
     def validate_ra_weights(self, df: pd.DataFrame) -> ValidationResult:
         """
@@ -196,7 +151,7 @@ class Validator:
         warnings = []
 
         # Check required columns
-        required_cols = ['RevenueStream', 'BudgetGroup', 'RequestingArea', 'Weight']
+        required_cols = self.RA_WEIGHTS_REQUIRED_COLUMNS
         for col in required_cols:
             if col not in df.columns:
                 errors.append(f"Missing required column: {col}")
@@ -220,13 +175,13 @@ class Validator:
             errors.append(f"Found {len(invalid)} weight(s) <= 0")
 
         # Validate RevenueStream values
-        invalid_rs = df[~df['RevenueStream'].isin(self.revenue_streams)]
+        invalid_rs = df[~df['RevenueStream'].isin(self.compiled_config.revenue_stream_set)]
         if not invalid_rs.empty:
             invalid_values = invalid_rs['RevenueStream'].unique().tolist()
             errors.append(f"Invalid Revenue Stream values: {', '.join(str(v) for v in invalid_values)}")
 
         # Validate BudgetGroup values
-        invalid_bg = df[~df['BudgetGroup'].isin(self.budget_groups)]
+        invalid_bg = df[~df['BudgetGroup'].isin(self.compiled_config.budget_group_set)]
         if not invalid_bg.empty:
             invalid_values = invalid_bg['BudgetGroup'].unique().tolist()
             errors.append(f"Invalid Budget Group values: {', '.join(str(v) for v in invalid_values)}")
@@ -256,7 +211,7 @@ class Validator:
         warnings = []
 
         # Check required columns
-        required_cols = ['RevenueStream', 'BudgetGroup', 'Weight']
+        required_cols = self.BG_RS_WEIGHTS_REQUIRED_COLUMNS
         for col in required_cols:
             if col not in df.columns:
                 errors.append(f"Missing required column: {col}")
@@ -280,13 +235,13 @@ class Validator:
             errors.append(f"Found {len(invalid)} weight(s) <= 0")
 
         # Validate RevenueStream values
-        invalid_rs = df[~df['RevenueStream'].isin(self.revenue_streams)]
+        invalid_rs = df[~df['RevenueStream'].isin(self.compiled_config.revenue_stream_set)]
         if not invalid_rs.empty:
             invalid_values = invalid_rs['RevenueStream'].unique().tolist()
             errors.append(f"Invalid Revenue Stream values: {', '.join(str(v) for v in invalid_values)}")
 
         # Validate BudgetGroup values
-        invalid_bg = df[~df['BudgetGroup'].isin(self.budget_groups)]
+        invalid_bg = df[~df['BudgetGroup'].isin(self.compiled_config.budget_group_set)]
         if not invalid_bg.empty:
             invalid_values = invalid_bg['BudgetGroup'].unique().tolist()
             errors.append(f"Invalid Budget Group values: {', '.join(str(v) for v in invalid_values)}")
@@ -316,7 +271,7 @@ class Validator:
         warnings = []
 
         # Check required columns
-        required_cols = ['RevenueStream', 'Weight']
+        required_cols = self.RS_WEIGHTS_REQUIRED_COLUMNS
         for col in required_cols:
             if col not in df.columns:
                 errors.append(f"Missing required column: {col}")
@@ -339,7 +294,7 @@ class Validator:
             errors.append(f"Found {len(invalid)} weight(s) <= 0")
 
         # Validate RevenueStream values
-        invalid_rs = df[~df['RevenueStream'].isin(self.revenue_streams)]
+        invalid_rs = df[~df['RevenueStream'].isin(self.compiled_config.revenue_stream_set)]
         if not invalid_rs.empty:
             invalid_values = invalid_rs['RevenueStream'].unique().tolist()
             errors.append(f"Invalid Revenue Stream values: {', '.join(str(v) for v in invalid_values)}")
@@ -394,16 +349,13 @@ class Validator:
         df = df.copy()
 
         if group_by:
-            for group_values in df[group_by].drop_duplicates().values:
-                # Create mask for this group
-                mask = pd.Series([True] * len(df))
-                for col, val in zip(group_by, group_values):
-                    mask &= (df[col] == val)
-
-                # Normalize weights in this group
-                total = df.loc[mask, 'Weight'].sum()
-                if total > 0:
-                    df.loc[mask, 'Weight'] = (df.loc[mask, 'Weight'] / total) * 100
+            # Group totals aligned to each row (NaN for rows with a missing group key)
+            totals = df.groupby(group_by, sort=False, observed=True)['Weight'].transform('sum')
+
+            # Groups summing to zero (or less) cannot be rescaled and are left unchanged
+            scalable = totals > 0
+            if scalable.any():
+                df['Weight'] = df['Weight'].where(~scalable, (df['Weight'] / totals) * 100)
         else:
             # Normalize all weights
             total = df['Weight'].sum()
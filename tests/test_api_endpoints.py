@@ -4,11 +4,20 @@ import time
 from pathlib import Path
 from typing import Optional
 
+import pytest
 from fastapi.testclient import TestClient
 
 from src.api.main import app
 
 
+@pytest.fixture(autouse=True)
+def audit_log(tmp_path: Path, monkeypatch):
+    # Keep audit records of test requests out of data/output
+    path = tmp_path / "api_audit.jsonl"
+    monkeypatch.setenv("AUDIT_LOG_PATH", str(path))
+    return path
+
+
 def _headers(role: str = "executor", api_key: Optional[str] = None):
     headers = {"X-Role": role}
     if api_key:
@@ -49,6 +58,37 @@ def test_workflow_validate_and_prioritize():
     assert "sainte-lague" in body["methods_executed"] or "mixed" in body["methods_executed"]
 
 
+def test_workflows_reuse_pooled_service(monkeypatch):
+    import importlib
+
+    pool_module = importlib.import_module("src.services.service_pool")
+    from src.services.demand_service import DemandService
+
+    built = []
+
+    class CountingService(DemandService):
+        def __init__(self, config=None):
+            built.append(config)
+            super().__init__(config)
+
+    monkeypatch.setattr(pool_module, "DemandService", CountingService)
+    pool_module.service_pool.clear()
+    client = TestClient(app)
+    payload = {
+        "ideas_path": "data/input/ideas_test.csv",
+        "ra_weights_path": "data/input/weights_ra.csv",
+        "rs_weights_path": "data/input/weights_rs.csv",
+        "bg_rs_weights_path": "data/input/weights_bg_rs.csv",
+    }
+
+    for _ in range(3):
+        resp = client.post("/api/v1/workflows/validate", json=payload, headers=_headers(role="viewer"))
+        assert resp.status_code == 200
+
+    assert built == [None]
+    pool_module.service_pool.clear()
+
+
 def test_reference_data_upsert_and_list(tmp_path: Path):
     ideas_copy = tmp_path / "ideas.csv"
     shutil.copy("data/input/ideas_test.csv", ideas_copy)
@@ -92,10 +132,93 @@ def test_reference_data_upsert_and_list(tmp_path: Path):
     assert os.path.exists(uploaded["path"])
 
 
-def test_jobs_and_auth_enforcement(monkeypatch):
+def test_reference_data_mutations_validate_touched_groups(tmp_path: Path):
+    weights_copy = tmp_path / "weights_ra.csv"
+    shutil.copy("data/input/weights_ra.csv", weights_copy)
+
+    client = TestClient(app)
+
+    update_resp = client.post(
+        "/api/v1/reference-data/upsert",
+        json={"path": str(weights_copy), "key_column": "RequestingArea", "row": {"RequestingArea": "COO", "Weight": 30}},
+        headers=_headers(role="editor"),
+    )
+    assert update_resp.status_code == 200
+    assert update_resp.json()["errors"] == []
+    assert update_resp.json()["warnings"] == [
+        "Revenue Stream 'eCommerce' / Budget Group 'Operations': weights sum to 90.00, not 100.0"
+    ]
+
+    restore_resp = client.post(
+        "/api/v1/reference-data/upsert",
+        json={"path": str(weights_copy), "key_column": "RequestingArea", "row": {"RequestingArea": "COO", "Weight": 40}},
+        headers=_headers(role="editor"),
+    )
+    assert restore_resp.json()["warnings"] == []
+
+    rejected_resp = client.post(
+        "/api/v1/reference-data/upsert",
+        json={
+            "path": str(weights_copy),
+            "key_column": "RequestingArea",
+            "row": {"RequestingArea": "NEW", "RevenueStream": "Unknown", "BudgetGroup": "Operations", "Weight": 5},
+            "strict": True,
+        },
+        headers=_headers(role="editor"),
+    )
+    assert rejected_resp.status_code == 400
+    assert "NEW" not in weights_copy.read_text(encoding="utf-8-sig")
+
+    delete_resp = client.post(
+        "/api/v1/reference-data/delete",
+        json={"path": str(weights_copy), "key_column": "RequestingArea", "key_value": "COO"},
+        headers=_headers(role="editor"),
+    )
+    assert delete_resp.status_code == 200
+    assert delete_resp.json()["deleted"] == 1
+    assert delete_resp.json()["warnings"] == [
+        "Revenue Stream 'eCommerce' / Budget Group 'Operations': weights sum to 60.00, not 100.0"
+    ]
+
+
+def test_reference_data_upsert_checks_priority_sequence(tmp_path: Path):
+    ideas_copy = tmp_path / "ideas.csv"
+    ideas_copy.write_text(
+        "ID;Name;RequestingArea;RevenueStream;BudgetGroup;PriorityRA;Microphase\n"
+        "A1;Idea 1;RA1;eCommerce;Operations;1;Backlog\n"
+        "A2;Idea 2;RA1;eCommerce;Operations;2;Backlog\n",
+        encoding="utf-8-sig",
+    )
+
+    client = TestClient(app)
+    row = {
+        "ID": "A3", "Name": "Idea 3", "RequestingArea": "RA1", "RevenueStream": "eCommerce",
+        "BudgetGroup": "Operations", "PriorityRA": 4, "Microphase": "Backlog",
+    }
+
+    gap_resp = client.post(
+        "/api/v1/reference-data/upsert",
+        json={"path": str(ideas_copy), "key_column": "ID", "row": row},
+        headers=_headers(role="editor"),
+    )
+    assert gap_resp.json()["action"] == "created"
+    assert gap_resp.json()["warnings"] == [
+        "RequestingArea 'RA1': PriorityRA not sequential. Expected 1-3, got [1, 2, 4]"
+    ]
+
+    fixed_resp = client.post(
+        "/api/v1/reference-data/upsert",
+        json={"path": str(ideas_copy), "key_column": "ID", "row": {**row, "PriorityRA": 3}},
+        headers=_headers(role="editor"),
+    )
+    assert fixed_resp.json()["action"] == "updated"
+    assert fixed_resp.json()["errors"] == []
+    assert fixed_resp.json()["warnings"] == []
+
+
+def test_jobs_and_auth_enforcement(monkeypatch, audit_log: Path):
     monkeypatch.setenv("AUTH_ENABLED", "true")
     monkeypatch.setenv("API_KEY", "secret")
-    monkeypatch.setenv("AUDIT_LOG_PATH", "/tmp/tom_demand_audit_test.jsonl")
 
     client = TestClient(app)
 
@@ -135,4 +258,45 @@ def test_jobs_and_auth_enforcement(monkeypatch):
         time.sleep(0.05)
 
     assert status == "completed"
-    assert os.path.exists("/tmp/tom_demand_audit_test.jsonl")
+    assert audit_log.exists()
+
+
+def test_workflow_quick_check_tiers(tmp_path: Path):
+    client = TestClient(app)
+    payload = {
+        "ideas_path": "data/input/ideas_test.csv",
+        "ra_weights_path": "data/input/weights_ra.csv",
+    }
+
+    for tier in (0, 1):
+        resp = client.post(
+            "/api/v1/workflows/quick-check",
+            json={**payload, "tier": tier},
+            headers=_headers(role="viewer"),
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["tier"] == tier
+        assert body["is_valid"] is True
+        assert set(body["files"]) == {"ideas", "ra_weights"}
+
+    bad_header = tmp_path / "ideas.csv"
+    bad_header.write_text("ID;Name;RequestingArea\nI1;Idea;RA1\n", encoding="utf-8-sig")
+    resp = client.post(
+        "/api/v1/workflows/quick-check",
+        json={"ideas_path": str(bad_header), "tier": 0},
+        headers=_headers(role="viewer"),
+    )
+    assert resp.status_code == 200
+    assert resp.json()["files"]["ideas"]["errors"] == [
+        "Missing required column: RevenueStream",
+        "Missing required column: BudgetGroup",
+        "Missing required column: PriorityRA",
+    ]
+
+    resp = client.post(
+        "/api/v1/workflows/quick-check",
+        json={**payload, "tier": 2},
+        headers=_headers(role="viewer"),
+    )
+    assert resp.status_code == 400
@@ -0,0 +1,86 @@
+"""
+Tests for the process-wide configuration registry.
+"""
+
+import os
+import shutil
+
+import pytest
+
+from src.config_registry import DEFAULT_CONFIG_PATH, ConfigRegistry
+from src.loader import Loader
+
+
+@pytest.fixture()
+def config_copy(tmp_path):
+    path = tmp_path / "config.yaml"
+    shutil.copyfile(DEFAULT_CONFIG_PATH, path)
+    return path
+
+
+class TestConfigRegistry:
+    def test_parses_each_path_once(self, config_copy):
+        registry = ConfigRegistry()
+
+        assert registry.get(str(config_copy)) is registry.get(str(config_copy))
+
+    def test_reparses_after_file_changes(self, config_copy):
+        registry = ConfigRegistry()
+        first = registry.get(str(config_copy))
+
+        config_copy.write_text(
+            config_copy.read_text().replace("- Commercial", "- Commercial\n  - Marketing", 1)
+        )
+        stat = os.stat(config_copy)
+        os.utime(config_copy, ns=(stat.st_atime_ns, first.mtime_ns + 1_000_000))
+
+        second = registry.get(str(config_copy))
+        assert second is not first
+        assert "Marketing" in second.budget_group_set
+
+    def test_compiled_config_is_read_only(self, config_copy):
+        compiled = ConfigRegistry().get(str(config_copy))
+
+        with pytest.raises(TypeError):
+            compiled.raw["defaults"]["micro_phase"] = "Other"
+        assert isinstance(compiled.revenue_streams, tuple)
+
+    def test_queue_index_matches_first_listed_queue(self, config_copy):
+        compiled = ConfigRegistry().get(str(config_copy))
+
+        assert compiled.queue_for_phase("In Development") == "NOW"
+        assert compiled.queue_for_phase("Backlog") == "LATER"
+        assert compiled.queue_for_phase("Not A Phase") == "UNKNOWN"
+
+    def test_components_share_the_compiled_config(self):
+        loader = Loader()
+
+        assert loader.validator.compiled_config is loader.compiled_config
+
+
+class TestServicePool:
+    def test_reuses_one_service_per_config(self, config_copy):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.services import ServicePool
+
+        pool = ServicePool()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            services = list(executor.map(lambda _: pool.get(str(config_copy)), range(16)))
+
+        assert all(service is services[0] for service in services)
+        assert pool.get() is not services[0]
+
+    def test_rebuilds_service_after_config_changes(self, config_copy):
+        from src.services import ServicePool
+
+        pool = ServicePool()
+        first = pool.get(str(config_copy))
+
+        config_copy.write_text(config_copy.read_text() + "\n# edited\n")
+        stat = os.stat(config_copy)
+        os.utime(config_copy, ns=(stat.st_atime_ns, first.compiled_config.mtime_ns + 1_000_000))
+
+        second = pool.get(str(config_copy))
+        assert second is not first
+        assert second.compiled_config is not first.compiled_config
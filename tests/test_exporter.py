@@ -0,0 +1,601 @@
+"""
+Tests for the Exporter class — export_all and atomic file writes.
+"""
+
+import gzip
+import io
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from src import compression
+from src.columnar import columnar_path, columnar_suffix, find_columnar, read_columnar, write_columnar
+from src.compression import resolve_codec
+from src.exporter import Exporter
+from src.output_manifest import MANIFEST_NAME, NEW_FILE_MODE, OutputManifest
+
+
+@pytest.fixture()
+def exporter():
+    return Exporter()
+
+
+def _results(methods=("sainte-lague", "dhondt", "wsjf")):
+    results = {}
+    for offset, method in enumerate(methods):
+        level2 = pd.DataFrame({
+            "Queue": ["NOW", "NEXT", "LATER"],
+            "RevenueStream": ["eCommerce", "eCommerce", "Mail"],
+            "Method": [method] * 3,
+            "Rank_RS": [1, 2, 1],
+            "ID": ["I1", "I2", "I3"],
+            "Name": ["Idea 1", "Idea 2", "Idea 3"],
+            "WSJF_Score": [1.23456 + offset, 0.5, 2.0 / 3],
+        })
+        level3 = level2.assign(GlobalRank=[1.0, 2.0, 3.0 + offset]).drop(columns="Rank_RS")
+        results[method] = {"level2": level2, "level3": level3}
+    return results
+
+
+def _outputs(directory):
+    return sorted(name for name in os.listdir(directory) if name != MANIFEST_NAME)
+
+
+def _read_all(directory):
+    return {name: (directory / name).read_bytes() for name in _outputs(directory)}
+
+
+class TestExportAll:
+    def test_writes_every_file_in_reporting_order(self, exporter, tmp_path, capsys):
+        exporter.export_all(_results(), str(tmp_path))
+
+        printed = [line.split("Exported to ")[1] for line in capsys.readouterr().out.splitlines() if "Exported to" in line]
+        assert [os.path.basename(p) for p in printed] == [
+            "prioritization_rs_sainte_lague.csv", "demand_sainte_lague.csv",
+            "prioritization_rs_dhondt.csv", "demand_dhondt.csv",
+            "prioritization_rs_wsjf.csv", "demand_wsjf.csv",
+            "demand.csv",
+        ]
+        assert not [name for name in os.listdir(tmp_path) if name.startswith(".tmp_")]
+
+    def test_parallel_and_serial_output_are_identical(self, exporter, tmp_path):
+        serial_dir, parallel_dir = tmp_path / "serial", tmp_path / "parallel"
+
+        exporter.export_workers = 1
+        exporter.export_all(_results(), str(serial_dir))
+        exporter.export_workers = 8
+        exporter.export_all(_results(), str(parallel_dir))
+
+        assert _read_all(serial_dir) == _read_all(parallel_dir)
+
+    def test_reuses_the_combined_frame_it_is_given(self, exporter, tmp_path, monkeypatch):
+        results = _results()
+        combined = pd.concat([r["level3"] for r in results.values()], ignore_index=True)
+        exporter.export_all(results, str(tmp_path / "built"))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("combined frame rebuilt")
+
+        monkeypatch.setattr(pd, "concat", fail)
+        exporter.export_all(results, str(tmp_path / "given"), combined=combined)
+
+        assert _read_all(tmp_path / "built") == _read_all(tmp_path / "given")
+
+    def test_files_match_single_file_exports(self, exporter, tmp_path):
+        results = _results(methods=("wsjf",))
+        exporter.export_all(results, str(tmp_path / "all"))
+        exporter.export_demand(results["wsjf"]["level3"], str(tmp_path / "single" / "demand_wsjf.csv"))
+
+        assert (tmp_path / "all" / "demand_wsjf.csv").read_bytes() == (tmp_path / "single" / "demand_wsjf.csv").read_bytes()
+
+
+class TestUnchangedOutputs:
+    def test_second_export_keeps_unchanged_files(self, exporter, tmp_path, capsys):
+        exporter.export_all(_results(), str(tmp_path), execution_params={"method": "all"})
+        mtimes = {name: os.stat(tmp_path / name).st_mtime_ns for name in _outputs(tmp_path) if name != "metadata.json"}
+        capsys.readouterr()
+
+        exporter.export_all(_results(), str(tmp_path), execution_params={"method": "all"})
+
+        assert {name: os.stat(tmp_path / name).st_mtime_ns for name in mtimes} == mtimes
+        assert "Exported to" not in capsys.readouterr().out
+        metadata = json.loads((tmp_path / "metadata.json").read_text(encoding="utf-8"))
+        assert metadata["artifacts"] == {"updated": [], "unchanged": sorted(mtimes)}
+
+    def test_artifacts_list_every_file_of_the_run(self, tmp_path):
+        from src.services.demand_service import DemandService
+
+        service = DemandService()
+        service.prioritize(
+            ideas="data/input/ideas_test.csv", ra_weights="data/input/weights_ra.csv",
+            rs_weights="data/input/weights_rs.csv", bg_rs_weights="data/input/weights_bg_rs.csv",
+            output_dir=str(tmp_path), method="wsjf", include_discarded=True,
+        )
+
+        metadata = json.loads((tmp_path / "metadata.json").read_text(encoding="utf-8"))
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8"))
+        assert "discarded_ideas.csv" in metadata["artifacts"]["updated"]
+        assert sorted(metadata["artifacts"]["updated"]) == sorted(manifest["files"])
+
+    def test_concurrent_manifests_merge_on_save(self, tmp_path):
+        first, second = OutputManifest(str(tmp_path)), OutputManifest(str(tmp_path))
+        for manifest, name in ((first, "demand.csv"), (second, "discarded_ideas.csv")):
+            (tmp_path / name).write_text(name, encoding="utf-8")
+            manifest.record(str(tmp_path / name), name, updated=True)
+
+        first.save()
+        second.save()
+
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8"))
+        assert sorted(manifest["files"]) == ["demand.csv", "discarded_ideas.csv"]
+        assert (tmp_path / MANIFEST_NAME).stat().st_mode & 0o777 == NEW_FILE_MODE
+
+    def test_changed_result_is_rewritten(self, exporter, tmp_path):
+        exporter.export_all(_results(methods=("wsjf",)), str(tmp_path))
+        results = _results(methods=("wsjf",))
+        results["wsjf"]["level3"].loc[0, "WSJF_Score"] = 9.5
+
+        exporter.export_all(results, str(tmp_path))
+
+        assert "9,5" in (tmp_path / "demand_wsjf.csv").read_text(encoding="utf-8-sig")
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8"))
+        assert manifest["files"]["demand_wsjf.csv"]["size"] == os.path.getsize(tmp_path / "demand_wsjf.csv")
+
+    def test_externally_edited_file_is_rewritten(self, exporter, tmp_path):
+        exporter.export_all(_results(methods=("wsjf",)), str(tmp_path))
+        expected = (tmp_path / "demand.csv").read_bytes()
+        (tmp_path / "demand.csv").write_text("edited", encoding="utf-8")
+
+        exporter.export_all(_results(methods=("wsjf",)), str(tmp_path))
+
+        assert (tmp_path / "demand.csv").read_bytes() == expected
+
+    def test_disabled_rewrites_every_file(self, exporter, tmp_path):
+        exporter.skip_unchanged = False
+        exporter.export_all(_results(methods=("wsjf",)), str(tmp_path))
+
+        assert MANIFEST_NAME not in os.listdir(tmp_path)
+
+
+# ---------------------------------------------------------------------------
+# Wide demand layout
+# ---------------------------------------------------------------------------
+
+class TestWideDemandLayout:
+    def test_one_row_per_idea_with_a_rank_per_method(self, exporter, tmp_path):
+        exporter.export_all(_results(), str(tmp_path), layout="wide")
+
+        demand = pd.read_csv(tmp_path / "demand.csv", sep=";", decimal=",", encoding="utf-8-sig", dtype={"ID": str})
+        assert demand.columns.tolist() == [
+            "Queue", "ID", "Name", "RevenueStream", "WSJF_Score",
+            "GlobalRank_sainte_lague", "GlobalRank_dhondt", "GlobalRank_wsjf",
+        ]
+        assert demand["ID"].tolist() == ["I1", "I2", "I3"]
+        assert demand.loc[2, ["GlobalRank_sainte_lague", "GlobalRank_dhondt", "GlobalRank_wsjf"]].tolist() == [3, 4, 5]
+        assert demand.loc[0, "WSJF_Score"] == 1.235
+
+    def test_single_method_keeps_long_layout(self, exporter, tmp_path):
+        exporter.export_all(_results(methods=("wsjf",)), str(tmp_path / "wide"), layout="wide")
+        exporter.export_all(_results(methods=("wsjf",)), str(tmp_path / "long"), layout="long")
+
+        assert (tmp_path / "wide" / "demand.csv").read_bytes() == (tmp_path / "long" / "demand.csv").read_bytes()
+
+    def test_unknown_layout_is_rejected(self, exporter, tmp_path):
+        with pytest.raises(ValueError, match="Unknown demand layout"):
+            exporter.export_all(_results(), str(tmp_path), layout="tall")
+
+    def test_delta_reads_wide_previous_run(self, tmp_path):
+        from src.services.demand_service import DemandService
+
+        service = DemandService()
+        inputs = dict(
+            ideas="data/input/ideas_test.csv", ra_weights="data/input/weights_ra.csv",
+            rs_weights="data/input/weights_rs.csv", bg_rs_weights="data/input/weights_bg_rs.csv",
+        )
+        service.prioritize(**inputs, output_dir=str(tmp_path), all_methods=True, demand_layout="wide")
+
+        run = service.prioritize(**inputs, output_dir=str(tmp_path), all_methods=True, delta=True)
+
+        assert run["delta"] == {"new": 0, "removed": 0, "moved": 0}
+
+
+# ---------------------------------------------------------------------------
+# Delta against the previous run
+# ---------------------------------------------------------------------------
+
+class TestDelta:
+    def test_classifies_new_removed_and_moved(self, exporter):
+        previous = pd.DataFrame({
+            "Queue": ["NOW", "NOW", "NEXT", "NEXT"],
+            "Method": ["WSJF"] * 4,
+            "GlobalRank": [1.0, 2.0, 3.0, 4.0],
+            "ID": [1, 2, 3, 4],
+            "Name": ["A", "B", "C", "D"],
+        })
+        current = pd.DataFrame({
+            "Queue": ["NOW", "NOW", "NOW", "NEXT"],
+            "Method": ["WSJF"] * 4,
+            "GlobalRank": [1.0, 2.0, 3.0, 4.0],
+            "ID": ["1", "3", "5", "4"],
+            "Name": ["A", "C", "E", "D"],
+        })
+
+        delta = exporter.delta_frame(previous, current)
+
+        assert delta[["Change", "ID"]].values.tolist() == [["moved", "3"], ["new", "5"], ["removed", "2"]]
+        moved = delta.iloc[0]
+        assert (moved["Queue_Old"], moved["Queue_New"], moved["GlobalRank_Old"], moved["GlobalRank_New"], moved["RankShift"]) == ("NEXT", "NOW", 3, 2, 1)
+        assert pd.isna(delta.iloc[1]["GlobalRank_Old"]) and pd.isna(delta.iloc[2]["Queue_New"])
+
+    def test_same_id_under_another_method_is_separate(self, exporter):
+        previous = pd.DataFrame({"Queue": ["NOW"], "Method": ["DHondt"], "GlobalRank": [1.0], "ID": ["1"], "Name": ["A"]})
+        current = previous.assign(Method="WSJF")
+
+        delta = exporter.delta_frame(previous, current)
+
+        assert sorted(delta["Change"]) == ["new", "removed"]
+
+    def test_prioritize_writes_delta_against_previous_run(self, tmp_path):
+        from src.services.demand_service import DemandService
+
+        service = DemandService()
+        inputs = dict(
+            ideas="data/input/ideas_test.csv", ra_weights="data/input/weights_ra.csv",
+            rs_weights="data/input/weights_rs.csv", bg_rs_weights="data/input/weights_bg_rs.csv",
+        )
+        first = service.prioritize(**inputs, output_dir=str(tmp_path), method="wsjf", delta=True)
+        assert first["delta"] is None and not (tmp_path / "demand_delta.csv").exists()
+
+        second = service.prioritize(**inputs, output_dir=str(tmp_path), method="dhondt", delta=True)
+
+        delta = pd.read_csv(tmp_path / "demand_delta.csv", sep=";", decimal=",", encoding="utf-8-sig")
+        assert second["delta"] == {"new": first["generated_rows"], "removed": first["generated_rows"], "moved": 0}
+        assert len(delta) == 2 * first["generated_rows"]
+        metadata = json.loads((tmp_path / "metadata.json").read_text(encoding="utf-8"))
+        assert metadata["statistics"]["delta"] == second["delta"]
+        assert "demand_delta.csv" in metadata["artifacts"]["updated"]
+
+
+class TestAtomicWrites:
+    def test_failed_write_keeps_previous_file(self, exporter, tmp_path):
+        target = tmp_path / "demand.csv"
+        target.write_text("previous", encoding="utf-8")
+
+        def fail(f):
+            f.write("partial")
+            raise RuntimeError("disk full")
+
+        with pytest.raises(RuntimeError):
+            exporter._write_atomic(str(target), fail, mode="w")
+
+        assert target.read_text(encoding="utf-8") == "previous"
+        assert os.listdir(tmp_path) == ["demand.csv"]
+
+    def test_replaced_files_get_the_umask_mode(self, exporter, tmp_path):
+        umask = os.umask(0)
+        os.umask(umask)
+        target = tmp_path / "demand.csv"
+        target.write_text("previous", encoding="utf-8")
+        target.chmod(0o600)
+
+        exporter._write_atomic(str(target), lambda f: f.write("new"), mode="w")
+        exporter._write_atomic(str(tmp_path / "new.csv"), lambda f: f.write("new"), mode="w")
+
+        assert target.stat().st_mode & 0o777 == 0o666 & ~umask
+        assert (tmp_path / "new.csv").stat().st_mode & 0o777 == 0o666 & ~umask
+
+    def test_csv_uses_european_format_with_bom(self, exporter, tmp_path):
+        target = tmp_path / "out.csv"
+
+        exporter._write_csv_atomic(pd.DataFrame({"ID": ["I1"], "WSJF_Score": [1.5]}), str(target))
+
+        assert target.read_bytes() == "\ufeffID;WSJF_Score\nI1;1,5\n".encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# write_european_csv
+# ---------------------------------------------------------------------------
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), "golden")
+
+
+def _golden_frame():
+    return pd.DataFrame({
+        "Queue": pd.Series(["NOW", "NEXT", None, "LATER", "NOW", "PRODUCTION"], dtype="str"),
+        "Method": ["wsjf", "wsjf", "dhondt", "dhondt", "sainte-lague", "sainte-lague"],
+        "GlobalRank": [1.0, 2.0, 3.0, float("nan"), 5.0, 6.0],
+        "ID": ["147905", "147829", "I-3", "I-4", "I-5", "I-6"],
+        "Name": ["BCTT - novo espaço Atrium II", 'Quote "this"', "Semi; colon", "Multi\nline", "", None],
+        "PriorityRA": [2, 7, 999, 1, 3, 4],
+        "WSJF_Score": [0.1 + 0.2, 12.3456, -0.0, 1e-06, 1e16, float("nan")],
+        "Value": [5.0, 10.0, float("nan"), 1.0, 2.0, 3.0],
+        "Flag": [True, False, True, False, True, False],
+    })
+
+
+class TestEuropeanCsvWriter:
+    def test_matches_golden_file(self, exporter, tmp_path):
+        target = tmp_path / "demand.csv"
+
+        exporter._write_csv_atomic(_golden_frame(), str(target))
+
+        with open(os.path.join(GOLDEN_DIR, "european_format.csv"), "rb") as f:
+            assert target.read_bytes() == f.read()
+
+    def test_matches_pandas_to_csv(self, exporter):
+        df = _golden_frame()
+        buffer = io.StringIO()
+
+        exporter.write_european_csv(df, buffer)
+
+        assert buffer.getvalue() == df.to_csv(index=False, sep=";", decimal=",")
+
+    def test_writes_in_blocks(self, exporter):
+        exporter.CSV_BLOCK_ROWS = 4
+        df = pd.concat([_golden_frame()] * 3, ignore_index=True)
+        buffer = io.StringIO()
+
+        exporter.write_european_csv(df, buffer)
+
+        assert buffer.getvalue() == df.to_csv(index=False, sep=";", decimal=",")
+
+    def test_prioritizer_results_take_the_vectorized_path(self, exporter, monkeypatch):
+        from src.loader import Loader
+        from src.prioritizer import Prioritizer
+
+        frames = Loader().load_all(
+            "data/input/ideas_test.csv",
+            "data/input/weights_ra.csv",
+            "data/input/weights_rs.csv",
+            "data/input/weights_bg_rs.csv",
+        )
+        result = Prioritizer().prioritize_with_queues(*frames, default_method="wsjf")
+        outputs = [exporter._demand_frame(result), exporter._rs_prioritization_frame(result)]
+        assert isinstance(outputs[0]["RevenueStream"].dtype, pd.CategoricalDtype)
+        assert str(outputs[0]["GlobalRank"].dtype) == "Int32"
+        expected = [df.to_csv(index=False, sep=";", decimal=",") for df in outputs]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("fell back to DataFrame.to_csv")
+
+        monkeypatch.setattr(pd.DataFrame, "to_csv", fail)
+        for df, text in zip(outputs, expected):
+            buffer = io.StringIO()
+            exporter.write_european_csv(df, buffer)
+            assert buffer.getvalue() == text
+
+    def test_categorical_and_nullable_columns_match_pandas(self, exporter):
+        df = pd.DataFrame({
+            "Queue": pd.Categorical(["NOW", None, "NEXT", "NOW"], categories=["NOW", "NEXT", "LATER"]),
+            "Label": pd.Categorical(["a;b", "x", None, 'q"'], categories=["x", "a;b", 'q"']),
+            "Size": pd.Categorical([3, 1, None, 3]),
+            "GlobalRank": pd.array([1, None, 3, 4], dtype="Int32"),
+            "Big": pd.array([None, 2**40, -1, 0], dtype="Int64"),
+        })
+        buffer = io.StringIO()
+
+        exporter.write_european_csv(df, buffer)
+
+        assert buffer.getvalue() == df.to_csv(index=False, sep=";", decimal=",")
+
+    def test_unsupported_columns_fall_back_to_pandas(self, exporter):
+        df = pd.DataFrame({
+            "Mixed": ["a", 1.5],
+            "When": pd.to_datetime(["2026-01-01", "2026-02-01"]),
+            "Score": pd.Categorical([1.5, 2.0]),
+        })
+        buffer = io.StringIO()
+
+        exporter.write_european_csv(df, buffer)
+
+        assert buffer.getvalue() == df.to_csv(index=False, sep=";", decimal=",")
+
+
+class TestBaselineFormat:
+    def test_exported_rows_match_baseline_format(self, tmp_path):
+        from src.services.demand_service import DemandService
+
+        DemandService().prioritize(
+            "data/input/ideas_test.csv",
+            "data/input/weights_ra.csv",
+            "data/input/weights_rs.csv",
+            "data/input/weights_bg_rs.csv",
+            output_dir=str(tmp_path),
+            method="wsjf",
+            include_discarded=True,
+        )
+
+        # Compact in-memory dtypes must not change the files: scores stay decimals (3,0)
+        for name in ("demand_wsjf", "prioritization_rs_wsjf", "discarded_ideas"):
+            with open(os.path.join(GOLDEN_DIR, f"baseline_{name}_head.csv"), "rb") as f:
+                expected = f.read().splitlines()
+            assert (tmp_path / f"{name}.csv").read_bytes().splitlines()[:len(expected)] == expected
+
+
+# ---------------------------------------------------------------------------
+# Streaming export
+# ---------------------------------------------------------------------------
+
+class TestStreamingExport:
+    def test_chunks_match_whole_frame(self, exporter):
+        exporter.CSV_BLOCK_ROWS = 4
+        df = pd.concat([_golden_frame()] * 3, ignore_index=True)
+        chunks = [df.iloc[:5], df.iloc[5:5], df.iloc[5:13], df.iloc[13:]]
+        whole, streamed = io.StringIO(), io.StringIO()
+
+        exporter.write_european_csv(df, whole)
+        rows = exporter.write_european_csv_chunks(chunks, streamed)
+
+        assert rows == len(df)
+        assert streamed.getvalue() == whole.getvalue()
+
+    def test_streamed_export_all_matches_sorted_export(self, exporter, tmp_path):
+        exporter.export_all(_results(), str(tmp_path / "sorted"))
+        exporter.streaming = True
+        exporter.CSV_BLOCK_ROWS = 2
+        exporter.export_all(_results(), str(tmp_path / "streamed"))
+
+        assert _read_all(tmp_path / "streamed") == _read_all(tmp_path / "sorted")
+
+    def test_streamed_level2_is_sorted_without_a_full_copy(self, exporter, tmp_path, monkeypatch):
+        results = _results()
+        for method_results in results.values():
+            method_results["level2"] = method_results["level2"].iloc[::-1]
+        exporter.export_all(results, str(tmp_path / "sorted"))
+        exporter.streaming = True
+        exporter.CSV_BLOCK_ROWS = 2
+        monkeypatch.setattr(exporter, "_rs_prioritization_frame", None)
+
+        exporter.export_all(results, str(tmp_path / "streamed"))
+
+        assert _read_all(tmp_path / "streamed") == _read_all(tmp_path / "sorted")
+
+    def test_blocks_are_written_in_the_given_order(self, exporter, tmp_path):
+        level3 = _results(methods=("wsjf",))["wsjf"]["level3"]
+        target = tmp_path / "demand_wsjf.csv"
+
+        exporter.export_demand_stream([level3.iloc[2:], level3.iloc[:2]], str(target))
+
+        written = pd.read_csv(target, sep=";", decimal=",", encoding="utf-8-sig")
+        assert written["ID"].tolist() == ["I3", "I1", "I2"]
+        assert written["WSJF_Score"].tolist() == [0.667, 1.235, 0.5]
+
+
+# ---------------------------------------------------------------------------
+# Columnar output
+# ---------------------------------------------------------------------------
+
+class TestColumnarOutput:
+    def test_export_all_writes_columnar_artifacts(self, exporter, tmp_path):
+        exporter.export_all(_results(methods=("wsjf",)), str(tmp_path), formats=["csv", "columnar"])
+
+        suffix = columnar_suffix()
+        assert _outputs(tmp_path) == sorted([
+            "demand.csv", f"demand{suffix}",
+            "demand_wsjf.csv", f"demand_wsjf{suffix}",
+            "prioritization_rs_wsjf.csv", f"prioritization_rs_wsjf{suffix}",
+        ])
+
+    def test_round_trip_keeps_values_and_types(self, exporter, tmp_path):
+        df = _golden_frame().assign(GlobalRank=pd.array([1, 2, None, 4, 5, 6], dtype="Int64"))
+        path = str(tmp_path / f"demand{columnar_suffix()}")
+
+        write_columnar(df, exporter._write_atomic, path)
+        result = read_columnar(path)
+
+        pd.testing.assert_frame_equal(result, df, check_dtype=False)
+        assert str(result["GlobalRank"].dtype) == "Int64"
+        assert result["PriorityRA"].dtype == df["PriorityRA"].dtype
+
+    def test_unknown_format_is_rejected(self, exporter, tmp_path):
+        with pytest.raises(ValueError, match="Unknown output format"):
+            exporter.export_all(_results(), str(tmp_path), formats=["xlsx"])
+
+    def test_stale_artifact_is_ignored(self, exporter, tmp_path):
+        csv_path = tmp_path / "prioritization_rs_wsjf.csv"
+        exporter.export_all(_results(methods=("wsjf",)), str(tmp_path), formats=["csv", "columnar"])
+
+        assert find_columnar(str(csv_path)) == columnar_path(str(csv_path))
+
+        later = os.path.getmtime(csv_path) + 10
+        os.utime(csv_path, (later, later))
+        assert find_columnar(str(csv_path)) is None
+
+    def test_prioritize_global_reads_columnar_artifact(self, tmp_path):
+        from src.services.demand_service import DemandService
+
+        service = DemandService()
+        level2 = tmp_path / "prioritization_rs_wsjf.csv"
+        service.prioritize_rs("data/input/ideas_test.csv", "data/input/weights_ra.csv", str(level2), method="wsjf")
+        from_csv = service.prioritize_global(str(level2), "data/input/weights_rs.csv", str(tmp_path / "from_csv.csv"), method="wsjf")
+
+        write_columnar(
+            service._read_result(str(level2)), service.exporter._write_atomic, columnar_path(str(level2))
+        )
+        level2.write_text("not a csv", encoding="utf-8")
+        os.utime(level2, (0, 0))
+        from_columnar = service.prioritize_global(str(level2), "data/input/weights_rs.csv", str(tmp_path / "from_columnar.csv"), method="wsjf")
+
+        assert from_columnar["count"] == from_csv["count"]
+        assert (tmp_path / "from_csv.csv").read_bytes() == (tmp_path / "from_columnar.csv").read_bytes()
+
+    def test_prioritize_rs_writes_typed_artifact_on_request(self, tmp_path):
+        from src.services.demand_service import DemandService
+
+        service = DemandService()
+        level2 = tmp_path / "prioritization_rs_wsjf.csv"
+        service.prioritize_rs(
+            "data/input/ideas_test.csv",
+            "data/input/weights_ra.csv",
+            str(level2),
+            method="wsjf",
+            output_formats=["csv", "columnar"],
+        )
+
+        assert level2.exists()
+        artifact = find_columnar(str(level2))
+        assert artifact == columnar_path(str(level2))
+        df = service._read_result(str(level2))
+        # IDs are text in the artifact; re-parsing the CSV would turn them into integers
+        assert df["ID"].dtype == "str"
+        assert df["Rank_RS"].dtype == "int64"
+
+
+# ---------------------------------------------------------------------------
+# Compressed output
+# ---------------------------------------------------------------------------
+
+class TestCompressedOutput:
+    def test_gzip_output_decompresses_to_plain_csv(self, exporter, tmp_path):
+        exporter.export_all(_results(methods=("wsjf",)), str(tmp_path / "plain"))
+        exporter.compression = ("gzip", 6)
+        exporter.export_all(_results(methods=("wsjf",)), str(tmp_path / "gz"))
+
+        assert _outputs(tmp_path / "gz") == [
+            "demand.csv.gz", "demand_wsjf.csv.gz", "prioritization_rs_wsjf.csv.gz",
+        ]
+        for name in _outputs(tmp_path / "plain"):
+            with gzip.open(tmp_path / "gz" / f"{name}.gz", "rb") as f:
+                assert f.read() == (tmp_path / "plain" / name).read_bytes()
+
+    def test_gzip_output_is_deterministic(self, exporter, tmp_path):
+        exporter.compression = ("gzip", 9)
+        first = exporter._write_csv_atomic(_golden_frame(), str(tmp_path / "a.csv"))
+        second = exporter._write_csv_atomic(_golden_frame(), str(tmp_path / "b.csv"))
+
+        assert first.endswith("a.csv.gz")
+        assert open(first, "rb").read() == open(second, "rb").read()
+
+    def test_compressed_csv_is_paired_with_its_columnar_artifact(self, exporter, tmp_path):
+        from src.services.demand_service import DemandService
+
+        exporter.compression = ("gzip", 6)
+        exporter.export_all(_results(methods=("wsjf",)), str(tmp_path), formats=["csv", "columnar"])
+        gz_path = tmp_path / "prioritization_rs_wsjf.csv.gz"
+        artifact = str(tmp_path / f"prioritization_rs_wsjf{columnar_suffix()}")
+
+        assert gz_path.exists() and not (tmp_path / "prioritization_rs_wsjf.csv").exists()
+        assert columnar_path(str(gz_path)) == artifact
+        assert find_columnar(str(gz_path)) == artifact
+        assert find_columnar(str(tmp_path / "prioritization_rs_wsjf.csv")) == artifact
+        assert DemandService()._read_result(str(gz_path))["ID"].dtype == "str"
+
+        later = os.path.getmtime(gz_path) + 10
+        os.utime(gz_path, (later, later))
+        assert find_columnar(str(gz_path)) is None
+        assert find_columnar(str(tmp_path / "prioritization_rs_wsjf.csv")) is None
+
+    def test_invalid_settings_are_rejected(self):
+        with pytest.raises(ValueError, match="Unknown compression"):
+            resolve_codec("lzma")
+        with pytest.raises(ValueError, match="between 0 and 9"):
+            resolve_codec("gzip", 12)
+        assert resolve_codec("none") is None
+        assert resolve_codec("gzip") == ("gzip", 6)
+
+    @pytest.mark.skipif(compression.zstandard is not None, reason="zstandard is installed")
+    def test_zstd_requires_zstandard(self):
+        with pytest.raises(ValueError, match="zstandard"):
+            resolve_codec("zstd")
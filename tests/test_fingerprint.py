@@ -0,0 +1,54 @@
+"""
+Tests for input fingerprinting.
+"""
+
+import hashlib
+import os
+
+from src import fingerprint
+from src.fingerprint import combined_key, fingerprint_file
+
+
+class TestFingerprintFile:
+    def test_digest_is_blake2b_of_contents(self, tmp_path):
+        path = tmp_path / "ideas.csv"
+        path.write_bytes(b"ID;Name\n" * 200_000)
+
+        result = fingerprint_file(str(path))
+
+        expected = hashlib.blake2b(path.read_bytes(), digest_size=fingerprint.DIGEST_SIZE).hexdigest()
+        assert result.digest == expected
+        assert result.size == path.stat().st_size
+
+    def test_unchanged_file_is_not_rehashed(self, tmp_path, monkeypatch):
+        path = tmp_path / "ideas.csv"
+        path.write_text("ID;Name\n")
+        first = fingerprint_file(str(path))
+
+        monkeypatch.setattr(fingerprint.hashlib, "blake2b", None)
+
+        assert fingerprint_file(str(path)) is first
+
+    def test_modified_file_is_rehashed(self, tmp_path):
+        path = tmp_path / "ideas.csv"
+        path.write_text("ID;Name\n")
+        first = fingerprint_file(str(path))
+
+        path.write_text("ID;Name\nI1;Idea\n")
+        os.utime(path, ns=(first.mtime_ns, first.mtime_ns + 1_000_000))
+
+        assert fingerprint_file(str(path)).digest != first.digest
+
+
+class TestCombinedKey:
+    def test_depends_on_contents_and_extras(self, tmp_path):
+        a = tmp_path / "a.csv"
+        b = tmp_path / "b.csv"
+        a.write_text("x")
+        b.write_text("y")
+
+        key = combined_key([str(a), str(b)], "wsjf")
+
+        assert key == combined_key([str(a), str(b)], "wsjf")
+        assert key != combined_key([str(b), str(a)], "wsjf")
+        assert key != combined_key([str(a), str(b)], "dhondt")
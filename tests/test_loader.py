@@ -0,0 +1,336 @@
+"""
+Tests for the Loader class — chunked and delta ingestion.
+"""
+
+import gzip
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.loader import DataLoadError, Loader
+from src.validation_cache import validation_cache
+
+
+HEADER = "ID;Name;RequestingArea;RevenueStream;BudgetGroup;PriorityRA;Work Type;Microphase"
+
+
+def _write_ideas(path: Path, rows):
+    path.write_text("\n".join([HEADER, *rows]), encoding="utf-8-sig")
+    return str(path)
+
+
+def _rows(count, ra="RA1"):
+    return [
+        f"I{i};Idea {i};{ra};eCommerce;Commercial;{i};Evolutive;Backlog"
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.fixture()
+def loader():
+    loader = Loader()
+    loader.chunk_size = 3
+    return loader
+
+
+# ---------------------------------------------------------------------------
+# load_ideas — chunked mode
+# ---------------------------------------------------------------------------
+
+class TestLoadIdeasChunked:
+    def test_matches_full_load_on_pipeline_columns(self, loader, tmp_path):
+        path = _write_ideas(tmp_path / "ideas.csv", _rows(10))
+
+        full = loader.load_ideas(path)
+        chunked = loader.load_ideas(path, chunked=True)
+
+        pd.testing.assert_frame_equal(full[chunked.columns], chunked)
+
+    def test_keeps_only_pipeline_columns(self, loader, tmp_path):
+        path = _write_ideas(tmp_path / "ideas.csv", _rows(4))
+
+        df = loader.load_ideas(path, chunked=True)
+
+        assert "Work Type" not in df.columns
+        assert "MicroPhase" in df.columns
+        assert "Queue" in df.columns
+
+    def test_reports_file_wide_row_numbers(self, loader, tmp_path):
+        rows = _rows(7)
+        rows[5] = "I6;Idea 6;RA1;Unknown Stream;Commercial;6;Evolutive;Backlog"
+        path = _write_ideas(tmp_path / "ideas.csv", rows)
+
+        with pytest.raises(DataLoadError, match=r"rows 3-5") as excinfo:
+            loader.load_ideas(path, chunked=True)
+        assert "Invalid Revenue Stream values: Unknown Stream (row(s): [5])" in str(excinfo.value)
+
+    def test_reports_rows_of_empty_required_values(self, loader, tmp_path):
+        rows = _rows(7)
+        rows[4] = "I5;;RA1;eCommerce;Commercial;5;Evolutive;Backlog"
+        rows[5] = "I6;;RA1;eCommerce;Commercial;6;Evolutive;Backlog"
+        path = _write_ideas(tmp_path / "ideas.csv", rows)
+
+        with pytest.raises(DataLoadError, match=r"rows 3-5") as excinfo:
+            loader.load_ideas(path, chunked=True)
+        assert "Column 'Name' has 2 null value(s) (row(s): [4, 5])" in str(excinfo.value)
+
+    def test_reports_decode_errors_in_later_chunks(self, loader, tmp_path):
+        # The bad byte has to sit past the reader's first read buffer
+        loader.chunk_size = 5000
+        path = tmp_path / "ideas.csv"
+        _write_ideas(path, _rows(20000))
+        path.write_bytes(path.read_bytes() + b"\nI8;Idea \xff;RA1;eCommerce;Commercial;8;Evolutive;Backlog")
+
+        with pytest.raises(DataLoadError, match="Failed to read CSV file"):
+            loader.load_ideas(str(path), chunked=True)
+
+    def test_detects_duplicate_ids_across_chunks(self, loader, tmp_path):
+        rows = _rows(5)
+        rows[4] = "I1;Idea 5;RA1;eCommerce;Commercial;5;Evolutive;Backlog"
+        path = _write_ideas(tmp_path / "ideas.csv", rows)
+
+        with pytest.raises(DataLoadError, match=r"Duplicate IDs found: I1 \(row\(s\): \[4\]\)"):
+            loader.load_ideas(path, chunked=True)
+
+    def test_sequencing_is_checked_across_chunks(self, loader, tmp_path, capsys):
+        path = _write_ideas(tmp_path / "ideas.csv", _rows(6))
+
+        loader.load_ideas(path, chunked=True)
+
+        assert "PriorityRA not sequential" not in capsys.readouterr().out
+
+
+# ---------------------------------------------------------------------------
+# load_ideas_delta
+# ---------------------------------------------------------------------------
+
+class TestLoadIdeasDelta:
+    DELTA_HEADER = "Action;ID;Name;RequestingArea;RevenueStream;BudgetGroup;PriorityRA;Microphase"
+
+    def _write_delta(self, path: Path, rows):
+        path.write_text("\n".join([self.DELTA_HEADER, *rows]), encoding="utf-8-sig")
+        return str(path)
+
+    def test_matches_full_load_of_edited_file(self, loader, tmp_path):
+        base_path = _write_ideas(tmp_path / "base.csv", _rows(5))
+        delta_path = self._write_delta(tmp_path / "delta.csv", [
+            "upsert;I2;Idea 2 renamed;RA1;eCommerce;Commercial;2;In Development",
+            "delete;I5;;;;;;",
+            ";I6;Idea 6;RA1;eCommerce;Commercial;5;Backlog",
+        ])
+        edited_rows = _rows(4) + ["I6;Idea 6;RA1;eCommerce;Commercial;5;Evolutive;Backlog"]
+        edited_rows[1] = "I2;Idea 2 renamed;RA1;eCommerce;Commercial;2;Evolutive;In Development"
+        edited_path = _write_ideas(tmp_path / "edited.csv", edited_rows)
+
+        merged = loader.load_ideas_delta(loader.load_ideas(base_path), delta_path)
+        expected = loader.load_ideas(edited_path)
+
+        columns = [c for c in expected.columns if c != "Work Type"]
+        pd.testing.assert_frame_equal(merged[columns], expected[columns])
+        assert merged.loc[1, "Queue"] == "NOW"
+
+    def test_only_touched_requesting_areas_are_sequenced(self, loader, tmp_path, capsys):
+        rows = _rows(3, ra="RA1") + [
+            "J1;Idea J1;RA2;eCommerce;Commercial;1;Evolutive;Backlog",
+            "J2;Idea J2;RA2;eCommerce;Commercial;7;Evolutive;Backlog",
+        ]
+        base = loader.load_ideas(_write_ideas(tmp_path / "base.csv", rows))
+        capsys.readouterr()
+        delta_path = self._write_delta(tmp_path / "delta.csv", [
+            "delete;I3;;;;;;",
+            "upsert;I9;Idea 9;RA1;eCommerce;Commercial;9;Backlog",
+        ])
+
+        loader.load_ideas_delta(base, delta_path)
+
+        out = capsys.readouterr().out
+        assert "RequestingArea 'RA1'" in out
+        assert "RequestingArea 'RA2'" not in out
+
+    def test_rejects_invalid_delta_rows(self, loader, tmp_path):
+        base = loader.load_ideas(_write_ideas(tmp_path / "base.csv", _rows(2)))
+        delta_path = self._write_delta(tmp_path / "delta.csv", [
+            "upsert;I3;Idea 3;RA1;Unknown Stream;Commercial;3;Backlog",
+        ])
+
+        with pytest.raises(DataLoadError, match="Invalid Revenue Stream values: Unknown Stream"):
+            loader.load_ideas_delta(base, delta_path)
+
+    def test_rejects_duplicate_upserts(self, loader, tmp_path):
+        base = loader.load_ideas(_write_ideas(tmp_path / "base.csv", _rows(2)))
+        delta_path = self._write_delta(tmp_path / "delta.csv", [
+            "upsert;I3;Idea 3;RA1;eCommerce;Commercial;3;Backlog",
+            "upsert;I3;Idea 3 again;RA1;eCommerce;Commercial;4;Backlog",
+        ])
+
+        with pytest.raises(DataLoadError, match="Duplicate IDs found: I3"):
+            loader.load_ideas_delta(base, delta_path)
+
+    def test_rejects_unknown_action(self, loader, tmp_path):
+        base = loader.load_ideas(_write_ideas(tmp_path / "base.csv", _rows(2)))
+        delta_path = self._write_delta(tmp_path / "delta.csv", ["rename;I1;;;;;;"])
+
+        with pytest.raises(DataLoadError, match="Invalid Action values"):
+            loader.load_ideas_delta(base, delta_path)
+
+
+# ---------------------------------------------------------------------------
+# Compact dtype schema
+# ---------------------------------------------------------------------------
+
+class TestCompactSchema:
+    def test_load_ideas_applies_compact_dtypes(self, loader, tmp_path):
+        df = loader.load_ideas(_write_ideas(tmp_path / "ideas.csv", _rows(4)))
+
+        for col in ["RevenueStream", "RequestingArea", "BudgetGroup", "MicroPhase", "Queue"]:
+            assert isinstance(df[col].dtype, pd.CategoricalDtype), col
+        assert df["PriorityRA"].dtype == "int8"
+        assert df["Value"].dtype == "int8"
+        assert df["Size"].dtype == "int8"
+
+    def test_chunked_load_keeps_compact_dtypes(self, loader, tmp_path):
+        df = loader.load_ideas(_write_ideas(tmp_path / "ideas.csv", _rows(7)), chunked=True)
+
+        assert isinstance(df["Queue"].dtype, pd.CategoricalDtype)
+        assert df["PriorityRA"].dtype == "int8"
+
+    def test_fractional_scores_stay_float(self, loader, tmp_path):
+        path = tmp_path / "ideas.csv"
+        path.write_text(
+            "ID;Name;RequestingArea;RevenueStream;BudgetGroup;PriorityRA;Size\n"
+            "I1;Idea 1;RA1;eCommerce;Commercial;1;2,5\n",
+            encoding="utf-8-sig",
+        )
+
+        df = loader.load_ideas(str(path))
+
+        assert df["Size"].dtype == "float64"
+        assert df.loc[0, "Size"] == 2.5
+
+
+# ---------------------------------------------------------------------------
+# Weights validation cache
+# ---------------------------------------------------------------------------
+
+class TestWeightsValidationCache:
+    RS_WEIGHTS = "RevenueStream;Weight\neCommerce;60\nMail & Services;40\n"
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        validation_cache.clear()
+        yield
+        validation_cache.clear()
+
+    def _fail_validation(self, monkeypatch, loader):
+        def fail(df):
+            raise AssertionError("validation should have been served from cache")
+        monkeypatch.setattr(loader.validator, "validate_rs_weights", fail)
+
+    def test_unchanged_file_is_validated_once(self, loader, tmp_path, monkeypatch):
+        path = tmp_path / "weights_rs.csv"
+        path.write_text(self.RS_WEIGHTS, encoding="utf-8-sig")
+        first = loader.load_rs_weights(str(path))
+
+        self._fail_validation(monkeypatch, loader)
+        second = loader.load_rs_weights(str(path))
+
+        pd.testing.assert_frame_equal(first, second)
+        assert second is not first
+
+    def test_changed_file_is_revalidated(self, loader, tmp_path):
+        path = tmp_path / "weights_rs.csv"
+        path.write_text(self.RS_WEIGHTS, encoding="utf-8-sig")
+        loader.load_rs_weights(str(path))
+
+        path.write_text("RevenueStream;Weight\neCommerce;60\nUnknown;40\n", encoding="utf-8-sig")
+
+        with pytest.raises(DataLoadError, match="RS weights validation failed"):
+            loader.load_rs_weights(str(path))
+
+    def test_disk_cache_survives_process_cache(self, loader, tmp_path, monkeypatch):
+        path = tmp_path / "weights_rs.csv"
+        path.write_text(self.RS_WEIGHTS, encoding="utf-8-sig")
+        loader.validation_cache_dir = str(tmp_path / "cache")
+        first = loader.load_rs_weights(str(path))
+
+        validation_cache.clear()
+        self._fail_validation(monkeypatch, loader)
+
+        pd.testing.assert_frame_equal(loader.load_rs_weights(str(path)), first)
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_disk_cache_in_a_shared_directory_is_ignored(self, loader, tmp_path):
+        path = tmp_path / "weights_rs.csv"
+        path.write_text(self.RS_WEIGHTS, encoding="utf-8-sig")
+        cache_dir = tmp_path / "cache"
+        loader.validation_cache_dir = str(cache_dir)
+        loader.load_rs_weights(str(path))
+        key = next(name for name in os.listdir(cache_dir))[len("validation-"):-len(".pkl")]
+
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        cache_dir.chmod(0o777)
+        assert validation_cache._read_disk(key, str(cache_dir)) is None
+        cache_dir.chmod(0o700)
+        assert validation_cache._read_disk(key, str(cache_dir)) is not None
+
+
+# ---------------------------------------------------------------------------
+# Quick-check tiers
+# ---------------------------------------------------------------------------
+
+class TestQuickCheck:
+    def test_header_check_applies_aliases(self, loader, tmp_path):
+        path = _write_ideas(tmp_path / "ideas.csv", _rows(2))
+
+        result = loader.check_header(path)
+
+        assert result.is_valid
+        assert result.warnings == []
+
+    def test_row_check_reports_instead_of_raising(self, loader, tmp_path):
+        rows = _rows(3)
+        rows[1] = "I2;Idea 2;RA1;Unknown Stream;Commercial;2;Evolutive;Backlog"
+        path = _write_ideas(tmp_path / "ideas.csv", rows)
+
+        result = loader.check_rows(path)
+
+        assert not result.is_valid
+        assert result.errors[0] == "Invalid Revenue Stream values: Unknown Stream"
+
+    def test_weights_header_check(self, loader, tmp_path):
+        path = tmp_path / "weights_rs.csv"
+        path.write_text("RevenueStream;Share\neCommerce;100\n", encoding="utf-8-sig")
+
+        result = loader.check_header(str(path), kind="rs_weights")
+
+        assert result.errors == ["Missing required column: Weight"]
+
+
+# ---------------------------------------------------------------------------
+# Compressed inputs
+# ---------------------------------------------------------------------------
+
+class TestCompressedInputs:
+    def _gzip(self, source: str, target: Path) -> str:
+        with open(source, "rb") as src, gzip.open(target, "wb") as dst:
+            dst.write(src.read())
+        return str(target)
+
+    @pytest.mark.parametrize("name", ["ideas.csv.gz", "ideas.csv"])
+    def test_gzip_ideas_are_read_whatever_the_name(self, loader, tmp_path, name):
+        plain = _write_ideas(tmp_path / "plain.csv", _rows(5))
+        (tmp_path / "gz").mkdir()
+        compressed = self._gzip(plain, tmp_path / "gz" / name)
+
+        pd.testing.assert_frame_equal(loader.load_ideas(compressed), loader.load_ideas(plain))
+        assert loader.load_ideas(compressed, chunked=True).equals(loader.load_ideas(plain, chunked=True))
+
+    def test_gzip_weights_and_header_check(self, loader, tmp_path):
+        compressed = self._gzip("data/input/weights_ra.csv", tmp_path / "weights_ra.csv.gz")
+
+        pd.testing.assert_frame_equal(
+            loader.load_ra_weights(compressed), loader.load_ra_weights("data/input/weights_ra.csv")
+        )
+        assert loader.check_header(compressed, kind="ra_weights").is_valid
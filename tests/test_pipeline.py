@@ -0,0 +1,97 @@
+"""
+Tests for the stage DAG executor.
+"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from src.pipeline import Pipeline, Stage
+
+
+class TestPipeline:
+    def test_stages_receive_their_inputs_in_order(self):
+        pipeline = Pipeline([
+            Stage("a", lambda: 2),
+            Stage("b", lambda base: base * 10, ("a",)),
+            Stage("c", lambda x, y: (x, y), ("b", "given")),
+        ])
+
+        result = pipeline.run({"given": "v"})
+
+        assert result.outputs["c"] == (20, "v")
+        assert set(result.timings) == {"a", "b", "c"}
+
+    def test_independent_stages_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        pipeline = Pipeline([
+            Stage("left", barrier.wait),
+            Stage("right", barrier.wait),
+            Stage("join", lambda *_: "done", ("left", "right")),
+        ])
+
+        # Each stage blocks until the other has started, so this only
+        # finishes when both run at the same time
+        assert pipeline.run(max_workers=2).outputs["join"] == "done"
+
+    def test_critical_path_follows_the_slowest_chain(self):
+        def pause(seconds):
+            return lambda *_: time.sleep(seconds)
+
+        pipeline = Pipeline([
+            Stage("load", pause(0.01)),
+            Stage("fast", pause(0.0), ("load",)),
+            Stage("slow", pause(0.05), ("load",)),
+            Stage("export", pause(0.01), ("fast", "slow")),
+        ])
+
+        result = pipeline.run(max_workers=2)
+
+        assert result.critical_path == ["load", "slow", "export"]
+        assert result.critical_path_seconds <= result.wall_time
+        assert list(result.report()["stage_seconds"])[0] == "load"
+
+    def test_stage_error_is_raised(self):
+        def fail():
+            raise ValueError("bad input")
+
+        pipeline = Pipeline([Stage("a", fail), Stage("b", lambda _: 1, ("a",))])
+
+        for workers in (1, 2):
+            with pytest.raises(ValueError, match="bad input"):
+                pipeline.run(max_workers=workers)
+
+    def test_invalid_graphs_are_rejected(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            Pipeline([Stage("a", lambda: 1), Stage("a", lambda: 2)])
+        with pytest.raises(ValueError, match="unknown input 'missing'"):
+            Pipeline([Stage("a", lambda _: 1, ("missing",))]).run()
+        with pytest.raises(ValueError, match="cycle"):
+            Pipeline([Stage("a", lambda _: 1, ("b",)), Stage("b", lambda _: 1, ("a",))]).run()
+
+
+class TestParallelPrioritize:
+    INPUTS = {
+        "ideas": "data/input/ideas_test.csv",
+        "ra_weights": "data/input/weights_ra.csv",
+        "rs_weights": "data/input/weights_rs.csv",
+        "bg_rs_weights": "data/input/weights_bg_rs.csv",
+    }
+
+    def test_parallel_run_matches_serial_run(self, tmp_path):
+        from src.services.demand_service import DemandService
+
+        service = DemandService()
+        service.result_cache_enabled = False
+        serial = service.prioritize(**self.INPUTS, output_dir=str(tmp_path / "serial"), all_methods=True, include_discarded=True)
+        service.pipeline_workers = 4
+        parallel = service.prioritize(**self.INPUTS, output_dir=str(tmp_path / "parallel"), all_methods=True, include_discarded=True)
+
+        for name in ("demand.csv", "demand_wsjf.csv", "prioritization_rs_dhondt.csv", "discarded_ideas.csv"):
+            assert (tmp_path / "serial" / name).read_bytes() == (tmp_path / "parallel" / name).read_bytes()
+        assert parallel["generated_rows"] == serial["generated_rows"]
+        assert {"rank:sainte-lague", "rank:dhondt", "rank:wsjf", "export"} <= set(parallel["pipeline"]["stage_seconds"])
+        assert parallel["pipeline"]["critical_path"][0] == "inputs"
+        assert pd.read_csv(tmp_path / "parallel" / "demand.csv", sep=";").shape[0] == parallel["generated_rows"]
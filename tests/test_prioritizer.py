@@ -2,6 +2,9 @@
 Tests for the Prioritizer class — level 2, level 3, budget groups, queues, compare.
 """
 
+import json
+import os
+
 import pandas as pd
 import pytest
 
@@ -261,6 +264,91 @@ class TestDemandServiceDiscardedOutput:
         assert 'discard_reason' in discarded_csv.columns
         assert set(discarded_csv['discard_reason']) == {'priority_ra_999', 'missing_ra_weights'}
 
+        metadata = json.loads((tmp_path / 'metadata.json').read_text())
+        fingerprints = metadata['input_fingerprints']
+        assert set(fingerprints) == {'ideas', 'ra_weights', 'rs_weights', 'bg_rs_weights', 'config'}
+        assert fingerprints['ideas']['size'] == ideas_file.stat().st_size
+
+    def test_discard_reasons_follow_precedence(self):
+        from src.services.demand_service import DemandService
+
+        ideas = pd.DataFrame({
+            "ID": ["1", "2", "3", "4", "5"],
+            "RevenueStream": ["eCommerce", "eCommerce", "Mail", "eCommerce", "eCommerce"],
+            "RequestingArea": ["RA1", "RA1", "RA_MISS", "RA1", "RA_NONE"],
+            "PriorityRA": [1, 999, 2, 3, 999],
+            "Queue": ["NOW", "NOW", "UNKNOWN", "NOW", "UNKNOWN"],
+        })
+        ra_weights = pd.DataFrame({"RevenueStream": ["eCommerce"], "RequestingArea": ["RA1"]})
+        final = pd.DataFrame({"ID": [1]})
+
+        discarded = DemandService._discarded_ideas(ideas, ra_weights, final)
+
+        assert discarded.set_index("ID")["discard_reason"].to_dict() == {
+            "2": "priority_ra_999",
+            "3": "unknown_queue",
+            "4": "other",
+            "5": "priority_ra_999",
+        }
+
+
+class TestDemandServiceFrames:
+    INPUTS = dict(
+        ideas="data/input/ideas_test.csv",
+        ra_weights="data/input/weights_ra.csv",
+        rs_weights="data/input/weights_rs.csv",
+        bg_rs_weights="data/input/weights_bg_rs.csv",
+    )
+
+    def _raw_frames(self):
+        read = dict(sep=";", decimal=",", encoding="utf-8-sig")
+        return {kind: pd.read_csv(path, **read) for kind, path in self.INPUTS.items()}
+
+    def test_frames_match_file_workflow_without_writing(self, tmp_path, monkeypatch):
+        from src.services.demand_service import DemandService
+
+        service = DemandService()
+        frames = self._raw_frames()
+        originals = {kind: df.copy() for kind, df in frames.items()}
+        monkeypatch.chdir(tmp_path)
+
+        run = service.prioritize_frames(**frames, all_methods=True)
+
+        assert os.listdir(tmp_path) == []
+        for kind, df in frames.items():
+            pd.testing.assert_frame_equal(df, originals[kind])
+        monkeypatch.undo()
+        from_files = service.prioritize(**self.INPUTS, output_dir=str(tmp_path / "out"), all_methods=True)
+        assert {k: v for k, v in from_files.items() if k not in ("elapsed_time", "output_directory", "delta", "pipeline")} == run.summary()
+        assert sorted(run.results) == ["dhondt", "sainte-lague", "wsjf"]
+        assert len(run.final) == run.statistics()["generated_rows"]
+
+    def test_export_run_writes_the_file_workflow_outputs(self, tmp_path):
+        from src.services.demand_service import DemandService
+
+        service = DemandService()
+        service.prioritize(**self.INPUTS, output_dir=str(tmp_path / "files"), method="wsjf", include_discarded=True)
+        run = service.prioritize_frames(**self._raw_frames(), method="wsjf")
+
+        service.export_run(run, str(tmp_path / "frames"), include_discarded=True)
+
+        for name in ("demand.csv", "demand_wsjf.csv", "prioritization_rs_wsjf.csv", "discarded_ideas.csv"):
+            assert (tmp_path / "frames" / name).read_bytes() == (tmp_path / "files" / name).read_bytes()
+        metadata = json.loads((tmp_path / "frames" / "metadata.json").read_text())
+        assert "input_files" not in metadata
+        assert metadata["statistics"] == run.statistics()
+
+    def test_invalid_frames_raise_data_load_error(self):
+        from src.loader import DataLoadError
+        from src.services.demand_service import DemandService
+
+        frames = self._raw_frames()
+        frames["ideas"] = frames["ideas"].drop(columns=["Name"])
+
+        with pytest.raises(DataLoadError):
+            DemandService().prioritize_frames(**frames)
+
+
 # ---------------------------------------------------------------------------
 # prioritize_all_methods
 # ---------------------------------------------------------------------------
@@ -387,3 +475,11 @@ class TestPrioritizeWithQueues:
         result = prioritizer.prioritize_with_queues(ideas, ra_w, rs_w, bg_w)
         ranked = result["GlobalRank"].dropna()
         assert ranked.nunique() == len(ranked)
+
+    def test_result_uses_compact_dtypes(self, prioritizer):
+        ideas, ra_w, rs_w, bg_w = self._build_queued_data()
+        result = prioritizer.prioritize_with_queues(ideas, ra_w, rs_w, bg_w)
+        for col in ["RevenueStream", "RequestingArea", "BudgetGroup", "Queue", "Method"]:
+            assert isinstance(result[col].dtype, pd.CategoricalDtype), col
+        assert result["GlobalRank"].dtype == "Int32"
+        assert result["PriorityRA"].dtype == "int8"
@@ -0,0 +1,141 @@
+"""
+Tests for the whole-run result cache.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from src.result_cache import ResultCache, result_cache
+
+
+INPUTS = {
+    "ideas": "data/input/ideas_test.csv",
+    "ra_weights": "data/input/weights_ra.csv",
+    "rs_weights": "data/input/weights_rs.csv",
+    "bg_rs_weights": "data/input/weights_bg_rs.csv",
+}
+
+
+@pytest.fixture
+def service():
+    from src.services.demand_service import DemandService
+
+    result_cache.clear()
+    yield DemandService()
+    result_cache.clear()
+
+
+class TestResultCache:
+    def test_memory_entries_are_least_recently_used(self):
+        cache = ResultCache()
+        cache.put("a", 1, max_entries=2)
+        cache.put("b", 2, max_entries=2)
+        assert cache.get("a") == 1
+
+        cache.put("c", 3, max_entries=2)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    def test_disk_entries_survive_the_process_cache(self, tmp_path):
+        cache = ResultCache()
+        cache.put("key", {"rows": 3}, cache_dir=str(tmp_path))
+        cache.clear()
+
+        assert cache.get("key", str(tmp_path)) == {"rows": 3}
+        assert cache.get("other", str(tmp_path)) is None
+
+    def test_callers_get_their_own_copy(self, tmp_path):
+        cache = ResultCache()
+        run = {"final": pd.DataFrame({"Rank": [1, 2]})}
+        cache.put("key", run, cache_dir=str(tmp_path))
+        run["final"].loc[0, "Rank"] = 99
+
+        first = cache.get("key")
+        first["final"].loc[0, "Rank"] = 42
+        cache.clear()
+        from_disk = cache.get("key", str(tmp_path))
+        from_disk["final"].loc[0, "Rank"] = 42
+
+        assert cache.get("key")["final"]["Rank"].tolist() == [1, 2]
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+    def test_disk_entries_need_a_private_directory(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache = ResultCache()
+        cache.put("key", {"rows": 3}, cache_dir=str(cache_dir))
+        cache.clear()
+
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        cache_dir.chmod(0o777)
+        assert cache.get("key", str(cache_dir)) is None
+        cache_dir.chmod(0o700)
+        (cache_dir / "run-key.pkl").chmod(0o666)
+        assert cache.get("key", str(cache_dir)) is None
+
+    def test_disk_directory_is_size_bounded(self, tmp_path):
+        cache = ResultCache()
+        payload = b"x" * 4000
+        for i, key in enumerate(["old", "used", "new"]):
+            cache.put(key, payload, cache_dir=str(tmp_path))
+            path = tmp_path / f"run-{key}.pkl"
+            os.utime(path, ns=(i * 10**9, i * 10**9))
+        cache.clear()
+        cache.get("used", str(tmp_path))
+
+        cache._evict(str(tmp_path), max_bytes=9000)
+
+        assert sorted(os.listdir(tmp_path)) == ["run-new.pkl", "run-used.pkl"]
+
+
+class TestDemandServiceResultCache:
+    def test_identical_request_reuses_the_cached_run(self, service, tmp_path):
+        first = service.prioritize(**INPUTS, output_dir=str(tmp_path / "first"), all_methods=True)
+        second = service.prioritize(**INPUTS, output_dir=str(tmp_path / "second"), all_methods=True)
+
+        assert "rank:wsjf" in first["pipeline"]["stage_seconds"]
+        assert not any(name.startswith("rank:") for name in second["pipeline"]["stage_seconds"])
+        assert second["generated_rows"] == first["generated_rows"]
+        for name in ("demand.csv", "demand_dhondt.csv", "prioritization_rs_wsjf.csv"):
+            assert (tmp_path / "first" / name).read_bytes() == (tmp_path / "second" / name).read_bytes()
+
+    def test_methods_are_part_of_the_key(self, service, tmp_path):
+        service.prioritize(**INPUTS, output_dir=str(tmp_path / "a"), method="wsjf")
+        mixed = service.prioritize(**INPUTS, output_dir=str(tmp_path / "b"), method="wsjf", now_method="dhondt")
+
+        assert mixed["methods_executed"] == ["mixed"]
+        assert "rank:mixed" in mixed["pipeline"]["stage_seconds"]
+
+    def test_compare_reuses_an_all_methods_run(self, service, tmp_path, monkeypatch):
+        service.prioritize(**INPUTS, output_dir=str(tmp_path / "out"), all_methods=True)
+        monkeypatch.setattr(service.loader, "load_all", None)
+
+        result = service.compare(**INPUTS, output=str(tmp_path / "compare.csv"))
+
+        assert result["count"] > 0
+        assert (tmp_path / "compare.csv").exists()
+
+    def test_cache_hit_replays_the_loader_warnings(self, service, tmp_path, capsys):
+        service.prioritize(**INPUTS, output_dir=str(tmp_path / "a"), method="wsjf")
+        first = capsys.readouterr().out
+        service.prioritize(**INPUTS, output_dir=str(tmp_path / "b"), method="wsjf")
+        second = capsys.readouterr().out
+
+        assert "reusing its results" in second
+        assert "⚠ Warnings during IDEAS loading:" in first
+        warning_lines = [line for line in first.splitlines() if line.startswith(("⚠", "  - "))]
+        assert [line for line in second.splitlines() if line.startswith(("⚠", "  - "))] == warning_lines
+
+    def test_one_shot_cli_skips_the_memory_only_cache(self, tmp_path):
+        from src.cli import _one_shot_service
+
+        assert _one_shot_service(None).result_cache_enabled is False
+
+    def test_cache_can_be_disabled(self, service, tmp_path):
+        service.result_cache_enabled = False
+        service.prioritize(**INPUTS, output_dir=str(tmp_path / "a"), method="wsjf")
+        again = service.prioritize(**INPUTS, output_dir=str(tmp_path / "b"), method="wsjf")
+
+        assert "rank:wsjf" in again["pipeline"]["stage_seconds"]
@@ -0,0 +1,159 @@
+"""
+Tests for the Validator class — IDEAS sequencing and range checks.
+"""
+
+import pandas as pd
+import pytest
+
+from src.validator import Validator
+
+
+def _ideas(priorities, ras=None, values=None):
+    count = len(priorities)
+    df = pd.DataFrame({
+        "ID": [f"I{i}" for i in range(1, count + 1)],
+        "Name": [f"Idea {i}" for i in range(1, count + 1)],
+        "RequestingArea": ras or ["RA1"] * count,
+        "RevenueStream": ["eCommerce"] * count,
+        "BudgetGroup": ["Commercial"] * count,
+        "PriorityRA": priorities,
+        "MicroPhase": ["Backlog"] * count,
+    })
+    if values is not None:
+        df["Value"] = values
+    return df
+
+
+@pytest.fixture()
+def validator():
+    return Validator()
+
+
+# ---------------------------------------------------------------------------
+# check_priority_sequencing
+# ---------------------------------------------------------------------------
+
+class TestPrioritySequencing:
+    def test_sequential_areas_pass(self, validator):
+        df = _ideas([2, 1, 999, 1], ras=["RA1", "RA1", "RA1", "RA2"])
+
+        assert validator.check_priority_sequencing(df) == []
+
+    def test_reports_gaps_in_first_seen_order(self, validator):
+        df = _ideas([1, 3, 1, 2, 5], ras=["RA2", "RA2", "RA1", "RA1", "RA3"])
+
+        assert validator.check_priority_sequencing(df) == [
+            "RequestingArea 'RA2': PriorityRA not sequential. Expected 1-2, got [1, 3]",
+            "RequestingArea 'RA3': PriorityRA not sequential. Expected 1-1, got [5]",
+        ]
+
+    def test_duplicate_priorities_are_not_sequential(self, validator):
+        df = _ideas([1, 1])
+
+        assert len(validator.check_priority_sequencing(df)) == 1
+
+
+# ---------------------------------------------------------------------------
+# Range checks and max_errors
+# ---------------------------------------------------------------------------
+
+class TestRangeChecks:
+    def test_reports_each_violation_below_cap(self, validator):
+        df = _ideas([1, 2, 3], values=[5, 11, 0])
+
+        result = validator.validate_ideas(df)
+
+        assert result.errors == [
+            "IDEA I2: Value=11 outside range [1, 10]",
+            "IDEA I3: Value=0 outside range [1, 10]",
+        ]
+
+    def test_summarizes_violations_above_cap(self, validator):
+        validator.max_errors = 2
+        df = _ideas(list(range(1, 6)), values=[0, 0, 5, 0, 0])
+
+        result = validator.validate_ideas(df)
+
+        assert result.errors == [
+            "4 IDEAs have Value outside range [1, 10] (first 2: I1, I2)",
+        ]
+
+
+# ---------------------------------------------------------------------------
+# normalize_weights
+# ---------------------------------------------------------------------------
+
+class TestNormalizeWeights:
+    def _weights(self):
+        return pd.DataFrame({
+            "RevenueStream": ["eCommerce", "eCommerce", "Mail", "Mail", "Retail"],
+            "BudgetGroup": ["Commercial"] * 5,
+            "Weight": [30.0, 10.0, 0.0, 0.0, 7.0],
+        })
+
+    def test_normalizes_each_group_to_100(self, validator):
+        result = validator.normalize_weights(self._weights(), ["RevenueStream", "BudgetGroup"])
+
+        assert result["Weight"].tolist() == [75.0, 25.0, 0.0, 0.0, 100.0]
+
+    def test_filtered_frame_uses_its_own_index(self, validator):
+        df = self._weights()
+        filtered = df[df["Weight"] != 10.0]
+
+        result = validator.normalize_weights(filtered, ["RevenueStream", "BudgetGroup"])
+
+        assert result.index.tolist() == [0, 2, 3, 4]
+        assert result["Weight"].tolist() == [100.0, 0.0, 0.0, 100.0]
+
+    def test_zero_sum_groups_are_left_unchanged(self, validator):
+        df = self._weights().iloc[2:4]
+
+        result = validator.normalize_weights(df, ["RevenueStream", "BudgetGroup"])
+
+        pd.testing.assert_frame_equal(result, df)
+
+
+# ---------------------------------------------------------------------------
+# Compiled validation plan
+# ---------------------------------------------------------------------------
+
+class TestValidationPlan:
+    def test_plan_is_compiled_once_per_config(self, validator):
+        assert Validator().idea_plan is validator.idea_plan
+
+    def test_reports_per_rule_timings(self, validator):
+        result = validator.validate_ideas(_ideas([1, 2], values=[5, 6]))
+
+        assert result.is_valid
+        assert {"required_columns", "unique:ID", "allowed:RevenueStream", "range:Value"} <= set(result.rule_timings)
+
+    def test_fail_fast_stops_after_first_error_class(self, validator):
+        df = _ideas([1, 2], values=[0, 5])
+        df.loc[1, "RevenueStream"] = "Unknown"
+
+        full = validator.validate_ideas(df)
+        fast = validator.validate_ideas(df, fail_fast=True)
+
+        assert any("Value=0" in e for e in full.errors)
+        assert fast.errors == ["Invalid Revenue Stream values: Unknown", full.errors[1]]
+        assert "range:Value" not in fast.rule_timings
+
+    def test_reference_rule_lists_missing_areas(self, validator):
+        df = _ideas([1, 1], ras=["RA1", "RA9"])
+        ra_weights = pd.DataFrame({"RequestingArea": ["RA1"]})
+
+        result = validator.validate_ideas(df, ra_weights)
+
+        assert result.errors == ["Requesting Areas not found in weights: RA9"]
+
+    def test_errors_carry_the_failing_row_labels(self, validator):
+        validator.max_errors = 1
+        df = _ideas([1, 2, 3], ras=["RA1", "RA9", "RA1"], values=[0, 5, 0])
+        ra_weights = pd.DataFrame({"RequestingArea": ["RA1"]})
+
+        result = validator.validate_ideas(df, ra_weights)
+
+        assert dict(zip(result.errors, result.error_rows)) == {
+            "Requesting Areas not found in weights: RA9": [1],
+            "2 IDEAs have Value outside range [1, 10] (first 1: I1)": [0],
+        }